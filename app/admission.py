@@ -0,0 +1,181 @@
+import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+import anyio
+from fastapi import HTTPException
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.model import ConvertRequest
+
+# Only the "type" of nodes and edges ends with Node or Edge, e.g. "ClassNode"
+NODE_PATTERN = re.compile(r'"type"\s*:\s*"\w*Node"')
+EDGE_PATTERN = re.compile(r'"type"\s*:\s*"\w*Edge"')
+MEMBERS_PATTERN = re.compile(r'"(?:attributes|methods)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+request_bytes = Histogram(
+    "convert_request_bytes",
+    "Histogram of the size of the diagrams of a conversion in bytes",
+    buckets=(1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216),
+)
+request_elements = Histogram(
+    "convert_request_elements",
+    "Histogram of the number of nodes, edges and members of a conversion",
+    ["element"],
+    buckets=(10, 30, 100, 300, 1000, 3000, 10000, 30000),
+)
+admission_decisions = Counter(
+    "admission_decisions_total",
+    "Total number of conversions by how they were admitted",
+    ["decision"],
+)
+large_requests_waiting = Gauge(
+    "admission_large_requests_waiting",
+    "Number of large conversions waiting for their turn",
+)
+
+# Set while a large conversion is admitted to the slow lane, so its parsing and
+# rendering is run by the slow lane's worker pool
+slow_lane: ContextVar[bool] = ContextVar("slow_lane", default=False)
+
+
+class RequestComplexity:
+    """
+    Cheap estimate of how much work a conversion is, taken from the raw diagrams
+
+    The counts come from matching the JSON text, without decoding or validating it.
+    Members are the lines of the attributes and methods of every class.
+    """
+
+    def __init__(self, payload_bytes: int, nodes: int, edges: int, members: int):
+        self.payload_bytes = payload_bytes
+        self.nodes = nodes
+        self.edges = edges
+        self.members = members
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "payload_bytes": self.payload_bytes,
+            "nodes": self.nodes,
+            "edges": self.edges,
+            "members": self.members,
+        }
+
+
+def count_members(content: str) -> int:
+    return sum(
+        match[1].count("\\n") + 1
+        for match in MEMBERS_PATTERN.finditer(content)
+        if match[1]
+    )
+
+
+def measure_request(request: ConvertRequest) -> RequestComplexity:
+    """Returns the complexity of the request and records it in the histograms"""
+    # Only the first part of each file is parsed (see fetch_data)
+    diagrams = [content[0] for content in request.content if content]
+    complexity = RequestComplexity(
+        payload_bytes=sum(len(part) for content in request.content for part in content),
+        nodes=sum(len(NODE_PATTERN.findall(diagram)) for diagram in diagrams),
+        edges=sum(len(EDGE_PATTERN.findall(diagram)) for diagram in diagrams),
+        members=sum(count_members(diagram) for diagram in diagrams),
+    )
+
+    request_bytes.observe(complexity.payload_bytes)
+    request_elements.labels(element="nodes").observe(complexity.nodes)
+    request_elements.labels(element="edges").observe(complexity.edges)
+    request_elements.labels(element="members").observe(complexity.members)
+    return complexity
+
+
+class AdmissionController:
+    """
+    Keeps large conversions from slowing down the small ones
+
+    A conversion is large when any measure of its complexity is above its limit. A
+    limit of 0 is no limit. Small conversions are admitted right away. Large ones
+    are handled by the policy:
+
+    - "reject" answers 413, so clients use POST /jobs for them instead
+    - "queue" runs at most max_large of them at once, and the others wait
+    - "slow_lane" also waits for one of max_large slots, and then runs them on
+      the slow lane's own worker pool instead of the shared one
+
+    When max_waiting large conversions are already waiting, the next one is
+    answered 503.
+    """
+
+    POLICIES = ("reject", "queue", "slow_lane")
+
+    def __init__(
+        self,
+        policy: str,
+        limits: dict[str, int],
+        max_large: int,
+        max_waiting: int,
+    ):
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f"Admission policy must be one of {', '.join(self.POLICIES)}"
+            )
+        if max_large < 1:
+            raise ValueError("At least 1 large conversion must be allowed at once")
+        self.__policy = policy
+        self.__limits = limits
+        self.__max_waiting = max_waiting
+        self.__limiter = anyio.CapacityLimiter(max_large)
+
+    def get_policy(self) -> str:
+        return self.__policy
+
+    def is_large(self, complexity: RequestComplexity) -> bool:
+        measures = complexity.to_dict()
+        return any(
+            0 < limit < measures[measure] for measure, limit in self.__limits.items()
+        )
+
+    @asynccontextmanager
+    async def admit(self, complexity: RequestComplexity) -> AsyncIterator[bool]:
+        """
+        Waits until the conversion may run and yields whether it is large
+
+        Raises an HTTPException when the conversion is rejected.
+        """
+        if not self.is_large(complexity):
+            admission_decisions.labels(decision="admitted").inc()
+            yield False
+            return
+
+        if self.__policy == "reject":
+            admission_decisions.labels(decision="rejected").inc()
+            raise HTTPException(
+                status_code=413,
+                detail="Diagram is too large to convert right away, "
+                "please convert it with POST /jobs instead",
+            )
+
+        if (
+            self.__limiter.available_tokens == 0
+            and self.__limiter.statistics().tasks_waiting >= self.__max_waiting
+        ):
+            admission_decisions.labels(decision="rejected").inc()
+            raise HTTPException(
+                status_code=503,
+                detail="Too many large diagrams are being converted, "
+                "please try again later",
+            )
+
+        admission_decisions.labels(decision=self.__policy).inc()
+        large_requests_waiting.inc()
+        try:
+            await self.__limiter.acquire()
+        finally:
+            large_requests_waiting.dec()
+
+        token = slow_lane.set(self.__policy == "slow_lane")
+        try:
+            yield True
+        finally:
+            slow_lane.reset(token)
+            self.__limiter.release()
@@ -0,0 +1,250 @@
+import functools
+import io
+import struct
+import time
+import zipfile
+from collections.abc import Iterable, Iterator
+
+from app.tracing import span
+
+
+class CompressedData:
+    """
+    The content of a constant file, compressed once
+
+    Archives copy the compressed bytes and CRC as they are, so a file that is part of
+    every project (e.g. a script or a stylesheet) is neither read nor compressed again
+    for each of them.
+    """
+
+    def __init__(self, data: str | bytes, compression: int = zipfile.ZIP_DEFLATED):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression) as zipf:
+            zipf.writestr("data", data)
+        self.__copy_entry(buffer.getvalue(), zipf.getinfo("data"))
+        self.data = data
+
+    @classmethod
+    def from_zip(cls, content: bytes, info: zipfile.ZipInfo) -> "CompressedData":
+        """
+        The data of an entry of the given zip, as it is compressed there
+
+        It is only decompressed if data is read, so copying it to another zip
+        doesn't inflate and deflate it again.
+        """
+        compressed = cls.__new__(cls)
+        compressed.__copy_entry(content, info)
+        compressed.__source = content
+        return compressed
+
+    @functools.cached_property
+    def data(self) -> bytes:
+        # __init__() sets data, so only the entries of from_zip() are read here
+        with zipfile.ZipFile(io.BytesIO(self.__source)) as zipf:
+            return zipf.read(self.__name)
+
+    def __copy_entry(self, content: bytes, info: zipfile.ZipInfo):
+        # The compressed bytes start after the local header and its variable fields
+        header = content[info.header_offset : info.header_offset + 30]
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        start = info.header_offset + 30 + name_length + extra_length
+        self.raw = content[start : start + info.compress_size]
+        self.compress_type = info.compress_type
+        self.crc = info.CRC
+        self.file_size = info.file_size
+        self.__name = info.filename
+
+
+# The name can also be a ZipInfo when the entry needs specific attributes
+ArchiveEntry = tuple[str | zipfile.ZipInfo, str | bytes | CompressedData]
+
+
+def executable(arcname: str) -> zipfile.ZipInfo:
+    """Returns the ZipInfo of a compressed entry with rwxr-xr-x permissions"""
+    info = zipfile.ZipInfo(arcname, date_time=time.localtime(time.time())[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o100755 << 16
+    return info
+
+
+class ZipArchive:
+    """
+    An in-memory representation of the zip file that will be sent to the user
+
+    Generators add their rendered files as entries, and the zip itself is only written
+    once when build() is called. Nothing is written to the working directory.
+
+    If a base archive is given (e.g. the starter.zip from Spring Initializr), the
+    entries are appended to a copy of it instead of a new empty zip.
+    """
+
+    def __init__(self, base: bytes = b"", compression: int = zipfile.ZIP_DEFLATED):
+        self.__base = base
+        self.__compression = compression
+        self.__entries: dict[
+            str, tuple[str | zipfile.ZipInfo, bytes | CompressedData]
+        ] = {}
+
+    def writestr(
+        self, arcname: str | zipfile.ZipInfo, data: str | bytes | CompressedData
+    ):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        name = arcname.filename if isinstance(arcname, zipfile.ZipInfo) else arcname
+        self.__entries[name] = (arcname, data)
+
+    def write(self, filename: str, arcname: str):
+        with open(filename, "rb") as f:
+            self.writestr(arcname, f.read())
+
+    def extend(self, entries: Iterable[ArchiveEntry]):
+        for arcname, data in entries:
+            self.writestr(arcname, data)
+
+    def read(self, arcname: str) -> bytes:
+        data = self.__entries[arcname][1]
+        return data.data if isinstance(data, CompressedData) else data
+
+    def namelist(self) -> list[str]:
+        return list(self.__entries)
+
+    def build(self) -> bytes:
+        buffer = io.BytesIO(self.__base)
+        mode = "a" if self.__base else "w"
+        with (
+            span("zip_build"),
+            zipfile.ZipFile(buffer, mode, self.__compression) as zipf,
+        ):
+            for arcname, data in self.__entries.values():
+                write_entry(zipf, arcname, data)
+        return buffer.getvalue()
+
+
+def write_entry(
+    zipf: zipfile.ZipFile,
+    arcname: str | zipfile.ZipInfo,
+    data: str | bytes | CompressedData,
+):
+    if isinstance(data, CompressedData):
+        write_compressed(zipf, arcname, data)
+    else:
+        zipf.writestr(arcname, data)
+
+
+# The private attributes of zipfile.ZipFile that write_compressed() relies on
+ZIPFILE_INTERNALS = ("_writing", "_seekable", "_writecheck", "_didModify", "start_dir")
+
+
+def write_compressed(
+    zipf: zipfile.ZipFile, arcname: str | zipfile.ZipInfo, data: CompressedData
+):
+    """
+    Adds already compressed data to the zip
+
+    zipfile has no public API for this, so this does what ZipFile.writestr() does
+    (see ZipFile._open_to_write() and _ZipWriteFile.close()) without the compressor.
+    The sizes and CRC are known beforehand, so they are written in the local header
+    and no data descriptor is needed, even when the output isn't seekable.
+
+    If a version of zipfile doesn't have these internals, the data is compressed
+    again with ZipFile.writestr().
+    """
+    if not all(hasattr(zipf, name) for name in ZIPFILE_INTERNALS):
+        zipf.writestr(arcname, data.data, compress_type=data.compress_type)
+        return
+
+    if isinstance(arcname, zipfile.ZipInfo):
+        zinfo = arcname
+    else:
+        zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(time.time())[:6])
+        zinfo.external_attr = 0o600 << 16
+    zinfo.compress_type = data.compress_type
+    zinfo.flag_bits = 0x00
+    zinfo.CRC = data.crc
+    zinfo.file_size = data.file_size
+    zinfo.compress_size = len(data.raw)
+    zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+
+    if zipf._writing:
+        raise ValueError("Can't write to the zip while another entry is being written")
+    if zipf._seekable:
+        zipf.fp.seek(zipf.start_dir)
+    zinfo.header_offset = zipf.fp.tell()
+    zipf._writecheck(zinfo)
+    zipf._didModify = True
+
+    zipf.fp.write(zinfo.FileHeader(zip64))
+    zipf.fp.write(data.raw)
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+class _StreamBuffer(io.RawIOBase):
+    """
+    Write-only, unseekable sink for zipfile.ZipFile
+
+    Because it can't seek, zipfile writes each entry followed by a data descriptor
+    instead of going back to patch the local header, so every entry can be sent to
+    the client as soon as it has been compressed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__chunks: list[bytes] = []
+        self.__offset = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self.__chunks.append(bytes(data))
+        self.__offset += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.__offset
+
+    def pop(self) -> bytes:
+        data = b"".join(self.__chunks)
+        self.__chunks.clear()
+        return data
+
+
+def iter_zip_entries(content: bytes) -> Iterator[ArchiveEntry]:
+    """
+    Yields every file inside the given zip content as an entry, still compressed
+    (see CompressedData.from_zip())
+    """
+    with zipfile.ZipFile(io.BytesIO(content)) as zipf:
+        for info in zipf.infolist():
+            yield info, CompressedData.from_zip(content, info)
+
+
+def stream_zip(
+    entries: Iterable[ArchiveEntry],
+    base: bytes = b"",
+    compression: int = zipfile.ZIP_DEFLATED,
+) -> Iterator[bytes]:
+    """
+    Writes the entries into a zip and yields the zip bytes entry by entry
+
+    Only the entry currently being compressed is kept in memory, so peak memory
+    doesn't grow with the number of entries. Entries of the base zip are written
+    first, like ZipArchive.build() does.
+    """
+    buffer = _StreamBuffer()
+    with zipfile.ZipFile(buffer, "w", compression) as zipf:
+        if base:
+            entries = _chain_base(base, entries)
+        for arcname, data in entries:
+            write_entry(zipf, arcname, data)
+            yield buffer.pop()
+    yield buffer.pop()
+
+
+def _chain_base(base: bytes, entries: Iterable[ArchiveEntry]) -> Iterator[ArchiveEntry]:
+    yield from iter_zip_entries(base)
+    yield from entries
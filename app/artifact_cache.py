@@ -0,0 +1,58 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from prometheus_client import Counter
+
+artifact_cache_lookups = Counter(
+    "artifact_cache_lookups_total",
+    "Total number of per-class generated file cache lookups by result",
+    ["artifact", "result"],
+)
+
+
+class ArtifactCache:
+    """
+    LRU cache of the files generated for a single class
+
+    Entries are keyed by the kind of file and everything it is rendered from, e.g.
+    ("service", fingerprint, project_name, group_id), where fingerprint comes from
+    ClassObject.get_fingerprint(). When one class of a large diagram is edited, only
+    that class and its subclasses get a new fingerprint, since the service of a
+    subclass also has the fields of its parents. Associated classes only refer to the
+    edited class by name, so their files are reused along with every other class.
+
+    It is shared by the threads of the worker pool, so access is locked.
+    """
+
+    def __init__(self, max_entries: int):
+        self.__max_entries = max_entries
+        self.__entries: OrderedDict[Hashable, str] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get_or_render(
+        self, artifact: str, key: tuple[Hashable, ...], render: Callable[[], str]
+    ) -> str:
+        full_key = (artifact, *key)
+        with self.__lock:
+            content = self.__entries.get(full_key)
+            if content is not None:
+                self.__entries.move_to_end(full_key)
+
+        if content is not None:
+            artifact_cache_lookups.labels(artifact=artifact, result="hit").inc()
+            return content
+
+        artifact_cache_lookups.labels(artifact=artifact, result="miss").inc()
+        content = render()
+        if self.__max_entries > 0:
+            with self.__lock:
+                self.__entries[full_key] = content
+                self.__entries.move_to_end(full_key)
+                while len(self.__entries) > self.__max_entries:
+                    self.__entries.popitem(last=False)
+        return content
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
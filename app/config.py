@@ -1,5 +1,10 @@
 import os
+import tempfile
 
+# Files the app keeps between runs, like downloaded starter.zip files
+APP_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))), ".cache"
+)
 DEBUG = not os.getenv("PRODUCTION", False)
 VERSION = "8.0.1"
 APP_CONFIG = {
@@ -8,9 +13,79 @@ APP_CONFIG = {
     "version": VERSION,
     "title": "MoTxT Convert",
 }
+# Compiled Jinja templates are cached here so new workers start faster
+TEMPLATE_CACHE_DIR = os.getenv(
+    "TEMPLATE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "motxt-jinja-cache")
+)
+# Send the generated zip entry by entry instead of building it before responding
+STREAM_RESPONSE = os.getenv("STREAM_RESPONSE", "").lower() in ("1", "true")
+# "initializr" downloads starter.zip from the Spring Initializr at SPRING_SERVICE_URL,
+# "local" renders the Spring Boot skeleton from templates. The local skeleton has no
+# gradle-wrapper.jar, so its gradlew and run scripts need Gradle to be installed.
+SPRING_SKELETON = os.getenv("SPRING_SKELETON", "initializr").lower()
 SPRING_SERVICE_URL = os.getenv("SPRING_SERVICE_URL", "http://localhost:8080")
+# starter.zip files from Spring Initializr are cached for STARTER_CACHE_TTL seconds,
+# then served stale for STARTER_CACHE_MAX_STALE more seconds while a new one is
+# fetched in the background.
+# Set STARTER_CACHE_DIR to an empty string to only cache them in memory.
+STARTER_CACHE_DIR = os.getenv(
+    "STARTER_CACHE_DIR", os.path.join(APP_CACHE_DIR, "starter")
+)
+STARTER_CACHE_TTL = float(os.getenv("STARTER_CACHE_TTL", 24 * 60 * 60))
+STARTER_CACHE_SIZE = int(os.getenv("STARTER_CACHE_SIZE", 64))
+STARTER_CACHE_MAX_STALE = float(os.getenv("STARTER_CACHE_MAX_STALE", 7 * 24 * 60 * 60))
+STARTER_CACHE_DISK_SIZE = int(os.getenv("STARTER_CACHE_DISK_SIZE", 256))
+# Shared HTTP client used to call Spring Initializr
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 20))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 10))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 5))
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", 2))
+HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", 0.5))
+HTTP2 = os.getenv("HTTP2", "true").lower() in ("1", "true")
+# Zips built for /convert are cached in memory, and on disk if RESULT_CACHE_DIR is set
+RESULT_CACHE_MEMORY_BYTES = int(os.getenv("RESULT_CACHE_MEMORY_BYTES", 64 * 1024**2))
+RESULT_CACHE_DIR = os.getenv("RESULT_CACHE_DIR", "")
+RESULT_CACHE_DISK_BYTES = int(os.getenv("RESULT_CACHE_DISK_BYTES", 1024**3))
+# Number of per-class generated files kept to skip rendering unchanged classes
+ARTIFACT_CACHE_SIZE = int(os.getenv("ARTIFACT_CACHE_SIZE", 4096))
+# Number of project names whose rendered Django project files are kept
+DJANGO_SKELETON_CACHE_SIZE = int(os.getenv("DJANGO_SKELETON_CACHE_SIZE", 256))
+# Number of results kept by each memoised name helper, e.g. camel_to_snake
+NAME_CACHE_SIZE = int(os.getenv("NAME_CACHE_SIZE", 4096))
+# Export the stages of conversions as OpenTelemetry spans (needs opentelemetry-api)
+TRACING = os.getenv("TRACING", "false").lower() in ("1", "true")
 SPRING_DEPENDENCIES = (
     "lombok,devtools,configuration-processor,web,data-jpa,validation,"
     "springdoc-starter-webmvc-ui,hibernate-core,hibernate-community-dialects,"
     "hikaricp,sqlite,jakarta-persistence-api"
 )
+# Parsing and rendering of inputs at least WORKER_POOL_THRESHOLD bytes long is moved
+# off the event loop to a "process" or "thread" pool, or kept inline with "none".
+# Metrics recorded inside a process worker (e.g. parse latency) are not exported.
+WORKER_POOL = os.getenv("WORKER_POOL", "thread").lower()
+WORKER_POOL_SIZE = int(os.getenv("WORKER_POOL_SIZE", os.cpu_count() or 1))
+WORKER_POOL_THRESHOLD = int(os.getenv("WORKER_POOL_THRESHOLD", 64 * 1024))
+# Jobs queued with POST /jobs are run by JOB_WORKERS tasks and kept for JOB_TTL
+# seconds after they finish, up to the JOB_MAX_FINISHED most recent ones. With
+# JOB_DB_PATH, they are stored in that SQLite file.
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))
+JOB_MAX_QUEUED = int(os.getenv("JOB_MAX_QUEUED", 100))
+JOB_MAX_FINISHED = int(os.getenv("JOB_MAX_FINISHED", 100))
+JOB_TTL = float(os.getenv("JOB_TTL", 60 * 60))
+JOB_DB_PATH = os.getenv("JOB_DB_PATH", "")
+# Limits of /convert/batch: projects per request and projects converted at once
+BATCH_MAX_PROJECTS = int(os.getenv("BATCH_MAX_PROJECTS", 50))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", WORKER_POOL_SIZE))
+# Conversions with more bytes, nodes, edges, or attribute and method lines than
+# these limits (0 is no limit) are large. Large ones are rejected with "reject",
+# converted ADMISSION_MAX_LARGE at a time with "queue", or also on a worker pool of
+# their own with "slow_lane". Past ADMISSION_MAX_WAITING waiting ones, they get 503.
+ADMISSION_POLICY = os.getenv("ADMISSION_POLICY", "queue").lower()
+ADMISSION_MAX_BYTES = int(os.getenv("ADMISSION_MAX_BYTES", 1024**2))
+ADMISSION_MAX_NODES = int(os.getenv("ADMISSION_MAX_NODES", 1000))
+ADMISSION_MAX_EDGES = int(os.getenv("ADMISSION_MAX_EDGES", 2000))
+ADMISSION_MAX_MEMBERS = int(os.getenv("ADMISSION_MAX_MEMBERS", 10000))
+ADMISSION_MAX_LARGE = int(os.getenv("ADMISSION_MAX_LARGE", 1))
+ADMISSION_MAX_WAITING = int(os.getenv("ADMISSION_MAX_WAITING", 8))
@@ -0,0 +1,48 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def loads_json(content: str | bytes) -> object:
+    """
+    Decodes JSON with orjson when it is installed, otherwise with the json module
+
+    orjson.JSONDecodeError is a subclass of json.JSONDecodeError, so callers only
+    have to catch the latter.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class DiagramDocument:
+    """
+    The content of a .jet file, decoded once
+
+    The decoded data is passed to ParseJsonToObjectClass and ParseJsonToObjectSeq,
+    so the JSON of an uploaded diagram is never decoded again after its type has
+    been read.
+    """
+
+    def __init__(self, data: dict):
+        self.__data = data
+
+    @classmethod
+    def decode(cls, content: str | bytes) -> "DiagramDocument":
+        try:
+            data = loads_json(content)
+        except json.JSONDecodeError:
+            raise ValueError("Error: Invalid JSON format")
+
+        if not isinstance(data, dict):
+            raise ValueError("Diagram type not found on .jet file")
+        return cls(data)
+
+    def get_diagram_type(self) -> str | None:
+        return self.__data.get("diagram", None)
+
+    def get_data(self) -> dict:
+        return self.__data
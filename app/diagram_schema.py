@@ -0,0 +1,152 @@
+from typing import TypedDict
+
+from jsonschema.validators import validator_for
+
+from app.tracing import span
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover
+    fastjsonschema = None
+
+SEQUENCE_DIAGRAM_SCHEMA = {
+    "type": "object",
+    "required": ["diagram", "nodes", "edges", "version"],
+    "properties": {
+        "diagram": {"type": "string", "enum": ["SequenceDiagram"]},
+        "nodes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "type"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "type": {
+                        "type": "string",
+                        "enum": ["ImplicitParameterNode", "CallNode"],
+                    },
+                    "name": {"type": "string"},
+                    "children": {"type": "array", "items": {"type": "integer"}},
+                    "x": {"type": "integer"},
+                    "y": {"type": "integer"},
+                },
+            },
+        },
+        "edges": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["start", "end", "type"],
+                "properties": {
+                    "start": {"type": "integer"},
+                    "end": {"type": "integer"},
+                    "type": {
+                        "type": "string",
+                        "enum": ["CallEdge", "ReturnEdge", "ConstructorEdge"],
+                    },
+                    "middleLabel": {"type": "string"},
+                    "signal": {"type": "boolean"},
+                },
+            },
+        },
+        "version": {"type": "string"},
+    },
+}
+
+CLASS_DIAGRAM_SCHEMA = {
+    "type": "object",
+    "required": ["nodes"],
+    "properties": {
+        "diagram": {"type": "string", "enum": ["ClassDiagram"]},
+        "nodes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "name", "methods"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                    "methods": {"type": "string"},
+                    "attributes": {"type": "string"},
+                },
+            },
+        },
+        "edges": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["start", "end"],
+                "properties": {
+                    "start": {"type": "integer"},
+                    "end": {"type": "integer"},
+                    "type": {"type": "string"},
+                    "startLabel": {"type": "string"},
+                    "endLabel": {"type": "string"},
+                },
+            },
+        },
+        "version": {"type": "string"},
+    },
+}
+
+
+class SchemaViolation(TypedDict):
+    path: str
+    message: str
+
+
+class SchemaValidationError(ValueError):
+    """ValueError with every schema violation found in the diagram"""
+
+    def __init__(self, message: str, violations: list[SchemaViolation]):
+        super().__init__(message)
+        self.violations = violations
+
+    def __reduce__(self) -> tuple:
+        # Errors raised in the process pool are pickled back to the app
+        return type(self), (str(self), self.violations)
+
+
+class DiagramValidator:
+    """
+    JSON schema validator that is compiled once and reused for every diagram
+
+    The schema itself is checked when the validator is created. When the optional
+    fastjsonschema package is installed, valid diagrams are checked with a
+    validator compiled to Python code. Only invalid diagrams go through jsonschema,
+    which collects every violation instead of stopping at the first one.
+    """
+
+    def __init__(self, schema: dict):
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        self.__validator = validator_class(schema)
+        self.__fast_validate = (
+            fastjsonschema.compile(schema) if fastjsonschema is not None else None
+        )
+
+    def validate(self, data: object) -> list[SchemaViolation]:
+        """Returns the violations of the schema, or an empty list if data is valid"""
+        with span("validate"):
+            return self.__validate(data)
+
+    def __validate(self, data: object) -> list[SchemaViolation]:
+        if self.__fast_validate is not None:
+            try:
+                self.__fast_validate(data)
+                return []
+            except fastjsonschema.JsonSchemaException:
+                pass
+
+        violations = [
+            SchemaViolation(
+                path="/".join(str(part) for part in error.absolute_path) or "$",
+                message=error.message,
+            )
+            for error in self.__validator.iter_errors(data)
+        ]
+        return sorted(violations, key=lambda violation: violation["path"])
+
+
+sequence_diagram_validator = DiagramValidator(SEQUENCE_DIAGRAM_SCHEMA)
+class_diagram_validator = DiagramValidator(CLASS_DIAGRAM_SCHEMA)
@@ -35,9 +35,10 @@ def generate_service_java(project_name: str, model: ClassObject, group_id: str)
 def get_all_attributes(model: ClassObject) -> list[str]:
     attributes = []
 
-    fields = model.get_fields()
-    if model.get_parent() is not None:
-        fields += model.get_parent().get_fields()
+    # A class also has the fields of all of its ancestors
+    fields = list(model.get_fields())
+    for ancestor in model.get_ancestors():
+        fields += ancestor.get_fields()
 
     for attribute in fields:
         attribute_name = attribute.get_name()
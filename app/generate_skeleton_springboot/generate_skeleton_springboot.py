@@ -0,0 +1,65 @@
+from collections.abc import Iterator
+
+from app.archive import ArchiveEntry, executable
+from app.models.elements import DependencyElements
+from app.utils import render_template
+
+GRADLE_VERSION = "8.13"
+
+
+def get_application_class_name(project_name: str) -> str:
+    # Same naming as Spring Initializr, e.g. "demo" becomes "DemoApplication"
+    return project_name[:1].upper() + project_name[1:] + "Application"
+
+
+# Replaces the starter.zip from Spring Initializr
+def generate_springboot_skeleton(
+    project_name: str, group_id: str
+) -> Iterator[ArchiveEntry]:
+    """
+    Yields the files that Spring Initializr would put in the starter.zip
+
+    gradle-wrapper.jar is the only file that can't be rendered from a template, so
+    gradlew and gradlew.bat generate it with a local Gradle on their first run.
+    """
+    context = {
+        "project_name": project_name,
+        "group_id": group_id,
+        "class_name": get_application_class_name(project_name),
+        "gradle_version": GRADLE_VERSION,
+    }
+    src_path = group_id.replace(".", "/") + "/" + project_name
+
+    yield ".gitignore", render_template("springboot/skeleton/gitignore.txt")
+    yield (
+        "build.gradle.kts",
+        DependencyElements("build.gradle.kts").print_springboot_style(
+            project_name, group_id
+        ),
+    )
+    yield (
+        "settings.gradle.kts",
+        render_template("springboot/skeleton/settings.gradle.kts.j2", context),
+    )
+    yield (
+        executable("gradlew"),
+        render_template("springboot/skeleton/gradlew.j2", context),
+    )
+    yield "gradlew.bat", render_template("springboot/skeleton/gradlew.bat.j2", context)
+    yield (
+        "gradle/wrapper/gradle-wrapper.properties",
+        render_template("springboot/skeleton/gradle-wrapper.properties.j2", context),
+    )
+    yield (
+        f"src/main/java/{src_path}/{context['class_name']}.java",
+        render_template("springboot/skeleton/Application.java.j2", context),
+    )
+    yield (
+        "src/main/resources/application.properties",
+        f"spring.application.name={project_name}\n"
+        + DependencyElements("build.gradle.kts").print_application_properties(),
+    )
+    yield (
+        f"src/test/java/{src_path}/{context['class_name']}Tests.java",
+        render_template("springboot/skeleton/ApplicationTests.java.j2", context),
+    )
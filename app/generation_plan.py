@@ -0,0 +1,147 @@
+from collections.abc import Callable, Iterable
+
+from app.models.diagram import ClassObject
+from app.models.elements import ModelsElements
+from app.utils import camel_to_snake, render_template
+
+ClassContext = dict[str, object]
+
+
+def build_class_context(class_object: ClassObject) -> ClassContext:
+    """
+    Every value the Django templates derive from a class, computed once
+
+    The templates were written separately and name the same values differently
+    (e.g. snake_name, name_snake and class_snake), so each name is kept.
+    """
+    name = class_object.get_name()
+    snake_name = camel_to_snake(name)
+    fields = [{"name": field.get_name()} for field in class_object.get_fields()]
+    return {
+        "name": name,
+        "class_name": name,
+        "snake_name": snake_name,
+        "name_snake": snake_name,
+        "class_snake": snake_name,
+        "is_public": class_object.get_is_public(),
+        "fields": fields,
+        "has_edit": len(fields) > 0,
+    }
+
+
+def is_public(context: ClassContext) -> bool:
+    return context["is_public"]
+
+
+def is_editable(context: ClassContext) -> bool:
+    return context["is_public"] and context["has_edit"]
+
+
+class ClassListEmitter:
+    """Renders a single file with the context of every class it accepts"""
+
+    def __init__(
+        self,
+        template_name: str,
+        accepts: Callable[[ClassContext], bool] | None = is_public,
+    ):
+        self.__template_name = template_name
+        self.__accepts = accepts
+        self.__classes: list[ClassContext] = []
+
+    def add(self, context: ClassContext):
+        if self.__accepts is None or self.__accepts(context):
+            self.__classes.append(context)
+
+    def render(self) -> str:
+        return render_template(self.__template_name, {"classes": self.__classes})
+
+
+class ClassPageEmitter:
+    """Renders a page for every class it accepts, keyed by the class name"""
+
+    def __init__(
+        self,
+        template_name: str,
+        accepts: Callable[[ClassContext], bool] | None = is_public,
+    ):
+        self.__template_name = template_name
+        self.__accepts = accepts
+        self.__pages: dict[str, str] = {}
+
+    def add(self, context: ClassContext):
+        if self.__accepts is None or self.__accepts(context):
+            self.__pages[context["name"]] = render_template(
+                self.__template_name, context
+            )
+
+    def render(self) -> dict[str, str]:
+        return self.__pages
+
+
+Emitter = ClassListEmitter | ClassPageEmitter
+
+
+class GenerationPlan:
+    """
+    Generates several files from the classes of a diagram in a single traversal
+
+    The context of each class is built once and passed to every emitter, instead of
+    each generator walking the classes and deriving the same names on its own. The
+    emitters keep what they are given, so a plan is only run once.
+    """
+
+    def __init__(self, emitters: dict[str, Emitter]):
+        self.__emitters = emitters
+
+    def run(
+        self,
+        classes: Iterable[ClassObject],
+        on_class_rendered: Callable[[], None] | None = None,
+    ) -> dict[str, str | dict[str, str]]:
+        for class_object in classes:
+            context = build_class_context(class_object)
+            for emitter in self.__emitters.values():
+                emitter.add(context)
+            if on_class_rendered is not None:
+                on_class_rendered()
+        return {name: emitter.render() for name, emitter in self.__emitters.items()}
+
+
+def plan_django_files() -> GenerationPlan:
+    """
+    The views, forms, urls and HTML pages generated for each class of a Django app
+
+    The views are in the order they are written to views.py.
+    """
+    return GenerationPlan(
+        {
+            "create_views": ClassListEmitter("create_page_views.py.j2"),
+            "read_views": ClassListEmitter("read_page_views.py.j2"),
+            "delete_views": ClassListEmitter("delete_page_views.py.j2"),
+            "edit_views": ClassListEmitter("edit_page_views.py.j2", is_editable),
+            "forms": ClassListEmitter("forms.py.j2"),
+            # urls.py.j2 checks is_public itself
+            "urls": ClassListEmitter("urls.py.j2", None),
+            "create_pages": ClassPageEmitter("create_page_django.html.j2"),
+            "read_pages": ClassPageEmitter("read_page_django.html.j2"),
+            "edit_pages": ClassPageEmitter(
+                "edit_page_django.html.j2",
+                lambda context: context["name"] != "" and is_editable(context),
+            ),
+        }
+    )
+
+
+def generate_django_files(
+    models_elements: ModelsElements,
+    on_class_rendered: Callable[[], None] | None = None,
+) -> dict[str, str | dict[str, str]]:
+    """
+    Runs plan_django_files() over the classes of the diagram
+
+    on_class_rendered is called once the files of each class have been rendered.
+    """
+    if not models_elements.get_classes():
+        raise ValueError("ModelsElements does not contain any classes!")
+    return plan_django_files().run(models_elements.get_classes(), on_class_rendered)
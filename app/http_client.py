@@ -0,0 +1,112 @@
+import asyncio
+import importlib.util
+
+import httpx
+from prometheus_client import Counter, Gauge
+
+from app.utils import logger
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+RETRY_STATUS_CODES = {502, 503, 504}
+
+http_client_requests = Counter(
+    "http_client_requests_total",
+    "Total number of outgoing HTTP requests by outcome",
+    ["outcome"],
+)
+http_client_retries = Counter(
+    "http_client_retries_total", "Total number of retried outgoing HTTP requests"
+)
+http_client_connections = Gauge(
+    "http_client_connections",
+    "Number of connections in the shared HTTP client pool by state",
+    ["state"],
+)
+
+
+class HttpClient:
+    """
+    App-scoped httpx.AsyncClient with retries
+
+    The client is opened in the lifespan of the app, so connections to the same
+    service are kept alive and reused between requests. Before start() or after
+    close(), every request uses a new short-lived client with the same settings.
+
+    Timeouts, network errors and 502/503/504 responses are retried with an
+    exponential backoff. The last error or response is returned to the caller.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits,
+        timeout: httpx.Timeout,
+        retries: int,
+        backoff: float,
+        http2: bool,
+    ):
+        self.__limits = limits
+        self.__timeout = timeout
+        self.__retries = retries
+        self.__backoff = backoff
+        self.__http2 = http2 and HTTP2_AVAILABLE
+        self.__client: httpx.AsyncClient | None = None
+
+    def start(self):
+        if self.__client is not None:
+            return
+        self.__client = self.__create_client()
+        http_client_connections.labels(state="active").set_function(
+            lambda: self.__count_connections(idle=False)
+        )
+        http_client_connections.labels(state="idle").set_function(
+            lambda: self.__count_connections(idle=True)
+        )
+
+    async def close(self):
+        client, self.__client = self.__client, None
+        if client is not None:
+            await client.aclose()
+
+    async def get(self, url: str, **kwargs: object) -> httpx.Response:
+        if self.__client is not None:
+            return await self.__send(self.__client, url, **kwargs)
+
+        async with self.__create_client() as client:
+            return await self.__send(client, url, **kwargs)
+
+    def __create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=self.__limits, timeout=self.__timeout, http2=self.__http2
+        )
+
+    async def __send(
+        self, client: httpx.AsyncClient, url: str, **kwargs: object
+    ) -> httpx.Response:
+        for attempt in range(self.__retries + 1):
+            last_attempt = attempt == self.__retries
+            try:
+                resp = await client.get(url, **kwargs)
+            except (httpx.TimeoutException, httpx.NetworkError) as ex:
+                if last_attempt:
+                    http_client_requests.labels(outcome="error").inc()
+                    raise
+                logger.warning(f"Retrying GET {url} after error: {ex!r}")
+            else:
+                if last_attempt or resp.status_code not in RETRY_STATUS_CODES:
+                    http_client_requests.labels(outcome=str(resp.status_code)).inc()
+                    return resp
+                logger.warning(f"Retrying GET {url} after status {resp.status_code}")
+
+            http_client_retries.inc()
+            await asyncio.sleep(self.__backoff * 2**attempt)
+
+    def __count_connections(self, idle: bool) -> int:
+        # httpx doesn't expose its connection pool, so this reads it defensively
+        pool = getattr(getattr(self.__client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", [])
+        return sum(
+            1
+            for connection in connections
+            if not connection.is_closed() and connection.is_idle() == idle
+        )
@@ -0,0 +1,284 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from typing import TypeVar
+
+import anyio
+from fastapi import HTTPException
+from prometheus_client import Counter, Gauge
+
+from app.model import ConvertRequest
+from app.utils import logger
+
+T = TypeVar("T")
+
+jobs_total = Counter(
+    "jobs_total", "Total number of conversion jobs by final status", ["status"]
+)
+jobs_queued = Gauge("jobs_queued", "Number of conversion jobs waiting for a worker")
+
+
+class Job:
+    """
+    A conversion requested through POST /jobs and its progress
+
+    The runner moves the job through the stages parsing, rendering and zipping, and
+    reports every rendered class and file. These updates come from a worker thread,
+    so they are plain attribute writes.
+    """
+
+    def __init__(
+        self,
+        request: ConvertRequest,
+        job_id: str | None = None,
+        created_at: float | None = None,
+    ):
+        self.id = job_id or uuid.uuid4().hex
+        self.request = request
+        self.status = "queued"
+        self.created_at = created_at or time.time()
+        self.finished_at: float | None = None
+        self.classes_total = 0
+        self.classes_rendered = 0
+        self.files = 0
+        self.error: dict | None = None
+        self.result: bytes | None = None
+
+    def set_stage(self, stage: str):
+        self.status = stage
+
+    def start_rendering(self, classes_total: int):
+        self.classes_total = classes_total
+        self.status = "rendering"
+
+    def class_rendered(self):
+        self.classes_rendered += 1
+
+    def track(self, entries: Iterable[T]) -> Iterator[T]:
+        """Counts the files of the project while they are rendered"""
+        for entry in entries:
+            self.files += 1
+            yield entry
+
+    def is_finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "project_name": self.request.project_name,
+            "progress": {
+                "classes_rendered": self.classes_rendered,
+                "classes_total": self.classes_total,
+                "files": self.files,
+            },
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+
+class JobQueue:
+    """
+    In-process queue of conversion jobs
+
+    Jobs are run by asyncio tasks, which call the given runner with the job to get
+    the zip of its project. Finished jobs, with their result or error, are kept for
+    ttl seconds after they finish, and only the max_finished most recent ones.
+
+    If a database path is given, jobs and results are also stored in SQLite. Results
+    are then read from the database when they are downloaded instead of being kept in
+    memory, and jobs that didn't finish before a restart are queued again on start().
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Job], Awaitable[bytes]],
+        workers: int,
+        max_queued: int,
+        max_finished: int,
+        ttl: float,
+        db_path: str | None,
+    ):
+        self.__runner = runner
+        self.__workers = workers
+        self.__max_queued = max_queued
+        self.__max_finished = max_finished
+        self.__ttl = ttl
+        self.__db_path = db_path
+        self.__jobs: dict[str, Job] = {}
+        self.__queue: asyncio.Queue[Job] | None = None
+        self.__tasks: list[asyncio.Task] = []
+        self.__db: sqlite3.Connection | None = None
+        self.__db_lock = threading.Lock()
+
+    async def start(self):
+        if self.__tasks:
+            return
+        self.__queue = asyncio.Queue()
+        if self.__db_path is not None:
+            self.__db = await anyio.to_thread.run_sync(self.__open_db)
+            for job in await anyio.to_thread.run_sync(self.__load_jobs):
+                self.__jobs[job.id] = job
+                if not job.is_finished():
+                    self.__enqueue(job)
+        self.__tasks = [
+            asyncio.create_task(self.__work()) for _ in range(self.__workers)
+        ]
+
+    async def close(self):
+        tasks, self.__tasks = self.__tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.__db is not None:
+            self.__db.close()
+            self.__db = None
+
+    async def submit(self, request: ConvertRequest) -> Job:
+        await self.start()
+        await self.purge_expired()
+        if self.__queue.qsize() >= self.__max_queued:
+            raise HTTPException(
+                status_code=503, detail="Too many queued jobs, please try again later"
+            )
+
+        job = Job(request)
+        self.__jobs[job.id] = job
+        await self.__save(job)
+        self.__enqueue(job)
+        return job
+
+    async def get(self, job_id: str) -> Job | None:
+        await self.purge_expired()
+        return self.__jobs.get(job_id)
+
+    async def get_result(self, job: Job) -> bytes | None:
+        if job.result is not None or self.__db is None:
+            return job.result
+        return await anyio.to_thread.run_sync(self.__load_result, job.id)
+
+    async def purge_expired(self):
+        """
+        Removes the jobs that finished more than ttl seconds ago, and the oldest
+        finished jobs past max_finished
+        """
+        now = time.time()
+        finished = sorted(
+            (job for job in self.__jobs.values() if job.finished_at is not None),
+            key=lambda job: job.finished_at,
+            reverse=True,
+        )
+        expired = [
+            job.id
+            for index, job in enumerate(finished)
+            if index >= self.__max_finished or now - job.finished_at >= self.__ttl
+        ]
+        for job_id in expired:
+            del self.__jobs[job_id]
+        # A worker thread may be writing a large result while holding the lock
+        if expired and self.__db is not None:
+            await anyio.to_thread.run_sync(self.__delete_jobs, expired)
+
+    def __enqueue(self, job: Job):
+        self.__queue.put_nowait(job)
+        jobs_queued.set(self.__queue.qsize())
+
+    async def __work(self):
+        while True:
+            job = await self.__queue.get()
+            jobs_queued.set(self.__queue.qsize())
+            try:
+                await self.__run(job)
+            finally:
+                self.__queue.task_done()
+
+    async def __run(self, job: Job):
+        job.set_stage("parsing")
+        result = None
+        try:
+            result = await self.__runner(job)
+            status = "done"
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                job.error = {"status_code": ex.status_code, "detail": ex.detail}
+            else:
+                logger.warning(f"Job {job.id} failed: {ex!r}", exc_info=ex)
+                job.error = {"status_code": 500, "detail": str(ex)}
+            status = "failed"
+
+        # The status is set last, so a finished job always has its result
+        job.finished_at = time.time()
+        if self.__db is None:
+            job.result = result
+        else:
+            await anyio.to_thread.run_sync(self.__write_job, job, result, status)
+        job.set_stage(status)
+        jobs_total.labels(status=status).inc()
+
+    async def __save(self, job: Job):
+        if self.__db is not None:
+            await anyio.to_thread.run_sync(self.__write_job, job, None, job.status)
+
+    def __open_db(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.__db_path, check_same_thread=False)
+        with db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, request TEXT NOT NULL, status TEXT NOT NULL, "
+                "created_at REAL NOT NULL, finished_at REAL, error TEXT, result BLOB)"
+            )
+        return db
+
+    def __write_job(self, job: Job, result: bytes | None, status: str):
+        with self.__db_lock, self.__db:
+            self.__db.execute(
+                "INSERT INTO jobs (id, request, status, created_at, finished_at, "
+                "error, result) VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE "
+                "SET status = excluded.status, finished_at = excluded.finished_at, "
+                "error = excluded.error, result = COALESCE(excluded.result, result)",
+                (
+                    job.id,
+                    job.request.model_dump_json(),
+                    status,
+                    job.created_at,
+                    job.finished_at,
+                    json.dumps(job.error) if job.error else None,
+                    result,
+                ),
+            )
+
+    def __delete_jobs(self, job_ids: list[str]):
+        with self.__db_lock, self.__db:
+            self.__db.executemany(
+                "DELETE FROM jobs WHERE id = ?", [(job_id,) for job_id in job_ids]
+            )
+
+    def __load_jobs(self) -> list[Job]:
+        with self.__db_lock:
+            rows = self.__db.execute(
+                "SELECT id, request, status, created_at, finished_at, error FROM jobs"
+            ).fetchall()
+
+        jobs = []
+        for job_id, request, status, created_at, finished_at, error in rows:
+            job = Job(ConvertRequest.model_validate_json(request), job_id, created_at)
+            # Jobs that were running when the app stopped are started again
+            if status in ("done", "failed"):
+                job.status = status
+                job.finished_at = finished_at
+                job.error = json.loads(error) if error else None
+            jobs.append(job)
+        return jobs
+
+    def __load_result(self, job_id: str) -> bytes | None:
+        with self.__db_lock:
+            row = self.__db.execute(
+                "SELECT result FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return row[0] if row else None
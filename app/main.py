@@ -1,40 +1,75 @@
+import collections
+import functools
+import itertools
 import json
 import os
-import tempfile
+import typing
 import zipfile
-from contextlib import asynccontextmanager
+from collections.abc import Callable, Iterator
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
 from io import StringIO
+from urllib.parse import quote
 
 import anyio
 import httpx
 from fastapi import FastAPI, HTTPException, Response
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from prometheus_client import Counter, Histogram
 from prometheus_fastapi_instrumentator import Instrumentator
-from starlette.background import BackgroundTasks
-
-from app.config import APP_CONFIG, SPRING_DEPENDENCIES, SPRING_SERVICE_URL
+from starlette.types import Receive, Scope, Send
+
+from app.admission import AdmissionController, measure_request, slow_lane
+from app.archive import ArchiveEntry, CompressedData, ZipArchive, stream_zip
+from app.artifact_cache import ArtifactCache
+from app.config import (
+    ADMISSION_MAX_BYTES,
+    ADMISSION_MAX_EDGES,
+    ADMISSION_MAX_LARGE,
+    ADMISSION_MAX_MEMBERS,
+    ADMISSION_MAX_NODES,
+    ADMISSION_MAX_WAITING,
+    ADMISSION_POLICY,
+    APP_CONFIG,
+    ARTIFACT_CACHE_SIZE,
+    BATCH_CONCURRENCY,
+    BATCH_MAX_PROJECTS,
+    HTTP2,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    HTTP_TIMEOUT,
+    JOB_DB_PATH,
+    JOB_MAX_FINISHED,
+    JOB_MAX_QUEUED,
+    JOB_TTL,
+    JOB_WORKERS,
+    RESULT_CACHE_DIR,
+    RESULT_CACHE_DISK_BYTES,
+    RESULT_CACHE_MEMORY_BYTES,
+    SPRING_DEPENDENCIES,
+    SPRING_SERVICE_URL,
+    SPRING_SKELETON,
+    STARTER_CACHE_DIR,
+    STARTER_CACHE_DISK_SIZE,
+    STARTER_CACHE_MAX_STALE,
+    STARTER_CACHE_SIZE,
+    STARTER_CACHE_TTL,
+    STREAM_RESPONSE,
+    WORKER_POOL,
+    WORKER_POOL_SIZE,
+    WORKER_POOL_THRESHOLD,
+)
+from app.diagram_document import DiagramDocument
 from app.generate_controller_springboot.generate_controller_springboot import (
     generate_springboot_controller_file,
 )
-from app.generate_frontend.create.create_page_views import generate_create_page_views
-from app.generate_frontend.create.generate_create_page_django import (
-    generate_forms_create_page_django,
-    generate_html_create_pages_django,
-)
-from app.generate_frontend.delete.delete_page_views import generate_delete_page_views
-from app.generate_frontend.edit.edit_page_views import generate_edit_page_views
-from app.generate_frontend.edit.generate_edit_page_django import (
-    generate_html_edit_pages_django,
-)
 from app.generate_frontend.generate_landing_page import (
     generate_landing_page_html,
     generate_landing_page_views,
 )
-from app.generate_frontend.read.generate_read_page_django import (
-    generate_html_read_pages_django,
-)
-from app.generate_frontend.read.read_page_views import generate_read_page_views
 from app.generate_repository.generate_repository import generate_repository_java
 from app.generate_runner.generate_runner import (
     generate_springboot_linux_runner,
@@ -43,40 +78,107 @@ from app.generate_runner.generate_runner import (
 from app.generate_service_springboot.generate_service_springboot import (
     generate_service_java,
 )
+from app.generate_skeleton_springboot.generate_skeleton_springboot import (
+    generate_springboot_skeleton,
+)
 from app.generate_swagger.generate_swagger import (
     generate_swagger_config,
 )
-from app.model import ConvertRequest, DownloadRequest, DuplicateChecker, Style
+from app.generation_plan import generate_django_files, plan_django_files
+from app.http_client import HttpClient
+from app.job_queue import Job, JobQueue
+from app.model import ConvertRequest, DuplicateChecker, Style
 from app.models.elements import (
     ClassObject,
     ModelsElements,
     RequirementsElements,
-    UrlsElement,
     ViewsElements,
 )
 from app.parse_json_to_object_seq import ParseJsonToObjectSeq
+from app.result_cache import ResultCache
+from app.starter_cache import StarterCache
+from app.tracing import (
+    ConvertTracingMiddleware,
+    StageTimer,
+    record_stages,
+    span,
+)
 from app.utils import (
+    env,
     is_valid_java_package_name,
     is_valid_python_identifier,
     logger,
-    remove_file,
+    render_django_settings,
     render_project_django_template,
     render_template,
     translate_to_cat,
 )
+from app.worker_pool import WorkerPool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # pragma: no cover
     instrumentator.expose(app)
+    env.preload()
+    preload_static_files()
+    worker_pool.start()
+    slow_worker_pool.start()
+    http_client.start()
+    await job_queue.start()
     yield
+    await job_queue.close()
+    await starter_cache.close()
+    await http_client.close()
+    slow_worker_pool.shutdown()
+    worker_pool.shutdown()
 
 
 app = FastAPI(**APP_CONFIG, lifespan=lifespan)
+app.add_middleware(ConvertTracingMiddleware)
 instrumentator = Instrumentator().instrument(app)
-BASE_STATIC_TEMPLATES_DIR = os.path.join("app", "templates", "django_app")
+http_client = HttpClient(
+    limits=httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    ),
+    timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    retries=HTTP_RETRIES,
+    backoff=HTTP_RETRY_BACKOFF,
+    http2=HTTP2,
+)
+artifact_cache = ArtifactCache(ARTIFACT_CACHE_SIZE)
+result_cache = ResultCache(
+    RESULT_CACHE_MEMORY_BYTES, RESULT_CACHE_DIR or None, RESULT_CACHE_DISK_BYTES
+)
+starter_cache = StarterCache(
+    STARTER_CACHE_DIR or None,
+    STARTER_CACHE_TTL,
+    STARTER_CACHE_SIZE,
+    STARTER_CACHE_MAX_STALE,
+    STARTER_CACHE_DISK_SIZE,
+)
+worker_pool = WorkerPool("shared", WORKER_POOL, WORKER_POOL_SIZE, WORKER_POOL_THRESHOLD)
+# Large conversions admitted to the slow lane are always run on its own workers
+slow_worker_pool = WorkerPool("slow_lane", WORKER_POOL, ADMISSION_MAX_LARGE, 0)
+admission = AdmissionController(
+    ADMISSION_POLICY,
+    {
+        "payload_bytes": ADMISSION_MAX_BYTES,
+        "nodes": ADMISSION_MAX_NODES,
+        "edges": ADMISSION_MAX_EDGES,
+        "members": ADMISSION_MAX_MEMBERS,
+    },
+    ADMISSION_MAX_LARGE,
+    ADMISSION_MAX_WAITING,
+)
+# Paths are resolved from the package, so the working directory doesn't matter
 CUR_DIR = os.path.dirname(os.path.realpath(__file__))
-CSS_DIR = os.path.join(CUR_DIR, "templates", "css")
+TEMPLATES_DIR = os.path.join(CUR_DIR, "templates")
+BASE_STATIC_TEMPLATES_DIR = os.path.join(TEMPLATES_DIR, "django_app")
+DJANGO_PROJECT_TEMPLATES_DIR = os.path.join(TEMPLATES_DIR, "django_project")
+CSS_DIR = os.path.join(TEMPLATES_DIR, "css")
+css_styles: dict[Style, CompressedData] = {}
 
 error_counter = Counter(
     "convert_errors_total", "Total number of errors by message", ["error_message"]
@@ -86,245 +188,691 @@ parse_latency = Histogram(
     "parse_latency_seconds", "Histogram of parsing durations in seconds", ["diagram"]
 )
 
+# Django projects used to be written to fixed paths in the working directory, so
+# concurrent conversions failed or overwrote each other. This counts how often that
+# would still happen: "shared" for app/urls.py and app/requirements.txt, which every
+# conversion wrote, and "filename" for <filename>_models.py, which made /convert
+# answer "Please try again later".
+path_collisions = Counter(
+    "convert_path_collisions_total",
+    "Total number of Django conversions that would have collided on a shared path",
+    ["path"],
+)
+django_builds_in_flight: collections.Counter[str] = collections.Counter()
+
+
+def get_content_size(contents: list[list[str]]) -> int:
+    return sum(len(part) for content in contents for part in content)
+
+
+def get_worker_pool() -> WorkerPool:
+    return slow_worker_pool if slow_lane.get() else worker_pool
+
 
 @app.get("/")
 def read_root() -> dict:
     return {"message": "Hello, FastAPI World!"}
 
 
-async def download_file(request: DownloadRequest) -> FileResponse:
-    raw_filename = request.filename
-
+def validate_filename(raw_filename: str):
+    if len(raw_filename) < 3:
+        raise ValueError("File name should have at least 3 characters")
     if "/" in raw_filename or "\\" in raw_filename:
         logger.warning(f"Bad filename: {raw_filename}")
         raise HTTPException(status_code=400, detail="/ not allowed in file name")
 
-    file = raw_filename + request.type + ".py"
-    if os.path.exists(file):
-        logger.warning(f"File already exists: {file}")
-        # TODO: Add to metrics so we can know how many request actually face this problem
-        raise HTTPException(status_code=400, detail="Please try again later")
 
-    async with await anyio.open_file(file, "w") as f:
-        await f.write(request.content)
+class HeldStreamingResponse(StreamingResponse):
+    """
+    Streams a response, and only then releases what is held for it (e.g. an
+    admission), whether the whole body was sent or the client went away
+    """
 
-    logger.info(f"Finished writing: {file}")
-    return file
+    def __init__(
+        self,
+        content: Iterator[bytes],
+        held: AsyncExitStack,
+        media_type: str,
+        headers: dict[str, str],
+    ):
+        super().__init__(content, media_type=media_type, headers=headers)
+        self.__held = held
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.__held.aclose()
 
-@app.post("/convert")
-async def convert(
-    request: ConvertRequest,
-    background_tasks: BackgroundTasks,
+
+def zip_response(
+    content: bytes | Iterator[bytes],
+    filename: str,
+    held: AsyncExitStack | None = None,
 ) -> Response:
-    filenames = request.filename
-    contents = request.content
-    if len(filenames) != len(contents):
+    """
+    Returns the zip as a download. What is held (see HeldStreamingResponse) is
+    released once a streamed zip has been sent.
+    """
+    quoted_filename = quote(filename)
+    if quoted_filename != filename:
+        content_disposition = f"attachment; filename*=utf-8''{quoted_filename}"
+    else:
+        content_disposition = f'attachment; filename="{filename}"'
+    headers = {"Content-Disposition": content_disposition}
+
+    if isinstance(content, bytes):
+        return Response(content=content, media_type="application/zip", headers=headers)
+    if held is not None:
+        return HeldStreamingResponse(content, held, "application/zip", headers)
+    return StreamingResponse(content, media_type="application/zip", headers=headers)
+
+
+@app.post("/convert")
+async def convert(request: ConvertRequest) -> Response:
+    validate_request(request)
+    complexity = measure_request(request)
+
+    project_name = request.project_name
+    try:
+        key = ResultCache.make_key(request) if result_cache.is_enabled() else None
+        zip_content = await result_cache.get(key) if key else None
+
+        if zip_content is None:
+            async with AsyncExitStack() as admitted:
+                await admitted.enter_async_context(admission.admit(complexity))
+                if STREAM_RESPONSE:
+                    # The files are rendered while the zip is sent, so the response
+                    # holds the admission until then
+                    return zip_response(
+                        await stream_project(request),
+                        project_name + ".zip",
+                        admitted.pop_all(),
+                    )
+                zip_content = await build_and_cache_project(request, key)
+
+        return zip_response(finish_project(request, zip_content), project_name + ".zip")
+
+    except Exception as ex:
+        raise to_http_exception(ex)
+
+
+@app.post("/convert/batch")
+async def convert_batch(requests: list[ConvertRequest]) -> Response:
+    """
+    Converts many projects at once and returns a zip of their zips
+
+    Every project is converted as if it was sent to /convert, and the projects are
+    converted concurrently. A project that fails doesn't fail the whole batch.
+    Instead, batch.json in the returned zip lists the status of every project, with
+    the error and its category for the ones that failed.
+    """
+    if len(requests) > BATCH_MAX_PROJECTS:
         raise HTTPException(
-            status_code=400, detail="number of Filename and Content is incosistent"
+            status_code=413,
+            detail=f"A batch can contain at most {BATCH_MAX_PROJECTS} projects",
         )
 
-    project_name = request.project_name
+    # Identical projects in the same batch are only built once
+    builds: dict[str, list[int]] = {}
+    for index, request in enumerate(requests):
+        builds.setdefault(ResultCache.make_key(request), []).append(index)
+
+    results: list[bytes | HTTPException] = [b""] * len(requests)
+    limiter = anyio.CapacityLimiter(BATCH_CONCURRENCY)
+
+    async def convert_item(key: str, indexes: list[int]):
+        async with limiter:
+            request = requests[indexes[0]]
+            try:
+                validate_request(request)
+                complexity = measure_request(request)
+                zip_content = (
+                    await result_cache.get(key) if result_cache.is_enabled() else None
+                )
+                if zip_content is None:
+                    async with admission.admit(complexity):
+                        zip_content = await build_and_cache_project(request, key)
+                for index in indexes:
+                    results[index] = finish_project(requests[index], zip_content)
+            except Exception as ex:
+                for index in indexes:
+                    results[index] = to_http_exception(ex)
+
+    async with anyio.create_task_group() as tg:
+        for key, indexes in builds.items():
+            tg.start_soon(convert_item, key, indexes)
+
+    return zip_response(build_batch_zip(requests, results), "batch.zip")
+
+
+@app.post("/jobs", status_code=202)
+async def create_job(request: ConvertRequest) -> dict:
+    """
+    Queues the conversion of a project and returns its job
+
+    Use this instead of /convert for diagrams that take longer to convert than the
+    timeout of the client or the load balancer. Jobs are already run a few at a
+    time, so large diagrams are accepted here even when /convert rejects them.
+    """
+    validate_request(request)
+    measure_request(request)
+    job = await job_queue.submit(request)
+    return job.to_dict()
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> dict:
+    return (await find_job(job_id)).to_dict()
+
+
+@app.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str) -> Response:
+    job = await find_job(job_id)
+    if job.status == "failed":
+        raise HTTPException(
+            status_code=job.error["status_code"], detail=job.error["detail"]
+        )
+    if job.status != "done":
+        raise HTTPException(status_code=409, detail="Job is not finished yet")
+
+    result = await job_queue.get_result(job)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return zip_response(result, job.request.project_name + ".zip")
+
+
+async def find_job(job_id: str) -> Job:
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+async def run_job(job: Job) -> bytes:
+    request = job.request
     try:
-        if request.project_type == "django":
-            tmp_zip_path = await convert_django(
-                project_name, filenames, contents, request.style_theme
-            )
+        key = ResultCache.make_key(request) if result_cache.is_enabled() else None
+        zip_content = await result_cache.get(key) if key else None
+        if zip_content is None:
+            zip_content = await build_project(request, job)
+            if key:
+                await result_cache.put(key, zip_content)
+        return finish_project(request, zip_content)
+
+    except Exception as ex:
+        raise to_http_exception(ex)
+
+
+job_queue = JobQueue(
+    run_job, JOB_WORKERS, JOB_MAX_QUEUED, JOB_MAX_FINISHED, JOB_TTL, JOB_DB_PATH or None
+)
+
+
+def build_batch_zip(
+    requests: list[ConvertRequest], results: list[bytes | HTTPException]
+) -> bytes:
+    # The projects are already compressed, so they are stored as they are
+    archive = ZipArchive(compression=zipfile.ZIP_STORED)
+    manifest = []
+    for index, (request, result) in enumerate(zip(requests, results)):
+        item = {"index": index, "project_name": request.project_name}
+        if isinstance(result, HTTPException):
+            item["status"] = "error"
+            item["status_code"] = result.status_code
+            item["detail"] = result.detail
+            item["category"] = translate_to_cat(str(result.detail))
         else:
-            tmp_zip_path = await convert_spring(
-                project_name.lower(), request.group_id.lower(), filenames, contents
-            )
-        background_tasks.add_task(remove_file, tmp_zip_path)
+            item["status"] = "ok"
+            item["filename"] = get_batch_arcname(request, archive.namelist())
+            archive.writestr(item["filename"], result)
+        manifest.append(item)
+
+    archive.writestr("batch.json", json.dumps(manifest, indent=2))
+    return archive.build()
+
+
+def get_batch_arcname(request: ConvertRequest, used: list[str]) -> str:
+    arcname = f"{request.project_name}.zip"
+    suffix = 1
+    while arcname in used:
+        suffix += 1
+        arcname = f"{request.project_name}-{suffix}.zip"
+    return arcname
+
 
-        return FileResponse(
-            path=tmp_zip_path,
-            filename=project_name + ".zip",
-            media_type="application/zip",
+def validate_request(request: ConvertRequest):
+    if len(request.filename) != len(request.content):
+        raise HTTPException(
+            status_code=400, detail="number of Filename and Content is incosistent"
         )
 
-    except ValueError as ex:
-        ex_str = str(ex)
+
+def to_http_exception(ex: Exception) -> HTTPException:
+    """Logs an error of a conversion and returns the response to send for it"""
+    if isinstance(ex, HTTPException):
+        return ex
+
+    ex_str = str(ex)
+    if isinstance(ex, ValueError):
         error_counter.labels(error_message=translate_to_cat(ex_str)).inc()
         logger.warning(
-            "Error occurred at parsing: " + ex_str.replace("\n", " "), exc_info=True
+            "Error occurred at parsing: " + ex_str.replace("\n", " "), exc_info=ex
         )
-        raise HTTPException(status_code=422, detail=ex_str)
+        return HTTPException(status_code=422, detail=ex_str)
 
-    except HTTPException:
-        raise
+    logger.warning("Unknown error occured: " + ex_str.replace("\n", " "), exc_info=ex)
+    return HTTPException(
+        status_code=500,
+        detail=f"Unknown error occured: {ex_str}\nPlease try again later",
+    )
 
-    except Exception as ex:
-        ex_str = str(ex)
-        logger.warning(
-            "Unknown error occured: " + ex_str.replace("\n", " "), exc_info=True
+
+async def build_and_cache_project(request: ConvertRequest, key: str | None) -> bytes:
+    zip_content = await build_project(request)
+    if key and result_cache.is_enabled():
+        await result_cache.put(key, zip_content)
+    return zip_content
+
+
+def finish_project(request: ConvertRequest, zip_content: bytes) -> bytes:
+    """Adds the files that must be different for every download"""
+    if request.project_type == "django":
+        return add_django_settings(zip_content, request.project_name)
+    return zip_content
+
+
+async def build_project(request: ConvertRequest, job: Job | None = None) -> bytes:
+    """
+    Returns the zip of the requested project, without the files that must be
+    different for every download (see add_django_settings)
+
+    If the project is built for a job, its progress is reported to the job.
+    """
+    if request.project_type == "django":
+        return await build_django_project(
+            request.project_name,
+            request.filename,
+            request.content,
+            request.style_theme,
+            job,
         )
-        raise HTTPException(
-            status_code=500,
-            detail=f"Unknown error occured: {ex_str}\nPlease try again later",
+    return await convert_spring(
+        request.project_name.lower(),
+        request.group_id.lower(),
+        request.filename,
+        request.content,
+        job,
+    )
+
+
+async def stream_project(request: ConvertRequest) -> Iterator[bytes]:
+    """
+    Returns the zip of the requested project as an iterator of bytes
+
+    Parsing is done before this function returns, so invalid diagrams are still
+    reported with the proper status code. The files are only rendered and compressed
+    while the response is being sent. The first chunk is produced eagerly, so errors
+    in the first generator are reported the same way.
+    """
+    if request.project_type == "django":
+        entries = await prepare_django(
+            request.project_name, request.filename, request.content, request.style_theme
         )
+        chunks = stream_zip(entries)
+    else:
+        base, entries = await prepare_spring(
+            request.project_name.lower(),
+            request.group_id.lower(),
+            request.filename,
+            request.content,
+        )
+        chunks = stream_zip(entries, base=base)
 
+    # Rendering the first entries can take as long as parsing, so it isn't done on
+    # the event loop either. StopIteration can't be raised through a future.
+    first_chunk = await get_worker_pool().run(
+        get_content_size(request.content), next, chunks, b"", local=True
+    )
+    return itertools.chain([first_chunk], chunks)
+
+
+async def read_style(style: Style) -> CompressedData:
+    # The stylesheets are part of the app, so each one is only read and compressed once
+    css = css_styles.get(style)
+    if css is None:
+        css_file = os.path.join(CSS_DIR, f"{style}.css")
+        async with await anyio.open_file(css_file, "rb") as cssf:
+            css = css_styles[style] = CompressedData(await cssf.read())
+    return css
 
-async def convert_django(
+
+async def prepare_django(
     project_name: str, filenames: list[str], contents: list[list[str]], style: Style
-) -> str:
-    first_fname = filenames[0]
-    tmp_zip = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
-    tmp_zip_path = tmp_zip.name
-    try:
-        fetched = fetch_data(filenames, contents)
-        response_content_models = fetched["models"]
-        response_content_views = fetched["views"]
-        writer_models = fetched["model_element"]
-        writer_requirements = RequirementsElements()
-
-        writer_url = UrlsElement()
-        writer_url.set_classes(writer_models.get_classes())
-
-        await download_file(
-            request=DownloadRequest(
-                filename=first_fname,
-                content=fetched["models"],
-                type="_models",
-            ),
+) -> Iterator[ArchiveEntry]:
+    validate_filename(filenames[0])
+    css = await read_style(style)
+
+    with track_django_build(filenames[0]):
+        return await get_worker_pool().run(
+            get_content_size(contents),
+            iter_django_files,
+            project_name,
+            filenames,
+            contents,
+            css,
+            local=True,
         )
 
-        await download_file(
-            request=DownloadRequest(
-                filename=first_fname,
-                content=fetched["views"],
-                type="_views",
-            ),
+
+async def build_django_project(
+    project_name: str,
+    filenames: list[str],
+    contents: list[list[str]],
+    style: Style,
+    job: Job | None = None,
+) -> bytes:
+    validate_filename(filenames[0])
+    css = await read_style(style)
+
+    # Progress updates of a job can't leave a worker process
+    with track_django_build(filenames[0]):
+        return await get_worker_pool().run(
+            get_content_size(contents),
+            build_django_zip,
+            project_name,
+            filenames,
+            contents,
+            css,
+            job,
+            local=job is not None,
         )
 
-        await writer_requirements.write_to_file("./app")
-        await writer_url.write_to_file("./app")
-        generate_file_to_be_downloaded(
+
+@contextmanager
+def track_django_build(filename: str) -> Iterator[None]:
+    """Counts the Django builds that would have collided (see path_collisions)"""
+    if django_builds_in_flight.total() > 0:
+        path_collisions.labels(path="shared").inc()
+    if django_builds_in_flight[filename] > 0:
+        path_collisions.labels(path="filename").inc()
+
+    django_builds_in_flight[filename] += 1
+    try:
+        yield
+    finally:
+        django_builds_in_flight[filename] -= 1
+        if django_builds_in_flight[filename] == 0:
+            del django_builds_in_flight[filename]
+
+
+def iter_django_files(
+    project_name: str,
+    filenames: list[str],
+    contents: list[list[str]],
+    css: CompressedData,
+    job: Job | None = None,
+) -> Iterator[ArchiveEntry]:
+    """
+    Parses the diagrams right away and returns the files of the Django project,
+    which are only rendered when iterated
+    """
+    fetched = fetch_data(filenames, contents, job)
+
+    return itertools.chain(
+        iter_file_to_be_downloaded(
             project_name=project_name,
-            models=response_content_models,
-            views=response_content_views,
-            writer_models=writer_models,
-            zipfile_path=tmp_zip_path,
-        )
+            models=fetched["models"],
+            views=fetched["views"],
+            writer_models=fetched["model_element"],
+            django_files=fetched.get("django_files"),
+        ),
+        [("static/css/style.css", css)],
+    )
 
-        css_file = os.path.join(CSS_DIR, f"{style}.css")
-        with zipfile.ZipFile(tmp_zip_path, "a") as zipf:
-            async with await anyio.open_file(css_file) as cssf:
-                zipf.writestr("static/css/style.css", await cssf.read())
 
-        tmp_zip.close()
-        return tmp_zip_path
+def build_django_zip(
+    project_name: str,
+    filenames: list[str],
+    contents: list[list[str]],
+    css: CompressedData,
+    job: Job | None = None,
+) -> bytes:
+    """Returns the zip of the Django project without settings.py"""
+    settings_arcname = get_django_settings_arcname(project_name)
+    entries = iter_django_files(project_name, filenames, contents, css, job)
+    archive = ZipArchive()
+    archive.extend(
+        (arcname, data)
+        for arcname, data in (job.track(entries) if job else entries)
+        if arcname != settings_arcname
+    )
+    if job is not None:
+        job.set_stage("zipping")
+    return archive.build()
 
-    except ValueError:
-        tmp_zip.close()
-        remove_file(tmp_zip_path)
-        raise
 
-    except Exception:  # Some other exception that might be missed
-        tmp_zip.close()
-        remove_file(tmp_zip_path)
-        raise
+def get_django_settings_arcname(project_name: str) -> str:
+    return f"{project_name}/settings.py"
 
-    finally:
-        files = [
-            f"{project_name}_models.py",
-            f"{project_name}_views.py",
-            os.path.join("app", "requirements.txt"),
-            os.path.join("app", "urls.py"),
-            f"{first_fname}_models.py",
-            f"{first_fname}_views.py",
-        ]
-        for file in files:
-            if os.path.exists(file):
-                os.remove(file)
 
+def add_django_settings(content: bytes, project_name: str) -> bytes:
+    """
+    Adds settings.py to the zip of a Django project
 
-async def convert_spring(
-    project_name: str, group_id: str, filenames: list[str], contents: list[list[str]]
-) -> str:
+    settings.py contains a random SECRET_KEY, so it is added again for every
+    download, even when the rest of the project comes from the result cache. Only
+    the key is new; the file itself comes from the cached Django skeleton.
+    """
+    settings = render_django_settings(DJANGO_PROJECT_TEMPLATES_DIR, project_name)
+    archive = ZipArchive(base=content)
+    archive.writestr(get_django_settings_arcname(project_name), settings)
+    return archive.build()
+
+
+def validate_package_name(project_name: str, group_id: str):
     package_name = f"{project_name}.{group_id}"
     if not is_valid_java_package_name(package_name):
         msg = f"Invalid Java package name: {package_name}"
         logger.warning(msg)
         raise HTTPException(status_code=400, detail=msg)
 
-    tmp_zip_path = await initialize_springboot_zip(project_name, group_id)
 
-    with zipfile.ZipFile(tmp_zip_path, "a", zipfile.ZIP_DEFLATED) as zipf:
-        # Section to Parse the Class Diagram
-        duplicate_class_method_checker: DuplicateChecker = {}
+async def prepare_spring(
+    project_name: str, group_id: str, filenames: list[str], contents: list[list[str]]
+) -> tuple[bytes, Iterator[ArchiveEntry]]:
+    validate_package_name(project_name, group_id)
+    base = await initialize_springboot_base(project_name, group_id)
+    writer_models = await get_worker_pool().run(
+        get_content_size(contents),
+        parse_spring_models,
+        filenames,
+        contents,
+        local=True,
+    )
 
-    src_path = group_id.replace(".", "/") + "/" + project_name
+    return base, iter_spring_project(project_name, group_id, writer_models, base)
 
-    with zipfile.ZipFile(tmp_zip_path, "a") as zipf:
-        # put swagger config to zip
-        swagger_config_content = generate_swagger_config(group_id, project_name)
-        zipf.writestr(
-            write_springboot_path(src_path, "config", "Swagger"),
-            swagger_config_content,
-            compress_type=zipfile.ZIP_DEFLATED,
-        )
 
-        # put runner to zip
-        windows_runner = generate_springboot_window_runner()
-        linux_runner = generate_springboot_linux_runner()
-        zipf.writestr("run.bat", windows_runner, compress_type=zipfile.ZIP_DEFLATED)
-        zipf.writestr("run.sh", linux_runner, compress_type=zipfile.ZIP_DEFLATED)
+async def convert_spring(
+    project_name: str,
+    group_id: str,
+    filenames: list[str],
+    contents: list[list[str]],
+    job: Job | None = None,
+) -> bytes:
+    validate_package_name(project_name, group_id)
+    base = await initialize_springboot_base(project_name, group_id)
+
+    return await get_worker_pool().run(
+        get_content_size(contents),
+        build_spring_zip,
+        project_name,
+        group_id,
+        filenames,
+        contents,
+        base,
+        job,
+        local=job is not None,
+    )
+
 
-        writer_models = ModelsElements("models.py")
+def build_spring_zip(
+    project_name: str,
+    group_id: str,
+    filenames: list[str],
+    contents: list[list[str]],
+    base: bytes,
+    job: Job | None = None,
+) -> bytes:
+    writer_models = parse_spring_models(filenames, contents)
+    entries = iter_spring_project(
+        project_name,
+        group_id,
+        writer_models,
+        base,
+        job.class_rendered if job is not None else None,
+    )
+    if job is not None:
+        job.start_rendering(len(writer_models.get_classes()))
+        entries = job.track(entries)
 
-        classes = []
-        for file_name, content in zip(filenames, contents):
-            json_content = json.loads(content[0])
-            diagram_type = json_content.get("diagram", None)
+    archive = ZipArchive(base=base)
+    archive.extend(entries)
+    if job is not None:
+        job.set_stage("zipping")
+    return archive.build()
 
-            if diagram_type is None:
-                raise ValueError("Diagram type not found on .jet file")
 
-            if diagram_type == "ClassDiagram":
-                with parse_latency.labels(diagram="UML class").time():
-                    classes = writer_models.parse(json_content, bidirectional=True)
+@record_stages
+def parse_spring_models(
+    filenames: list[str], contents: list[list[str]]
+) -> ModelsElements:
+    duplicate_class_method_checker: DuplicateChecker = {}
+    writer_models = ModelsElements("models.py")
 
-                    process_parsed_class(classes, duplicate_class_method_checker)
-            else:
-                raise ValueError("Given diagram is not Class Diagram")
+    for file_name, content in zip(filenames, contents):
+        with span("decode"):
+            document = DiagramDocument.decode(content[0])
+        diagram_type = document.get_diagram_type()
 
-        model_files = writer_models.print_springboot_style(project_name, group_id)
+        if diagram_type is None:
+            raise ValueError("Diagram type not found on .jet file")
 
-        # Specific line of code to generate HomeController for Swagger Redirection
-        zipf.writestr(
-            write_springboot_path(src_path, "controller", "Home"),
-            render_template(
-                "springboot/HomeController.java.j2",
-                {"group_id": group_id, "project_name": project_name},
-            ),
+        if diagram_type == "ClassDiagram":
+            with parse_latency.labels(diagram="UML class").time():
+                classes = writer_models.parse(document.get_data(), bidirectional=True)
+
+                process_parsed_class(classes, duplicate_class_method_checker)
+        else:
+            raise ValueError("Given diagram is not Class Diagram")
+
+    return writer_models
+
+
+def iter_spring_project(
+    project_name: str,
+    group_id: str,
+    writer_models: ModelsElements,
+    base: bytes,
+    on_class_rendered: Callable[[], None] | None = None,
+) -> Iterator[ArchiveEntry]:
+    # Without a starter.zip, the skeleton of the project is generated here
+    if not base:
+        yield from generate_springboot_skeleton(project_name, group_id)
+    yield from iter_spring_files(
+        project_name, group_id, writer_models, on_class_rendered
+    )
+
+
+def iter_spring_files(
+    project_name: str,
+    group_id: str,
+    writer_models: ModelsElements,
+    on_class_rendered: Callable[[], None] | None = None,
+) -> Iterator[ArchiveEntry]:
+    # The classes are rendered one at a time while the zip is written, so only the
+    # time spent rendering them is added up
+    stages = StageTimer()
+    try:
+        yield from iter_spring_class_files(
+            project_name, group_id, writer_models, stages, on_class_rendered
         )
+    finally:
+        stages.observe()
 
-        for class_object in writer_models.get_classes():
-            if class_object.get_is_public():
-                zipf.writestr(
-                    write_springboot_path(
-                        src_path, "controller", class_object.get_name()
-                    ),
-                    generate_springboot_controller_file(
-                        project_name, class_object, group_id
-                    ),
-                )
 
-            zipf.writestr(
-                write_springboot_path(src_path, "service", class_object.get_name()),
-                generate_service_java(project_name, class_object, group_id),
-            )
+def iter_spring_class_files(
+    project_name: str,
+    group_id: str,
+    writer_models: ModelsElements,
+    stages: StageTimer,
+    on_class_rendered: Callable[[], None] | None = None,
+) -> Iterator[ArchiveEntry]:
+    src_path = group_id.replace(".", "/") + "/" + project_name
+
+    # put swagger config to zip
+    yield (
+        write_springboot_path(src_path, "config", "Swagger"),
+        generate_swagger_config(group_id, project_name),
+    )
+
+    # put runner to zip
+    yield "run.bat", generate_springboot_window_runner()
+    yield "run.sh", generate_springboot_linux_runner()
+
+    # Specific line of code to generate HomeController for Swagger Redirection
+    yield (
+        write_springboot_path(src_path, "controller", "Home"),
+        render_template(
+            "springboot/HomeController.java.j2",
+            {"group_id": group_id, "project_name": project_name},
+        ),
+    )
+
+    # Files of classes that didn't change since a previous conversion are reused
+    classes = writer_models.get_classes()
+    fingerprints = [class_object.get_fingerprint() for class_object in classes]
+    for class_object, fingerprint in zip(classes, fingerprints):
+        class_name = class_object.get_name()
+        key = (fingerprint, project_name, group_id)
+        args = (project_name, class_object, group_id)
+
+        if class_object.get_is_public():
+            with stages.time("render_views"):
+                controller = artifact_cache.get_or_render(
+                    "controller",
+                    key,
+                    functools.partial(generate_springboot_controller_file, *args),
+                )
+            yield write_springboot_path(src_path, "controller", class_name), controller
 
-            zipf.writestr(
-                write_springboot_path(src_path, "model", class_object.get_name()),
-                model_files[class_object.get_name()],
+        with stages.time("render_services"):
+            service = artifact_cache.get_or_render(
+                "service", key, functools.partial(generate_service_java, *args)
             )
-            zipf.writestr(
-                write_springboot_path(src_path, "repository", class_object.get_name()),
-                generate_repository_java(project_name, class_object, group_id),
+        yield write_springboot_path(src_path, "service", class_name), service
+
+        with stages.time("render_models"):
+            model = artifact_cache.get_or_render(
+                "model",
+                key,
+                functools.partial(
+                    writer_models.print_springboot_model,
+                    class_object,
+                    project_name,
+                    group_id,
+                ),
             )
+        yield write_springboot_path(src_path, "model", class_name), model
 
-    return tmp_zip_path
+        with stages.time("render_services"):
+            repository = artifact_cache.get_or_render(
+                "repository", key, functools.partial(generate_repository_java, *args)
+            )
+        yield write_springboot_path(src_path, "repository", class_name), repository
+        if on_class_rendered is not None:
+            on_class_rendered()
 
 
 def write_springboot_path(src_path: str, file: str, class_name: str) -> str:
@@ -352,191 +900,172 @@ def check_duplicate(
     return duplicate_class_method_checker
 
 
-def create_django_project(project_name: str, zipfile_path: str) -> list[str]:
+def iter_django_project(project_name: str) -> Iterator[ArchiveEntry]:
     if not is_valid_python_identifier(project_name):
         raise ValueError("Project name must not contain whitespace or number!")
 
     # write django project template to a dictionary
     files = render_project_django_template(
-        os.path.join("app", "templates", "django_project"),
+        DJANGO_PROJECT_TEMPLATES_DIR,
         {"project_name": project_name},
     )
-    with zipfile.ZipFile(zipfile_path, "w") as zipf:
-        for name, file in files.items():
-            arcname = name if name == "manage.py" else f"{project_name}/{name}"
-            zipf.writestr(
-                arcname, file()
-            )  # file is a lambda function that returns rendered template as str
-    return files
+    for name, file in files.items():
+        arcname = name if name == "manage.py" else f"{project_name}/{name}"
+        # file is a lambda function that returns rendered template as str
+        yield arcname, file()
 
 
-def validate_django_app(project_name: str, app_name: str, zipfile_path: str):
+def validate_django_app(project_name: str, app_name: str):
     if not is_valid_python_identifier(app_name):
         raise ValueError("App name must not contain whitespace!")
     if not is_valid_python_identifier(project_name):
         raise ValueError("Project name must not contain whitespace!")
-    if not os.path.exists(zipfile_path):
-        raise FileNotFoundError(f"File {zipfile_path} does not exist")
 
 
-def create_django_app(
+def iter_django_app(
     project_name: str,
     app_name: str,
-    zipfile_path: str,
     models: str = None,
     views: str = None,
-) -> list[str]:
-    file_names = []
-
-    validate_django_app(project_name, app_name, zipfile_path)
-
-    with zipfile.ZipFile(zipfile_path, "a") as zipf:
-        for file in os.listdir("app/templates/django_app"):
-            # file that use jinja2 template
-            if file == "apps.py.j2":
-                template = render_template(
-                    "django_app/apps.py.j2",
-                    {"app_name": app_name},  # This is where the app name is passed
+) -> Iterator[ArchiveEntry]:
+    validate_django_app(project_name, app_name)
+
+    for file in list_static_dir(BASE_STATIC_TEMPLATES_DIR):
+        # file that use jinja2 template
+        if file == "apps.py.j2":
+            template = render_template(
+                "django_app/apps.py.j2",
+                {"app_name": app_name},  # This is where the app name is passed
+            )
+            yield f"{app_name}/apps.py", template
+        else:  # file that use txt file
+            """
+            Check if the current file is models.txt and if yes, render based on
+            the parsed value in the parameter 'models'
+            """
+            if file == "models.txt" and models is not None:
+                yield f"{app_name}/models.py", models
+
+            # Check if the current file is views.txt and if yes, render based on
+            # the parsed value in the parameter 'views'
+
+            elif file == "views.txt" and views is not None:
+                yield f"{app_name}/views.py", views
+
+            elif file == "__init__.txt":
+                yield f"{app_name}/migrations/__init__.py", ""
+                yield f"{app_name}/__init__.py", ""
+            else:
+                content = read_static_file(
+                    os.path.join(BASE_STATIC_TEMPLATES_DIR, file)
                 )
-                zipf.writestr(f"{app_name}/apps.py", template)
-                file_names.append("apps.py")
-            else:  # file that use txt file
-                """
-                Check if the current file is models.txt and if yes, render based on
-                the parsed value in the parameter 'models'
-                """
-                if file == "models.txt" and models is not None:
-                    zipf.writestr(f"{app_name}/models.py", models)
-
-                # Check if the current file is views.txt and if yes, render based on
-                # the parsed value in the parameter 'views'
-
-                elif file == "views.txt" and views is not None:
-                    zipf.writestr(f"{app_name}/views.py", views)
-
-                elif file == "__init__.txt":
-                    zipf.writestr(f"{app_name}/migrations/__init__.py", "")
-                    zipf.writestr(f"{app_name}/__init__.py", "")
-                else:
-                    with open(os.path.join(BASE_STATIC_TEMPLATES_DIR, file), "r") as f:
-                        content = f.read()
-                        file_name = file.replace(".txt", ".py")
-                        zipf.writestr(f"{app_name}/{file_name}", content)
-            file_names.append(file)
-    return file_names
-
-
-def generate_file_to_be_downloaded(
+                file_name = file.replace(".txt", ".py")
+                yield f"{app_name}/{file_name}", content
+
+
+@functools.cache
+def read_static_file(path: str) -> CompressedData:
+    """
+    Static files are part of the app, so each one is only read and compressed once
+    per process, and its compressed bytes are copied into every project
+    """
+    with open(path, "rb") as f:
+        return CompressedData(f.read())
+
+
+@functools.cache
+def list_static_dir(path: str) -> tuple[str, ...]:
+    return tuple(os.listdir(path))
+
+
+def preload_static_files():
+    """Compresses the static files at startup instead of on the first request"""
+    for file in list_static_dir(BASE_STATIC_TEMPLATES_DIR):
+        if file.endswith(".txt"):
+            read_static_file(os.path.join(BASE_STATIC_TEMPLATES_DIR, file))
+    for path in (
+        ("scripts", "run.sh.txt"),
+        ("scripts", "run.bat.txt"),
+        ("base.html.txt",),
+        ("templatetags", "filter_tag.txt"),
+    ):
+        read_static_file(os.path.join(TEMPLATES_DIR, *path))
+    for style in typing.get_args(Style):
+        with open(os.path.join(CSS_DIR, f"{style}.css"), "rb") as cssf:
+            css_styles[style] = CompressedData(cssf.read())
+
+
+def iter_file_to_be_downloaded(
     project_name: str,
     models: str,
     views: str,
     writer_models: ModelsElements,
-    zipfile_path: str,
-) -> list[str]:
+    django_files: dict | None = None,
+) -> Iterator[ArchiveEntry]:
     """
-    Function to generate the file to be downloaded. This function will create a zip file
-    with the name of the project and add all the files to it.
+    Yields every file of the Django project as soon as it is rendered, so it can be
+    either collected into a ZipArchive or streamed to the user.
+
+    django_files are the files generated for each class by fetch_data(). They are
+    generated here if they aren't given.
     """
+    if django_files is None:
+        django_files = plan_django_files().run(writer_models.get_classes())
     app_name = "main"
-    create_django_project(project_name, zipfile_path)
-    create_django_app(project_name, app_name, zipfile_path, models, views)
-
-    with zipfile.ZipFile(zipfile_path, "a") as zipf:
-        # requirements.txt
-        if not os.path.exists("app/requirements.txt"):
-            raise FileNotFoundError("File requirements.txt does not exist")
-        zipf.write(
-            "app/requirements.txt",
-            arcname="requirements.txt",
-        )
-        # urls.py
-        if not os.path.exists("app/urls.py"):
-            raise FileNotFoundError("File urls.py does not exist")
-        zipf.write(
-            "app/urls.py",
-            arcname=f"{app_name}/urls.py",
-        )
-        # script files
-        zipf.write(
-            "app/templates/scripts/run.sh.txt",
-            arcname="run.sh",
-        )
-        zipf.write(
-            "app/templates/scripts/run.bat.txt",
-            arcname="run.bat",
-        )
-        # write frontend files to zip
-
-        # CREATE
-        create_pages = generate_html_create_pages_django(writer_models)
-        for name, page in get_names_from_classes(writer_models, create_pages).items():
-            file_name = f"create_{name.lower()}.html"
-            zipf.writestr(
-                f"{app_name}/templates/{file_name}",
-                data=page,
-            )
+    yield from iter_django_project(project_name)
+    yield from iter_django_app(project_name, app_name, models, views)
 
-        # CREATE FORMS
-        forms_create = generate_forms_create_page_django(writer_models)
-        zipf.writestr(
-            f"{app_name}/forms.py",
-            data=forms_create,
-        )
-        # READ
-        read_pages = generate_html_read_pages_django(writer_models)
-        for name, page in get_names_from_classes(writer_models, read_pages).items():
-            file_name = f"{name.lower()}_list.html"
-            zipf.writestr(
-                f"{app_name}/templates/{file_name}",
-                data=page,
-            )
+    # requirements.txt
+    yield "requirements.txt", RequirementsElements().print_django_style()
 
-        # UPDATE
-        edit_pages = generate_html_edit_pages_django(writer_models)
-        for name, page in get_names_from_classes(writer_models, edit_pages).items():
-            file_name = f"edit_{name.lower()}.html"
-            zipf.writestr(
-                f"{app_name}/templates/{file_name}",
-                data=page,
-            )
+    # urls.py
+    yield f"{app_name}/urls.py", django_files["urls"]
 
-        # landing page
-        landing_page = generate_landing_page_html()
-        zipf.writestr(f"{app_name}/templates/landing_page.html", data=landing_page)
+    # script files
+    yield (
+        "run.sh",
+        read_static_file(os.path.join(TEMPLATES_DIR, "scripts", "run.sh.txt")),
+    )
+    yield (
+        "run.bat",
+        read_static_file(os.path.join(TEMPLATES_DIR, "scripts", "run.bat.txt")),
+    )
 
-        # base.html
-        zipf.write(
-            "app/templates/base.html.txt",
-            arcname="templates/base.html",
-        )
+    # write frontend files to zip
 
-        # Template tags
-        zipf.writestr("main/templatetags/__init__.py", "")
+    # CREATE
+    for name, page in django_files["create_pages"].items():
+        file_name = f"create_{name.lower()}.html"
+        yield f"{app_name}/templates/{file_name}", page
 
-        zipf.write(
-            "app/templates/templatetags/filter_tag.txt",
-            arcname="main/templatetags/filter_tag.py",
-        )
+    # CREATE FORMS
+    yield f"{app_name}/forms.py", django_files["forms"]
 
-        return zipf.namelist()
+    # READ
+    for name, page in django_files["read_pages"].items():
+        file_name = f"{name.lower()}_list.html"
+        yield f"{app_name}/templates/{file_name}", page
 
+    # UPDATE
+    for name, page in django_files["edit_pages"].items():
+        file_name = f"edit_{name.lower()}.html"
+        yield f"{app_name}/templates/{file_name}", page
 
-def get_names_from_classes(
-    writer_models: ModelsElements, pages: list[str]
-) -> dict[str, str]:
-    """
-    Function to get the names of the classes and the pages from the writer_models
-    """
-    classes_dict = {}
-    for page, class_obj in (
-        (page, class_obj)
-        for page in pages
-        for class_obj in writer_models.get_classes()
-        if class_obj.get_name() in page
-    ):
-        classes_dict[class_obj.get_name()] = page
+    # landing page
+    yield f"{app_name}/templates/landing_page.html", generate_landing_page_html()
 
-    return classes_dict
+    # base.html
+    yield (
+        "templates/base.html",
+        read_static_file(os.path.join(TEMPLATES_DIR, "base.html.txt")),
+    )
+
+    # Template tags
+    yield "main/templatetags/__init__.py", ""
+    yield (
+        "main/templatetags/filter_tag.py",
+        read_static_file(os.path.join(TEMPLATES_DIR, "templatetags", "filter_tag.txt")),
+    )
 
 
 def process_parsed_class(
@@ -548,11 +1077,16 @@ def process_parsed_class(
             duplicate_checker[(model_class.get_name(), method.get_name())] = method
 
 
-def fetch_data(filenames: list[str], contents: list[list[str]]) -> dict[str]:
+@record_stages
+def fetch_data(
+    filenames: list[str], contents: list[list[str]], job: Job | None = None
+) -> dict[str]:
     """
     This is the logic from convert() method to process the requested
     files. To use this method, pass the request.filename and request.content
     to the parameter of the method fetch_data()
+
+    The progress of the job, if any, is updated as each class is rendered.
     """
     response_content_models = StringIO()
     response_content_views = StringIO()
@@ -563,22 +1097,26 @@ def fetch_data(filenames: list[str], contents: list[list[str]]) -> dict[str]:
 
     classes = []
     for file_name, content in zip(filenames, contents):
-        json_content = json.loads(content[0])
-        diagram_type = json_content.get("diagram", None)
+        with span("decode"):
+            document = DiagramDocument.decode(content[0])
+        diagram_type = document.get_diagram_type()
 
         if diagram_type is None:
             raise ValueError("Diagram type not found on .jet file")
 
         if diagram_type == "ClassDiagram":
             with parse_latency.labels(diagram="UML class").time():
-                classes = writer_models.parse(json_content)
+                classes = writer_models.parse(document.get_data())
 
                 process_parsed_class(classes, duplicate_class_method_checker)
 
         elif diagram_type == "SequenceDiagram":
-            with parse_latency.labels(diagram="UML sequence").time():
+            with (
+                parse_latency.labels(diagram="UML sequence").time(),
+                span("parse_sequence"),
+            ):
                 seq_parser = ParseJsonToObjectSeq()
-                seq_parser.set_json(content[0])
+                seq_parser.set_json(document.get_data())
                 seq_parser.parse()
                 seq_parser.parse_return_edge()
 
@@ -601,40 +1139,55 @@ def fetch_data(filenames: list[str], contents: list[list[str]]) -> dict[str]:
     for class_method_object in duplicate_class_method_checker.values():
         writer_views.add_class_method(class_method_object)
 
-    # Render the base import
-    response_content_views.write(render_template("base_views.py.j2"))
+    if job is not None:
+        job.start_rendering(len(writer_models.get_classes()))
 
-    response_content_views.write("\n\n")
+    with span("render_models"):
+        response_content_models.write(writer_models.print_django_style())
 
-    # Render the UML Diagrams method
-    response_content_views.write(writer_views.print_django_style())
-    response_content_models.write(writer_models.print_django_style())
+    with span("render_views"):
+        # Render the base import
+        response_content_views.write(render_template("base_views.py.j2"))
 
-    # Render the landing page
-    if classes:
-        response_content_views.write(generate_landing_page_views(classes))
-    response_content_views.write("\n")
+        response_content_views.write("\n\n")
 
-    # Render the create views
-    response_content_views.write(generate_create_page_views(writer_models))
+        # Render the UML Diagrams method
+        response_content_views.write(writer_views.print_django_style())
 
-    # Render the read views
-    response_content_views.write(generate_read_page_views(writer_models))
+        # Render the landing page
+        if classes:
+            response_content_views.write(generate_landing_page_views(classes))
+        response_content_views.write("\n")
 
-    # Render the delete views
-    response_content_views.write(generate_delete_page_views(writer_models))
-
-    # Render the edit views
-    response_content_views.write(generate_edit_page_views(writer_models))
+    # Render the create, read, delete and edit views along with the other files
+    # generated for each class, so the classes are only traversed once
+    with span("render_frontend"):
+        django_files = generate_django_files(
+            writer_models, job.class_rendered if job is not None else None
+        )
+    for views in ("create_views", "read_views", "delete_views", "edit_views"):
+        response_content_views.write(django_files[views])
 
     return {
         "models": response_content_models.getvalue(),
         "views": response_content_views.getvalue(),
         "model_element": writer_models,
+        "django_files": django_files,
     }
 
 
-async def initialize_springboot_zip(project_name: str, group_id: str) -> str:
+async def initialize_springboot_base(project_name: str, group_id: str) -> bytes:
+    """
+    Returns the starter.zip from Spring Initializr, or an empty base if the skeleton
+    of the project is generated locally
+    """
+    if SPRING_SKELETON == "initializr":
+        with span("initializr_fetch"):
+            return await initialize_springboot_zip(project_name, group_id)
+    return b""
+
+
+async def initialize_springboot_zip(project_name: str, group_id: str) -> bytes:
     params = {
         "javaVersion": "21",
         "artifactId": project_name.lower(),
@@ -644,9 +1197,23 @@ async def initialize_springboot_zip(project_name: str, group_id: str) -> str:
         "type": "gradle-project-kotlin",
         "dependencies": SPRING_DEPENDENCIES,
     }
+    key = starter_cache.make_key(params)
+    cached = await starter_cache.get(key)
+    if cached is None:
+        content = await fetch_springboot_zip(params)
+        await starter_cache.put(key, content)
+        return content
+
+    content, fresh = cached
+    if not fresh:
+        # The stale starter.zip is served right away and replaced for later requests
+        starter_cache.refresh(key, functools.partial(fetch_springboot_zip, params))
+    return content
+
+
+async def fetch_springboot_zip(params: dict[str, str]) -> bytes:
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(SPRING_SERVICE_URL + "/starter.zip", params=params)
+        resp = await http_client.get(SPRING_SERVICE_URL + "/starter.zip", params=params)
 
         if resp.status_code != 200:
             raise HTTPException(
@@ -679,6 +1246,4 @@ async def initialize_springboot_zip(project_name: str, group_id: str) -> str:
             detail="Cannot connect to Initializr service. Service might be down.",
         )
 
-    async with anyio.NamedTemporaryFile(suffix=".zip", delete=False) as f:
-        await f.write(content)
-        return f.name
+    return content
@@ -15,9 +15,3 @@ class ConvertRequest(BaseModel):
     project_type: Literal["django", "spring"] = Field(min_length=1, default="django")
     group_id: Optional[str] = Field(min_length=1, default="com.example")
     style_theme: Style = Field(default="modern")
-
-
-class DownloadRequest(BaseModel):
-    filename: str = Field(min_length=3)
-    content: str
-    type: str = ""
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from abc import ABC
 from io import StringIO
 from typing import Optional
@@ -13,6 +15,16 @@ from .properties import FieldObject
 class ClassObject:
     """Represents a single JetUML ClassNode."""
 
+    __slots__ = (
+        "__name",
+        "__parent",
+        "__fields",
+        "__methods",
+        "__relationships",
+        "__is_public",
+        "__id",
+    )
+
     def __init__(self):
         self.__name: str = ""
         self.__parent: Optional[ClassObject] = None
@@ -91,6 +103,45 @@ class ClassObject:
 
         return ctx
 
+    def get_ancestors(self) -> list[ClassObject]:
+        """
+        Returns the parent of the class, the parent of that parent and so on
+
+        A generalization cycle in the diagram ends the list at the first class that
+        would be repeated.
+        """
+        ancestors = []
+        seen = {id(self)}
+        parent = self.__parent
+        while parent is not None and id(parent) not in seen:
+            ancestors.append(parent)
+            seen.add(id(parent))
+            parent = parent.get_parent()
+        return ancestors
+
+    def get_fingerprint(self) -> str:
+        """
+        Returns a hash of everything the class diagram defines for this class
+
+        Two classes with the same fingerprint generate the same per-class files. It
+        covers the name, visibility, fields, methods and relationships of the class
+        and of its ancestors. Method calls from sequence diagrams are not part of it.
+        """
+        content = [
+            class_object.__get_fingerprint_content()
+            for class_object in [self, *self.get_ancestors()]
+        ]
+        return hashlib.sha256(json.dumps(content).encode("utf-8")).hexdigest()
+
+    def __get_fingerprint_content(self) -> list:
+        return [
+            self.__name,
+            self.__is_public,
+            [field.to_fingerprint() for field in self.__fields],
+            [method.to_fingerprint() for method in self.__methods],
+            [relationship.to_fingerprint() for relationship in self.__relationships],
+        ]
+
     def __str__(self) -> str:
         """__str__ method for debugging purposes."""
         return (
@@ -145,6 +196,13 @@ class ClassObject:
 class AbstractRelationshipObject(ABC):
     """Represents JetUML's Association Edge"""
 
+    __slots__ = (
+        "__source_class",
+        "__target_class",
+        "__sourceClassOwnAmount",
+        "__targetClassOwnAmount",
+    )
+
     def __init__(self):
         self.__source_class: Optional[ClassObject] = None
         self.__target_class: Optional[ClassObject] = None
@@ -185,10 +243,21 @@ class AbstractRelationshipObject(ABC):
     def get_target_class_own_amount(self) -> str:  # pragma: no cover
         return self.__targetClassOwnAmount
 
+    def to_fingerprint(self) -> list[str]:
+        return [
+            type(self).__name__,
+            self.__source_class.get_name() if self.__source_class else "",
+            self.__target_class.get_name() if self.__target_class else "",
+            self.__sourceClassOwnAmount,
+            self.__targetClassOwnAmount,
+        ]
+
 
 class OneToOneRelationshipObject(AbstractRelationshipObject):
     """Represents JetUML's AssociationEdge where the the startLabel and endLabel are both '1'"""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -229,6 +298,8 @@ class ManyToOneRelationshipObject(AbstractRelationshipObject):
     cases where startLabel is * and endLabel is *
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -266,6 +337,8 @@ class ManyToOneRelationshipObject(AbstractRelationshipObject):
 class ManyToManyRelationshipObject(AbstractRelationshipObject):
     """Represents JetUML's AssociationEdge where both startLabel and endLabel are '*'"""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -1,16 +1,22 @@
 import logging
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from io import StringIO
 
 import anyio
 
 from app.parse_json_to_object_class import ParseJsonToObjectClass
+from app.tracing import span
 from app.utils import camel_to_snake, render_template
 
 from .diagram import ClassObject
 from .methods import ClassMethodObject, ControllerMethodObject
 
 logger = logging.getLogger("uvicorn.error")
+SCRIPTS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "templates", "scripts"
+)
 
 
 class FileElements(ABC):
@@ -72,8 +78,10 @@ class ModelsElements(FileElements):
 
     def parse(self, content: str, bidirectional: bool = False) -> list[ClassObject]:
         parser = ParseJsonToObjectClass(content)
-        self.__classes = parser.parse_classes()
-        parser.parse_relationships(self.__classes, bidirectional)
+        with span("parse_classes"):
+            self.__classes = parser.parse_classes()
+        with span("parse_relationships"):
+            parser.parse_relationships(self.__classes, bidirectional)
         return self.__classes
 
     """
@@ -123,20 +131,34 @@ class ModelsElements(FileElements):
 
         """
         try:
-            files = {}
-            for model_class in self.__classes:
-                ctx = model_class.to_models_springboot_context()
-                ctx["project_name"] = project_name
-                ctx["group_id"] = group_id
-
-                files[model_class.get_name()] = render_template(
-                    "springboot/model.j2", context=ctx
+            return {
+                model_class.get_name(): model_file
+                for model_class, model_file in zip(
+                    self.__classes, self.iter_springboot_style(project_name, group_id)
                 )
-            return files
+            }
         except Exception as e:
             logger.error(f"Error rendering template: {e}")
             return {}
 
+    def iter_springboot_style(self, project_name: str, group_id: str) -> Iterator[str]:
+        """
+        Yields the rendered model file of each class, in the same order as
+        get_classes(), rendering one class at a time
+        """
+        for model_class in self.__classes:
+            yield self.print_springboot_model(model_class, project_name, group_id)
+
+    @staticmethod
+    def print_springboot_model(
+        model_class: ClassObject, project_name: str, group_id: str
+    ) -> str:
+        ctx = model_class.to_models_springboot_context()
+        ctx["project_name"] = project_name
+        ctx["group_id"] = group_id
+
+        return render_template("springboot/model.j2", context=ctx)
+
 
 class ViewsElements(FileElements):
     """
@@ -281,7 +303,7 @@ class RunBashScriptElements(FileElements):
     """
 
     def print_django_style(self) -> str:
-        with open("app/templates/scripts/run.sh.txt", "r", encoding="utf-8") as file:
+        with open(os.path.join(SCRIPTS_DIR, "run.sh.txt"), encoding="utf-8") as file:
             bash = file.read()
         return bash
 
@@ -293,7 +315,7 @@ class RunBatScriptElements(FileElements):
     """
 
     def print_django_style(self) -> str:
-        with open("app/templates/scripts/run.bat.txt", "r", encoding="utf-8") as file:
+        with open(os.path.join(SCRIPTS_DIR, "run.bat.txt"), encoding="utf-8") as file:
             bat = file.read()
         return bat
 
@@ -321,11 +343,12 @@ class DependencyElements(FileElements):
         }
         return "\n".join(f"{key}={value}" for key, value in config.items()) + "\n"
 
-    def print_springboot_style(self, project_name: str) -> str:
+    def print_springboot_style(self, project_name: str, group_id: str = "") -> str:
         context = {
             "project_name": project_name,
-            "java": "21",
-            "spring_boot": "3.4",
+            "group_id": group_id or project_name,
+            "java_version": "21",
+            "spring_boot_version": "3.4.4",
             "dependencies": [
                 "org.springframework.boot:spring-boot-starter-thymeleaf",
                 "org.springframework.boot:spring-boot-starter-web",
@@ -336,14 +359,13 @@ class DependencyElements(FileElements):
                 "org.xerial:sqlite-jdbc:3.41.2.2",
                 "jakarta.persistence:jakarta.persistence-api:3.1.0",
                 "org.springdoc:springdoc-openapi-starter-webmvc-ui:2.2.0",
-                "org.hibernate:hibernate-core:5.6.9.Final",
-                "org.xerial:sqlite-jdbc:3.41.2.2",
+                "org.hibernate.orm:hibernate-core",
                 "org.hibernate.orm:hibernate-community-dialects",
             ],
             "repositories": [
                 "mavenCentral()",
-                "maven { url 'https://repo.spring.io/milestone' }",
-                "maven { url 'https://repo.spring.io/release' }",
+                'maven { url = uri("https://repo.spring.io/milestone") }',
+                'maven { url = uri("https://repo.spring.io/release") }',
             ],
         }
         try:
@@ -19,6 +19,8 @@ class AbstractMethodObject(ABC):
     The name is AbstractMethodObject to indicate that this class is not to be instanciated.
     """
 
+    __slots__ = ("__name", "__parameters", "__return_type", "__modifier")
+
     def __init__(self):
         self.__name: str = ""
         self.__parameters: list[ParameterObject] = []
@@ -73,6 +75,14 @@ class AbstractMethodObject(ABC):
     def get_modifier(self) -> str:
         return self.__modifier
 
+    def to_fingerprint(self) -> list:
+        return [
+            self.__modifier,
+            self.__name,
+            self.__return_type.get_name() if self.__return_type else None,
+            [parameter.to_fingerprint() for parameter in self.__parameters],
+        ]
+
 
 class ClassMethodObject(AbstractMethodObject):
     """
@@ -81,6 +91,8 @@ class ClassMethodObject(AbstractMethodObject):
     Its counterpart is the ControllerMethodObject class
     """
 
+    __slots__ = ("__calls",)
+
     PYTHON_TYPE_MAPPING = {
         "boolean": "bool",
         "string": "str",
@@ -305,6 +317,8 @@ class ControllerMethodObject(AbstractMethodObject):
     Its counterpart is the ClassMethodObject class
     """
 
+    __slots__ = ("__calls",)
+
     def __init__(self):
         super().__init__()
         self.__calls: list[AbstractMethodCallObject] = []
@@ -357,6 +371,8 @@ class AbstractMethodCallObject(ABC):
     The name AbstractMethodCallObject is to indicate that this class is not to be instanciated.
     """
 
+    __slots__ = ("__method", "__arguments", "__return_var_name", "__condition")
+
     def __init__(self):
         self.__method: Optional[AbstractMethodObject] = None
         self.__arguments: list[ArgumentObject] = []
@@ -484,6 +500,8 @@ class AbstractMethodCallObject(ABC):
 class ClassMethodCallObject(AbstractMethodCallObject):
     """Represents a method call of a ClassMethod"""
 
+    __slots__ = ("__caller", "__instance_name")
+
     def __init__(self):
         super().__init__()
         self.__caller: Optional[ClassMethodObject] = None
@@ -519,6 +537,8 @@ class ClassMethodCallObject(AbstractMethodCallObject):
 class ControllerMethodCallObject(AbstractMethodCallObject):
     """Represents a method call of a ControllerMethod"""
 
+    __slots__ = ("__caller",)
+
     def __init__(self):
         super().__init__()
         self.__caller: Optional[ControllerMethodObject] = None
@@ -534,6 +554,8 @@ class ControllerMethodCallObject(AbstractMethodCallObject):
 class ArgumentObject:
     """Represents an argument in a method call"""
 
+    __slots__ = ("__method_object", "__name", "__type")
+
     def __init__(self):
         self.__method_object: Optional[AbstractMethodCallObject] = None
         self.__name: str = ""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from copy import deepcopy
 from typing import Optional
 
@@ -15,6 +16,8 @@ class TypeObject:
     This class is not framework specific. Instead, it contains methods which return a string
     representation of the datatype according to a specific framework."""
 
+    __slots__ = ("__name",)
+
     def __init__(self):
         self.__name = ""
 
@@ -25,7 +28,8 @@ class TypeObject:
             name = "int"
         elif name.lower() == "boolean":
             name = "bool"
-        self.__name = name
+        # The same few type names are repeated by every field of every diagram
+        self.__name = sys.intern(name)
 
     def to_models_code(self) -> str:
         return self.__name.title()
@@ -53,6 +57,8 @@ class FieldObject:
     string representation of the datatype according to a specific framework."
     """
 
+    __slots__ = ("__name", "__type", "__modifier")
+
     DJANGO_TYPE_MAPPING = {
         "boolean": "models.BooleanField()",
         "String": MODELS_CHARFIELD,
@@ -118,6 +124,13 @@ class FieldObject:
             )
         self.__modifier = modifier
 
+    def to_fingerprint(self) -> list[str | None]:
+        return [
+            self.__name,
+            self.__type.get_name() if self.__type else None,
+            self.__modifier,
+        ]
+
     def to_models_code(self) -> str:
         field_type = self.__type.to_models_code().lower()
 
@@ -163,6 +176,8 @@ class ParameterObject:
     string representation of the datatype according to a specific framework."
     """
 
+    __slots__ = ("__name", "__type")
+
     def __init__(self):
         self.__name: str = ""
         self.__type: Optional[TypeObject] = None
@@ -242,6 +257,9 @@ class ParameterObject:
     def get_name(self) -> str:
         return self.__name
 
+    def to_fingerprint(self) -> list[str | None]:
+        return [self.__name, self.__type.get_name() if self.__type else None]
+
     def __copy__(self) -> ParameterObject:
         copy = ParameterObject()
         copy.set_name(self.__name)
@@ -1,6 +1,8 @@
 import json
 import re
 
+from app.diagram_document import loads_json
+from app.diagram_schema import SchemaValidationError, class_diagram_validator
 from app.models.diagram import (
     ClassObject,
 )
@@ -16,6 +18,9 @@ from app.parse_class_pattern.parse_relationship_strategy import (
 
 from .utils import is_valid_python_identifier
 
+# Errors of parsing a diagram that doesn't have the expected structure
+MALFORMED_DIAGRAM_ERRORS = (KeyError, IndexError, TypeError, AttributeError)
+
 
 class ParseJsonToObjectClass:
     # This regex will match anything that starts with + or -
@@ -30,7 +35,7 @@ class ParseJsonToObjectClass:
 
         if isinstance(data, str):
             try:
-                self.__json = json.loads(data)
+                self.__json = loads_json(data)
             except json.JSONDecodeError:
                 raise ValueError("Error: Invalid JSON format")
         self.__classes = []
@@ -43,23 +48,39 @@ class ParseJsonToObjectClass:
                 "Nodes not found in the json, \nplease make sure the file isn't corrupt"
             )
 
-        # iterate all class in json
-        for object in data["nodes"]:
-            class_obj = self.__create_class(object)
+        try:
+            # iterate all class in json
+            for object in data["nodes"]:
+                class_obj = self.__create_class(object)
 
-            self.__add_methods_to_class(object, class_obj)
+                self.__add_methods_to_class(object, class_obj)
 
-            self.__add_attributes_to_class(object, class_obj)
+                self.__add_attributes_to_class(object, class_obj)
 
-            self.__classes.append(class_obj)
+                self.__classes.append(class_obj)
+        except MALFORMED_DIAGRAM_ERRORS:
+            self.__raise_schema_violations()
+            raise
 
         return self.__classes
 
     def parse_relationships(
         self, classes: list[ClassObject], bidirectional: bool = False
     ) -> list[ClassObject]:
-        edges = self.__json["edges"]
+        # Older clients leave out the edges of a diagram without relationships
+        edges = self.__json.get("edges", [])
+
+        try:
+            self.__add_relationships(edges, classes, bidirectional)
+        except MALFORMED_DIAGRAM_ERRORS:
+            self.__raise_schema_violations()
+            raise
+
+        return classes
 
+    def __add_relationships(
+        self, edges: list[dict], classes: list[ClassObject], bidirectional: bool
+    ) -> None:
         for edge in edges:
             class_from_id = classes[edge["start"]]
             class_to_id = classes[edge["end"]]
@@ -81,7 +102,20 @@ class ParseJsonToObjectClass:
                 edge, class_from_id, class_to_id, bidirectional
             )
 
-        return classes
+    def __raise_schema_violations(self) -> None:
+        """
+        Raises SchemaValidationError with every violation of the class diagram schema
+
+        The schema is only checked once parsing has failed, so valid diagrams don't
+        pay for it. Nothing is raised if the diagram matches the schema.
+        """
+        violations = class_diagram_validator.validate(self.__json)
+        if violations:
+            raise SchemaValidationError(
+                "The .class.jet is not valid. \n"
+                "Please make sure the file submitted is not corrupt",
+                violations,
+            )
 
     def __create_class(self, object: dict) -> ClassObject:
         if object["name"] == "":
@@ -2,9 +2,12 @@ import json
 import re
 from typing import TypedDict
 
-from jsonschema import validate
-from jsonschema.exceptions import ValidationError
-
+from app.diagram_document import loads_json
+from app.diagram_schema import (
+    SchemaValidationError,
+    SchemaViolation,
+    sequence_diagram_validator,
+)
 from app.models.diagram import ClassObject
 from app.models.methods import (
     AbstractMethodCallObject,
@@ -33,10 +36,12 @@ class ParseJsonToObjectSeq:
 
     def __init__(self):
         self.__json = None
+        self.__violations: list[SchemaViolation] = []
         self.__class_object: dict[str, ClassObject] = dict()
         self.__controller_method: list[ControllerMethodObject] = []
         self.__call_nodes: dict[str, CallNode] = dict()
         self.__edges: list = []
+        self.__edges_by_type: dict[str, list[dict]] = dict()
         self.__implicit_parameter_nodes: dict[str, str | int | list[int]] = dict()
         self.__method_call: dict[tuple, dict] = dict()
         self.__label_pattern = re.compile(
@@ -44,18 +49,19 @@ class ParseJsonToObjectSeq:
             r"[ ]?\((?P<params>.*)?\)( -> (?P<ret_var>.*))?$"
         )
 
-    def set_json(self, data: str) -> str | None:
+    def set_json(self, data: str | dict) -> str | None:
         try:
-            data_json = json.loads(data)
+            data_json = loads_json(data) if isinstance(data, str) else data
 
             if self.validate_json(data_json):
                 self.__json = data_json
                 return "Success"
 
             else:
-                raise ValueError(
+                raise SchemaValidationError(
                     "The .sequence.jet is not valid. \n"
-                    "Please make sure the file submitted is not corrupt"
+                    "Please make sure the file submitted is not corrupt",
+                    self.__violations,
                 )
 
         except json.JSONDecodeError:
@@ -65,55 +71,11 @@ class ParseJsonToObjectSeq:
             )
 
     def validate_json(self, data: object) -> bool:
-        schema = {
-            "type": "object",
-            "required": ["diagram", "nodes", "edges", "version"],
-            "properties": {
-                "diagram": {"type": "string", "enum": ["SequenceDiagram"]},
-                "nodes": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "required": ["id", "type"],
-                        "properties": {
-                            "id": {"type": "integer"},
-                            "type": {
-                                "type": "string",
-                                "enum": ["ImplicitParameterNode", "CallNode"],
-                            },
-                            "name": {"type": "string"},
-                            "children": {"type": "array", "items": {"type": "integer"}},
-                            "x": {"type": "integer"},
-                            "y": {"type": "integer"},
-                        },
-                    },
-                },
-                "edges": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "required": ["start", "end", "type"],
-                        "properties": {
-                            "start": {"type": "integer"},
-                            "end": {"type": "integer"},
-                            "type": {
-                                "type": "string",
-                                "enum": ["CallEdge", "ReturnEdge", "ConstructorEdge"],
-                            },
-                            "middleLabel": {"type": "string"},
-                            "signal": {"type": "boolean"},
-                        },
-                    },
-                },
-                "version": {"type": "string"},
-            },
-        }
-        try:
-            validate(instance=data, schema=schema)
-            return True
+        self.__violations = sequence_diagram_validator.validate(data)
+        return not self.__violations
 
-        except ValidationError:
-            return False
+    def get_violations(self) -> list[SchemaViolation]:  # pragma: no cover
+        return self.__violations
 
     def get_method_call(self) -> dict:  # pragma: no cover
         return self.__method_call
@@ -130,6 +92,9 @@ class ParseJsonToObjectSeq:
     def get_edges(self) -> list:  # pragma: no cover
         return self.__edges
 
+    def get_edges_of_type(self, edge_type: str) -> list[dict]:
+        return self.__edges_by_type.get(edge_type, [])
+
     def get_implicit_parameter_nodes(self) -> dict:  # pragma: no cover
         return self.__implicit_parameter_nodes
 
@@ -185,9 +150,15 @@ class ParseJsonToObjectSeq:
             end_id = edge.get("end")
             label = edge.get("middleLabel", "").strip()
 
-            self.__edges.append(
-                {"type": edge_type, "start": start_id, "end": end_id, "label": label}
-            )
+            edge_info = {
+                "type": edge_type,
+                "start": start_id,
+                "end": end_id,
+                "label": label,
+            }
+            # Every pass only needs one type of edge, so they are bucketed once here
+            self.__edges.append(edge_info)
+            self.__edges_by_type.setdefault(edge_type, []).append(edge_info)
             key_tuple = (start_id, end_id)
             self.__method_call[key_tuple] = {
                 "end": end_id,
@@ -273,42 +244,52 @@ please consult the user manual document on how to name return variables"
         method_call_dictionary["method"] = method
 
     def process_edge_into_classobject(self):
-        for edge in self.__edges:
-            if edge["type"] == "CallEdge":
-                start_id = edge["start"]
-                end_id = edge["end"]
-                parent_id = self.__call_nodes[end_id]["parent"]
-                class_name = self.__implicit_parameter_nodes[parent_id]["class_name"]
-                class_obj = self.__class_object[class_name]
+        for edge in self.get_edges_of_type("CallEdge"):
+            start_id = edge["start"]
+            end_id = edge["end"]
+            parent_id = self.__call_nodes[end_id]["parent"]
+            class_name = self.__implicit_parameter_nodes[parent_id]["class_name"]
+            class_obj = self.__class_object[class_name]
 
-                if class_name == "views":
-                    method = ControllerMethodObject()
+            if class_name == "views":
+                method = ControllerMethodObject()
 
-                else:
-                    method = ClassMethodObject()
+            else:
+                method = ClassMethodObject()
 
-                self.__call_nodes[end_id]["method"] = method
-                self.__call_nodes[end_id]["caller"] = start_id
+            self.__call_nodes[end_id]["method"] = method
+            self.__call_nodes[end_id]["caller"] = start_id
 
-                self.process_regex_into_object(
-                    edge, method, start_id, end_id, class_name, class_obj
-                )
+            self.process_regex_into_object(
+                edge, method, start_id, end_id, class_name, class_obj
+            )
 
-    def process_self_call(
-        self, caller_id: str, callee_id: str, rev_call_tree: dict, call_node: CallNode
-    ):
+    def is_self_call(self, caller_id: int, call_node: CallNode) -> bool:
         caller_parent = self.__call_nodes[caller_id]["parent"]
         callee_parent = call_node["parent"]
         caller_class = self.__implicit_parameter_nodes[caller_parent]["class_name"]
         callee_class = self.__implicit_parameter_nodes[callee_parent]["class_name"]
-        if caller_class == callee_class:
-            rev_call_tree[callee_id] = caller_id
-            call_depth = self.check_call_depth(rev_call_tree, callee_id)
-            if call_depth > self.ALLOWED_SELF_CALL_DEPTH:
-                raise ValueError(
-                    "Too deep self calls on a sequence diagram! \n"
-                    f"The maximum allowed is {self.ALLOWED_SELF_CALL_DEPTH}"
-                )
+        return caller_class == callee_class
+
+    def process_self_calls(self, valid_caller: set[int]):
+        """
+        Raises a ValueError if a chain of self calls is deeper than
+        ALLOWED_SELF_CALL_DEPTH, or if self calls call each other in a loop
+        """
+        rev_call_tree: dict[int, int] = {}
+        for edge in self.get_edges_of_type("CallEdge"):
+            callee_id = edge["end"]
+            call_node = self.__call_nodes[callee_id]
+            caller_id = call_node.get("caller", None)
+            if caller_id in valid_caller and self.is_self_call(caller_id, call_node):
+                rev_call_tree[callee_id] = caller_id
+
+        call_depths = self.get_call_depths(rev_call_tree)
+        if any(depth > self.ALLOWED_SELF_CALL_DEPTH for depth in call_depths.values()):
+            raise ValueError(
+                "Too deep self calls on a sequence diagram! \n"
+                f"The maximum allowed is {self.ALLOWED_SELF_CALL_DEPTH}"
+            )
 
     def add_argument_object(
         self, callee_method: str, call_obj: AbstractMethodCallObject
@@ -353,56 +334,73 @@ please consult the user manual document on how to name return variables"
         self.process_edge_json(valid_caller)
         self.process_edge_into_classobject()
 
-        rev_call_tree = {}
-        for edge in self.__edges:
-            if edge["type"] == "CallEdge":
-                callee_id = edge["end"]
-                call_node = self.__call_nodes[callee_id]
-                caller_id = call_node.get("caller", None)
-                if caller_id not in valid_caller:
-                    continue
+        self.process_self_calls(valid_caller)
 
-                self.process_self_call(caller_id, callee_id, rev_call_tree, call_node)
+        for edge in self.get_edges_of_type("CallEdge"):
+            callee_id = edge["end"]
+            call_node = self.__call_nodes[callee_id]
+            caller_id = call_node.get("caller", None)
+            if caller_id not in valid_caller:
+                continue
 
-                caller_method = self.__call_nodes[caller_id]["method"]
-                callee_method = call_node["method"]
-                ret_var = call_node.get("ret_var", None)
+            caller_method = self.__call_nodes[caller_id]["method"]
+            callee_method = call_node["method"]
+            ret_var = call_node.get("ret_var", None)
 
-                method_call_dictionary = self.__method_call[(caller_id, callee_id)]
+            method_call_dictionary = self.__method_call[(caller_id, callee_id)]
 
-                call_obj = self.process_call_obj(
-                    caller_method, callee_method, method_call_dictionary, callee_id
-                )
+            call_obj = self.process_call_obj(
+                caller_method, callee_method, method_call_dictionary, callee_id
+            )
 
-                method_call_dictionary["method_call"] = call_obj
+            method_call_dictionary["method_call"] = call_obj
 
-                self.add_argument_object(callee_method, call_obj)
+            self.add_argument_object(callee_method, call_obj)
 
-                if ret_var is not None:
-                    call_obj.set_return_var_name(ret_var)
+            if ret_var is not None:
+                call_obj.set_return_var_name(ret_var)
 
-                if isinstance(caller_method, ClassMethodObject):
-                    caller_method.add_class_method_call(call_obj)
-                else:
-                    caller_method.add_call(call_obj)
-
-    def check_call_depth(
-        self, rev_call_tree: dict[int, int], callee: int
-    ) -> int | float:
-        depth = 0
-        visited = set()
-        caller = rev_call_tree[callee]
-        while caller > 0:
-            if caller in visited:
-                return float("inf")
-            visited.add(caller)
-            caller = rev_call_tree.get(caller, -1)
-            depth += 1
-        return depth
+            if isinstance(caller_method, ClassMethodObject):
+                caller_method.add_class_method_call(call_obj)
+            else:
+                caller_method.add_call(call_obj)
+
+    def get_call_depths(self, rev_call_tree: dict[int, int]) -> dict[int, int | float]:
+        """
+        Returns the number of self calls leading to every callee of rev_call_tree,
+        which maps each self call to its caller
+
+        Each depth is the depth of the caller plus one, so every call is only walked
+        once and the whole tree takes linear time. Calls in a loop, and the calls
+        leading to one, are infinitely deep.
+        """
+        depths: dict[int, int | float] = {}
+        for callee in rev_call_tree:
+            path = []
+            on_path = set()
+            call = callee
+            while (
+                call > 0
+                and call in rev_call_tree
+                and call not in depths
+                and call not in on_path
+            ):
+                path.append(call)
+                on_path.add(call)
+                call = rev_call_tree[call]
+
+            if call in on_path:
+                for node in path:
+                    depths[node] = float("inf")
+                continue
+            for node in reversed(path):
+                caller = rev_call_tree[node]
+                depths[node] = 0 if caller <= 0 else depths.get(caller, 0) + 1
+        return depths
 
     def parse_return_edge(self) -> list:
         return_vars = []
-        for edge in (e for e in self.__edges if e["type"] == "ReturnEdge"):
+        for edge in self.get_edges_of_type("ReturnEdge"):
             label = edge["label"].strip()
             if not is_valid_python_identifier(label):
                 raise ValueError(
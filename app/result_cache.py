@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+import anyio
+from prometheus_client import Counter, Gauge
+
+from app.model import ConvertRequest
+from app.utils import logger
+
+result_cache_lookups = Counter(
+    "result_cache_lookups_total",
+    "Total number of /convert result cache lookups by the tier that answered",
+    ["result"],
+)
+result_cache_evictions = Counter(
+    "result_cache_evictions_total",
+    "Total number of entries evicted from the /convert result cache",
+    ["tier"],
+)
+result_cache_memory_bytes = Gauge(
+    "result_cache_memory_bytes", "Size of the zips kept in the memory tier"
+)
+
+
+class ResultCache:
+    """
+    Cache of the zips built for /convert requests
+
+    Entries are keyed by the hash of every request field that changes the output.
+    The most recently used zips are kept in memory up to max_memory_bytes. If a
+    directory is given, zips are also stored there as <key>.zip up to
+    max_disk_bytes, and the least recently used files are removed first.
+
+    The cached zips must not contain files that have to differ between downloads,
+    e.g. Django's settings.py with its SECRET_KEY. Those are added by the caller.
+    """
+
+    def __init__(
+        self, max_memory_bytes: int, directory: str | None, max_disk_bytes: int
+    ):
+        self.__max_memory_bytes = max_memory_bytes
+        self.__directory = directory
+        self.__max_disk_bytes = max_disk_bytes
+        self.__entries: OrderedDict[str, bytes] = OrderedDict()
+        self.__memory_bytes = 0
+
+    @staticmethod
+    def make_key(request: ConvertRequest) -> str:
+        fields = request.model_dump(
+            include={
+                "filename",
+                "content",
+                "project_name",
+                "project_type",
+                "group_id",
+                "style_theme",
+            }
+        )
+        encoded = json.dumps(fields, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def is_enabled(self) -> bool:
+        return self.__max_memory_bytes > 0 or self.__directory is not None
+
+    async def get(self, key: str) -> bytes | None:
+        content = self.__entries.get(key)
+        if content is not None:
+            self.__entries.move_to_end(key)
+            result_cache_lookups.labels(result="memory").inc()
+            return content
+
+        if self.__directory is not None:
+            content = await anyio.to_thread.run_sync(self.__read, key)
+            if content is not None:
+                self.__remember(key, content)
+                result_cache_lookups.labels(result="disk").inc()
+                return content
+
+        result_cache_lookups.labels(result="miss").inc()
+        return None
+
+    async def put(self, key: str, content: bytes):
+        self.__remember(key, content)
+        if self.__directory is not None:
+            await anyio.to_thread.run_sync(self.__write, key, content)
+
+    def __remember(self, key: str, content: bytes):
+        if len(content) > self.__max_memory_bytes:
+            return
+        if key in self.__entries:
+            self.__memory_bytes -= len(self.__entries.pop(key))
+        self.__entries[key] = content
+        self.__memory_bytes += len(content)
+
+        while self.__memory_bytes > self.__max_memory_bytes:
+            _, evicted = self.__entries.popitem(last=False)
+            self.__memory_bytes -= len(evicted)
+            result_cache_evictions.labels(tier="memory").inc()
+        result_cache_memory_bytes.set(self.__memory_bytes)
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.__directory, f"{key}.zip")
+
+    def __read(self, key: str) -> bytes | None:
+        path = self.__path(key)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+            # The modification time is used to find the least recently used files
+            os.utime(path)
+            return content
+        except OSError:
+            return None
+
+    def __write(self, key: str, content: bytes):
+        if len(content) > self.__max_disk_bytes:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(self.__directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, self.__path(key))
+            self.__evict_from_disk()
+        except OSError as ex:
+            logger.warning(f"Failed to cache result on disk: {ex}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def __evict_from_disk(self):
+        files = [
+            entry
+            for entry in os.scandir(self.__directory)
+            if entry.is_file() and entry.name.endswith(".zip")
+        ]
+        total = sum(entry.stat().st_size for entry in files)
+        for entry in sorted(files, key=lambda entry: entry.stat().st_mtime):
+            if total <= self.__max_disk_bytes:
+                break
+            total -= entry.stat().st_size
+            os.remove(entry.path)
+            result_cache_evictions.labels(tier="disk").inc()
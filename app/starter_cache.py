@@ -0,0 +1,186 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+import anyio
+from prometheus_client import Counter
+
+from app.utils import logger
+
+starter_cache_lookups = Counter(
+    "starter_cache_lookups_total",
+    "Total number of Spring Initializr starter.zip cache lookups by result",
+    ["result"],
+)
+starter_cache_evictions = Counter(
+    "starter_cache_evictions_total",
+    "Total number of starter.zip files removed from the disk cache by reason",
+    ["reason"],
+)
+
+
+class StarterCache:
+    """
+    Cache of the starter.zip files downloaded from Spring Initializr
+
+    The starter.zip only depends on the request parameters, so entries are keyed by
+    the hash of the parameters. The most recently used entries are kept in memory and
+    every entry is also stored on disk as <key>.zip, so it survives a restart and is
+    shared by every worker that uses the same directory.
+
+    Entries older than the TTL are returned by get() as stale for another max_stale
+    seconds, so they can be served while refresh() fetches a new one in the
+    background. After that, they are removed. The directory keeps at most
+    max_disk_entries files, and the oldest ones are removed first.
+    """
+
+    def __init__(
+        self,
+        directory: str | None,
+        ttl: float,
+        max_entries: int,
+        max_stale: float,
+        max_disk_entries: int,
+    ):
+        self.__directory = directory
+        self.__ttl = ttl
+        self.__max_entries = max_entries
+        self.__max_stale = max_stale
+        self.__max_disk_entries = max_disk_entries
+        self.__entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self.__refreshing: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def make_key(params: dict[str, str]) -> str:
+        encoded = json.dumps(params, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    async def get(self, key: str) -> tuple[bytes, bool] | None:
+        """
+        Returns the cached starter.zip and whether it is younger than the TTL, or
+        None if it isn't cached
+        """
+        entry = await self.__lookup(key)
+        if entry is None:
+            starter_cache_lookups.labels(result="miss").inc()
+            return None
+        fresh = time.time() - entry[0] < self.__ttl
+        starter_cache_lookups.labels(result="hit" if fresh else "stale").inc()
+        return entry[1], fresh
+
+    def refresh(self, key: str, fetch: Callable[[], Awaitable[bytes]]) -> asyncio.Task:
+        """Fetches the starter.zip again in the background, unless already fetching"""
+        task = self.__refreshing.get(key)
+        if task is None:
+            task = asyncio.create_task(self.__refresh(key, fetch))
+            self.__refreshing[key] = task
+            task.add_done_callback(lambda _: self.__refreshing.pop(key, None))
+        return task
+
+    async def close(self):
+        """Cancels the refreshes still running"""
+        tasks = list(self.__refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def put(self, key: str, content: bytes):
+        fetched_at = time.time()
+        self.__remember(key, (fetched_at, content))
+        if self.__directory is not None:
+            await anyio.to_thread.run_sync(self.__write, key, content)
+
+    def clear(self):
+        self.__entries.clear()
+
+    async def __refresh(self, key: str, fetch: Callable[[], Awaitable[bytes]]):
+        try:
+            content = await fetch()
+        except Exception as ex:
+            # The stale entry keeps being served until a refresh succeeds
+            logger.warning(f"Failed to refresh cached starter.zip: {ex}")
+            return
+        await self.put(key, content)
+
+    async def __lookup(self, key: str) -> tuple[float, bytes] | None:
+        entry = self.__entries.get(key)
+        if entry is not None and self.__is_expired(entry[0]):
+            del self.__entries[key]
+            entry = None
+        if entry is None and self.__directory is not None:
+            # Another worker may have fetched a newer one since
+            entry = await anyio.to_thread.run_sync(self.__read, key)
+            if entry is not None and self.__is_expired(entry[0]):
+                await anyio.to_thread.run_sync(self.__remove, key)
+                entry = None
+        if entry is not None:
+            self.__remember(key, entry)
+        return entry
+
+    def __is_expired(self, fetched_at: float) -> bool:
+        """Whether the entry is too old to be returned even as stale"""
+        return time.time() - fetched_at >= self.__ttl + self.__max_stale
+
+    def __remember(self, key: str, entry: tuple[float, bytes]):
+        self.__entries[key] = entry
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.__directory, f"{key}.zip")
+
+    def __read(self, key: str) -> tuple[float, bytes] | None:
+        path = self.__path(key)
+        try:
+            with open(path, "rb") as f:
+                return os.path.getmtime(path), f.read()
+        except OSError:
+            return None
+
+    def __write(self, key: str, content: bytes):
+        # Written to a temporary file first so other workers never read half a zip
+        tmp_path = None
+        try:
+            os.makedirs(self.__directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, self.__path(key))
+            self.__evict_from_disk()
+        except OSError as ex:
+            logger.warning(f"Failed to cache starter.zip on disk: {ex}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def __remove(self, key: str):
+        try:
+            os.remove(self.__path(key))
+            starter_cache_evictions.labels(reason="expired").inc()
+        except OSError:
+            pass
+
+    def __evict_from_disk(self):
+        # The modification time of a file is when its starter.zip was fetched
+        files = sorted(
+            (
+                (entry.stat().st_mtime, entry.path)
+                for entry in os.scandir(self.__directory)
+                if entry.is_file() and entry.name.endswith(".zip")
+            ),
+            reverse=True,
+        )
+        for index, (fetched_at, path) in enumerate(files):
+            if self.__is_expired(fetched_at):
+                reason = "expired"
+            elif index >= self.__max_disk_entries:
+                reason = "size"
+            else:
+                continue
+            os.remove(path)
+            starter_cache_evictions.labels(reason=reason).inc()
@@ -0,0 +1,165 @@
+import functools
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import ParamSpec, TypeVar
+
+from prometheus_client import Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import TRACING
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None
+
+stage_latency = Histogram(
+    "convert_stage_duration_seconds",
+    "Histogram of the duration of each stage of a conversion in seconds",
+    ["stage"],
+)
+
+# Without TRACING or the opentelemetry package, only the histograms are recorded.
+# Where the spans are exported to is configured with the OpenTelemetry SDK.
+tracer = trace.get_tracer("motxt-convert") if TRACING and trace is not None else None
+
+
+class StageTimer:
+    """
+    Adds up the time spent in each stage of a single conversion, so a stage that
+    runs for every class or diagram is still recorded once per conversion
+
+    Each stage is observed in convert_stage_duration_seconds by observe(). With
+    tracing enabled, it is also a single span from the first time the stage
+    started to the last time it ended.
+    """
+
+    def __init__(self):
+        # stage -> (total duration, first start, last end)
+        self.__stages: dict[str, tuple[float, int, int]] = {}
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        start_ns = time.time_ns()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            total, first_start_ns, _ = self.__stages.get(stage, (0.0, start_ns, 0))
+            self.__stages[stage] = (total + duration, first_start_ns, time.time_ns())
+
+    @contextmanager
+    def collect(self) -> Iterator[None]:
+        """
+        Adds the stages of every span() opened inside to this timer, and observes
+        them at the end. Inside the collect() of another timer, they are left to
+        that one.
+        """
+        if current_timer.get() is not None:
+            yield
+            return
+        token = current_timer.set(self)
+        try:
+            yield
+        finally:
+            current_timer.reset(token)
+            self.observe()
+
+    def observe(self):
+        stages, self.__stages = self.__stages, {}
+        for stage, (total, start_ns, end_ns) in stages.items():
+            stage_latency.labels(stage=stage).observe(total)
+            if tracer is not None:
+                stage_span = tracer.start_span(stage, start_time=start_ns)
+                stage_span.set_attribute("convert.stage.duration_seconds", total)
+                stage_span.end(end_time=end_ns)
+
+
+current_timer: ContextVar[StageTimer | None] = ContextVar("current_timer", default=None)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """
+    Records the duration of a stage of a conversion, e.g. "parse_classes"
+
+    The duration is observed in convert_stage_duration_seconds, and the stage is
+    also an OpenTelemetry span when tracing is enabled. Inside StageTimer.collect(),
+    the duration is added to that timer instead. Stages run in a worker process
+    aren't exported, like the other metrics recorded there.
+    """
+    timer = current_timer.get()
+    if timer is not None:
+        with timer.time(stage):
+            yield
+        return
+
+    start = time.perf_counter()
+    try:
+        if tracer is None:
+            yield
+        else:
+            with tracer.start_as_current_span(stage):
+                yield
+    finally:
+        stage_latency.labels(stage=stage).observe(time.perf_counter() - start)
+
+
+def record_stages(func: Callable[P, T]) -> Callable[P, T]:
+    """Records the stages of every span() in func once per call (see StageTimer)"""
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        with StageTimer().collect():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class ConvertTracingMiddleware:
+    """
+    Records the send_response stage of the /convert endpoints, from the start of
+    the response until its last chunk is sent
+
+    With tracing enabled, the request is also a span, so the spans of its stages
+    are grouped under it.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not scope["path"].startswith("/convert"):
+            await self.app(scope, receive, send)
+            return
+
+        response_start = None
+        response_span = None
+
+        async def send_with_timing(message: Message):
+            nonlocal response_start, response_span
+            if message["type"] == "http.response.start":
+                response_start = time.perf_counter()
+                if tracer is not None:
+                    response_span = tracer.start_span("send_response")
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                stage_latency.labels(stage="send_response").observe(
+                    time.perf_counter() - response_start
+                )
+                if response_span is not None:
+                    response_span.end()
+
+        if tracer is None:
+            await self.app(scope, receive, send_with_timing)
+        else:
+            with tracer.start_as_current_span(f"{scope['method']} {scope['path']}"):
+                await self.app(scope, receive, send_with_timing)
@@ -1,14 +1,85 @@
+import functools
 import logging
 import os
 import re
 import secrets
+from collections.abc import Callable, Iterator, MutableMapping
 from keyword import iskeyword
-from typing import Any, Optional
+from typing import Any, Optional, TypeVar
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    Template,
+    TemplateError,
+    TemplateNotFound,
+)
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily
+
+from app.config import (
+    DEBUG,
+    DJANGO_SKELETON_CACHE_SIZE,
+    NAME_CACHE_SIZE,
+    TEMPLATE_CACHE_DIR,
+)
 
-from jinja2 import Environment, PackageLoader, TemplateNotFound
-
-env = Environment(loader=PackageLoader("app"))  # nosec B701 - not used for rendering HTML to the user
 logger = logging.getLogger("uvicorn.error")
+
+
+class TemplateRegistry(Environment):
+    """
+    Jinja environment that keeps every compiled template in a dict
+
+    preload() compiles all templates under app/templates once. Afterwards,
+    get_template() returns them straight from the dict, without going through the
+    loader or checking whether the file changed. When auto_reload is on (e.g. in
+    development), templates are always loaded the usual way so edits are picked up.
+    """
+
+    def __init__(self, **kwargs: object):
+        super().__init__(**kwargs)
+        self.__templates: dict[str, Template] = {}
+
+    def preload(self) -> int:
+        for name in self.list_templates():
+            try:
+                self.__templates[name] = super().get_template(name)
+            except TemplateError as e:
+                # e.g. base.html.txt, which is a Django template copied as is
+                logger.debug(f"Template not preloaded: {name}: {e}")
+        return len(self.__templates)
+
+    def get_template(
+        self,
+        name: str | Template,
+        parent: str | None = None,
+        globals: MutableMapping[str, Any] | None = None,
+    ) -> Template:
+        if parent is not None or globals is not None:
+            return super().get_template(name, parent, globals)
+
+        template = None if self.auto_reload else self.__templates.get(name)
+        return template or super().get_template(name)
+
+
+def get_bytecode_cache() -> FileSystemBytecodeCache | None:
+    if not TEMPLATE_CACHE_DIR:
+        return None
+    try:
+        os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Template bytecode cache disabled: {e}")
+        return None
+    return FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+
+
+env = TemplateRegistry(  # nosec B701 - not used for rendering HTML to the user
+    loader=PackageLoader("app"),
+    auto_reload=DEBUG,
+    bytecode_cache=get_bytecode_cache(),
+)
 JAVA_IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_]\w*$")
 JAVA_KEYWORDS = {
     "abstract",
@@ -87,8 +158,48 @@ JAVA_TYPE_MAPPING = {
 }
 
 
-def remove_file(path: str) -> None:
-    os.unlink(path)
+class NameCacheCollector:
+    """Reports the hits and misses of the memoised name helpers' LRU caches"""
+
+    def __init__(self):
+        self.__helpers: dict[str, Callable] = {}
+
+    def add(self, helper: str, cached: Callable):
+        self.__helpers[helper] = cached
+
+    def collect(self) -> Iterator[CounterMetricFamily]:
+        lookups = CounterMetricFamily(
+            "name_cache_lookups",
+            "Total number of memoised name helper lookups by result",
+            labels=["helper", "result"],
+        )
+        for helper, cached in self.__helpers.items():
+            info = cached.cache_info()
+            lookups.add_metric([helper, "hit"], info.hits)
+            lookups.add_metric([helper, "miss"], info.misses)
+        yield lookups
+
+
+name_cache_lookups = NameCacheCollector()
+REGISTRY.register(name_cache_lookups)
+F = TypeVar("F", bound=Callable)
+
+
+def memoize_name_helper(func: F) -> F:
+    """
+    Memoises a pure helper that is called with the same class and field names
+    over and over while a project is rendered
+
+    The results are kept in an LRU cache of NAME_CACHE_SIZE entries, which is
+    thread-safe. Its hits and misses are read by name_cache_lookups when the
+    metrics are scraped, so a call costs no more than the lookup.
+
+    Only use it for helpers that do more work than the lookup, e.g. regex
+    substitutions. Checks like is_valid_python_identifier() are faster without.
+    """
+    cached = functools.lru_cache(maxsize=NAME_CACHE_SIZE)(func)
+    name_cache_lookups.add(func.__name__.lstrip("_"), cached)
+    return cached
 
 
 def is_valid_python_identifier(identifier: str) -> bool:
@@ -125,21 +236,30 @@ def render_template(
         return ""
 
 
+CAMEL_CASE_BOUNDARY_PATTERN = re.compile(r"([a-z0-9])([A-Z])")
+ACRONYM_BOUNDARY_PATTERN = re.compile(r"([A-Z]+)(?=[A-Z])")
+NON_ALPHANUMERIC_PATTERN = re.compile(r"[^a-zA-Z0-9]")
+DELIMITER_PATTERN = re.compile(r"[-_]")
+DEFAULT_ACRONYMS = frozenset({"API", "HTTP", "XML", "ID", "URL", "JSON"})
+
+
+@memoize_name_helper
 def camel_to_snake(camel_case_str: str) -> str:
     if not isinstance(camel_case_str, str):
         raise TypeError("Input must be a string")
     # Adjust regex to handle acronyms properly (uppercase letters in the middle of the string)
-    snake_case_str = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", camel_case_str)
+    snake_case_str = CAMEL_CASE_BOUNDARY_PATTERN.sub(r"\1_\2", camel_case_str)
 
     # Special handling for acronyms: Make sure that sequences of uppercase letters are also split
     # correctly.
-    snake_case_str = re.sub(r"([A-Z]+)(?=[A-Z])", r"\1_", snake_case_str)
+    snake_case_str = ACRONYM_BOUNDARY_PATTERN.sub(r"\1_", snake_case_str)
     return snake_case_str.lower()
 
 
+@memoize_name_helper
 def to_camel_case(s: str) -> str:
     # Remove non-alphanumeric characters, replace with spaces, and split by spaces
-    words = re.sub(r"[^a-zA-Z0-9]", " ", s).split()
+    words = NON_ALPHANUMERIC_PATTERN.sub(" ", s).split()
 
     if not words:
         return ""
@@ -160,10 +280,15 @@ def to_camel_case(s: str) -> str:
 
 def to_pascal_case(s: str, acronyms: Optional[set[str]] = None) -> str:
     if acronyms is None:
-        acronyms = {"API", "HTTP", "XML", "ID", "URL", "JSON"}  # Add more as needed
+        acronyms = DEFAULT_ACRONYMS  # Add more as needed
+    # A set can't be part of the memo key, so it is frozen
+    return _to_pascal_case(s, frozenset(acronyms))
+
 
+@memoize_name_helper
+def _to_pascal_case(s: str, acronyms: frozenset[str]) -> str:
     # Normalize delimiters
-    s = re.sub(r"[-_]", " ", s)
+    s = DELIMITER_PATTERN.sub(" ", s)
 
     words = s.split()
     result = []
@@ -178,29 +303,53 @@ def to_pascal_case(s: str, acronyms: Optional[set[str]] = None) -> str:
     return "".join(result)
 
 
+# Not a valid identifier, so it can't come from the project name
+SECRET_KEY_PLACEHOLDER = "@SECRET_KEY@"
+
+
 def render_project_django_template(
     template_path: str, context: dict[str, Any]
 ) -> dict[str, Any]:
-    files = {}
     project_name = context["project_name"]
     if not is_valid_python_identifier(project_name):
         raise ValueError("Project name must not contain whitespace or number!")
-    for template_name in os.listdir(template_path):
-        template = f"django_project/{template_name}"
-        if template_name == "settings.py.j2":
-            context = {
-                "project_name": project_name,
-                "SECRET_KEY": get_random_secret_key(),
-            }
-        template_name = template_name.replace(".j2", "")
+
+    secret_key = get_random_secret_key()
+    files = {}
+    for template_name, content in render_django_skeleton(template_path, project_name):
         files[template_name] = (
-            # lambda that returns a function that renders the template with the context
-            # and returns the rendered template
-            lambda t=template, c=context: render_template(t, c) + "\n"
+            # lambda that returns the file with the SECRET_KEY of this project
+            lambda c=content: c.replace(SECRET_KEY_PLACEHOLDER, secret_key)
         )
     return files
 
 
+def render_django_settings(template_path: str, project_name: str) -> str:
+    """Returns settings.py of a Django project with a new SECRET_KEY"""
+    settings = dict(render_django_skeleton(template_path, project_name))["settings.py"]
+    return settings.replace(SECRET_KEY_PLACEHOLDER, get_random_secret_key())
+
+
+@functools.lru_cache(maxsize=DJANGO_SKELETON_CACHE_SIZE)
+def render_django_skeleton(
+    template_path: str, project_name: str
+) -> tuple[tuple[str, str], ...]:
+    """
+    Renders the files of a Django project, which only depend on its name
+
+    settings.py is rendered with SECRET_KEY_PLACEHOLDER instead of a random key, so
+    the rendered files can be reused for every project with the same name.
+    """
+    context = {"project_name": project_name, "SECRET_KEY": SECRET_KEY_PLACEHOLDER}
+    return tuple(
+        (
+            template_name.replace(".j2", ""),
+            render_template(f"django_project/{template_name}", context) + "\n",
+        )
+        for template_name in os.listdir(template_path)
+    )
+
+
 # method to generate random secret key taken from Django
 RANDOM_STRING_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
 
@@ -252,6 +401,7 @@ ERROR_CATEGORY_PATTERNS = [
             r"Class not found",
             r"ModelsElements does not contain",
             r"Can't create edit views",
+            r"The \.class\.jet is not valid",
         ],
     ),
     ("invalid_sequence_file", [r"The \.sequence\.jet is not valid"]),
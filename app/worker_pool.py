@@ -0,0 +1,127 @@
+import asyncio
+import contextvars
+import functools
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TypeVar
+
+from prometheus_client import Counter, Gauge
+
+T = TypeVar("T")
+
+pool_tasks = Counter(
+    "worker_pool_tasks_total",
+    "Total number of parse and render tasks by where they were executed",
+    ["pool", "mode"],
+)
+pool_queue_depth = Gauge(
+    "worker_pool_queue_depth",
+    "Number of tasks waiting for a free worker",
+    ["pool", "executor"],
+)
+pool_busy_workers = Gauge(
+    "worker_pool_busy_workers",
+    "Number of workers currently running a task",
+    ["pool", "executor"],
+)
+pool_utilisation = Gauge(
+    "worker_pool_utilisation",
+    "Ratio of busy workers to the size of the pool",
+    ["pool", "executor"],
+)
+
+
+class WorkerPool:
+    """
+    Runs the CPU-bound parse and render stage outside of the event loop
+
+    Inputs smaller than the threshold are run inline, since handing them to a worker
+    costs more than generating them. Larger inputs are sent to a process pool or a
+    thread pool depending on the configured kind.
+
+    Tasks whose result can't leave the current process (e.g. a lazy generator of
+    rendered files) are always sent to a thread, even when the kind is "process".
+
+    The pool is only available between start() and shutdown(). Outside of that, every
+    task is run inline. Its metrics are labelled with its name.
+    """
+
+    KINDS = ("process", "thread", "none")
+
+    def __init__(self, name: str, kind: str, max_workers: int, threshold: int):
+        if kind not in self.KINDS:
+            raise ValueError(f"Worker pool kind must be one of {', '.join(self.KINDS)}")
+        if max_workers < 1:
+            raise ValueError("Worker pool size must be at least 1")
+        self.__name = name
+        self.__kind = kind
+        self.__max_workers = max_workers
+        self.__threshold = threshold
+        self.__executors: dict[str, Executor] = {}
+        self.__in_flight: dict[str, int] = {}
+
+    def start(self):
+        if self.__kind == "none" or self.__executors:
+            return
+        self.__executors["thread"] = ThreadPoolExecutor(
+            max_workers=self.__max_workers, thread_name_prefix="convert-worker"
+        )
+        if self.__kind == "process":
+            self.__executors["process"] = ProcessPoolExecutor(
+                max_workers=self.__max_workers
+            )
+        for executor in self.__executors:
+            self.__in_flight[executor] = 0
+            self.__update_metrics(executor)
+
+    def shutdown(self):
+        executors, self.__executors = self.__executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def is_running(self) -> bool:
+        return bool(self.__executors)
+
+    def should_offload(self, size: int) -> bool:
+        return self.is_running() and size >= self.__threshold
+
+    async def run(
+        self, size: int, func: Callable[..., T], *args: object, local: bool = False
+    ) -> T:
+        """
+        Runs func(*args) and returns its result
+
+        When the task is sent to a process, func, args, and the result must be
+        picklable. Set local to True for tasks that don't satisfy this.
+        """
+        if not self.should_offload(size):
+            pool_tasks.labels(pool=self.__name, mode="inline").inc()
+            return func(*args)
+
+        executor = "thread" if local else self.__kind
+        pool_tasks.labels(pool=self.__name, mode=executor).inc()
+
+        self.__in_flight[executor] += 1
+        self.__update_metrics(executor)
+        try:
+            loop = asyncio.get_running_loop()
+            task = functools.partial(func, *args)
+            if executor == "thread":
+                # e.g. the current OpenTelemetry span stays the parent of the spans of
+                # the task. A context can't be sent to another process.
+                task = functools.partial(contextvars.copy_context().run, task)
+            return await loop.run_in_executor(self.__executors[executor], task)
+        finally:
+            self.__in_flight[executor] -= 1
+            self.__update_metrics(executor)
+
+    def __update_metrics(self, executor: str):
+        in_flight = self.__in_flight[executor]
+        busy = min(in_flight, self.__max_workers)
+        pool_queue_depth.labels(pool=self.__name, executor=executor).set(
+            in_flight - busy
+        )
+        pool_busy_workers.labels(pool=self.__name, executor=executor).set(busy)
+        pool_utilisation.labels(pool=self.__name, executor=executor).set(
+            busy / self.__max_workers
+        )
@@ -0,0 +1,167 @@
+"""
+Generators of synthetic .jet diagrams of a given size
+
+The diagrams only depend on their size, so the same arguments always give the same
+diagram and benchmark results stay comparable across commits.
+"""
+
+
+def make_class_diagram(
+    classes: int = 50,
+    fields: int = 8,
+    methods: int = 4,
+    edges: int = 60,
+    public: float = 1.0,
+) -> dict:
+    """
+    Returns a class diagram with the given number of classes, fields and methods
+    per class, and associations between classes
+
+    The given share of the classes is public, spread evenly over the diagram. Only
+    public classes get the Django views and pages, and the Spring controllers. The
+    associations cycle through one-to-one, many-to-one and many-to-many, and every
+    tenth edge is a generalization to an earlier class.
+    """
+    nodes = []
+    for i in range(classes):
+        attributes = [
+            f"+ field{j}: {('string', 'integer', 'boolean')[j % 3]}"
+            for j in range(fields)
+        ]
+        class_methods = [
+            f"+ method{j}(value{j}: integer): string" for j in range(methods)
+        ]
+        is_public = int((i + 1) * public) > int(i * public)
+        nodes.append(
+            {
+                "methods": "\n".join(class_methods),
+                "name": f"{'+' if is_public else '-'} Class{i}",
+                "x": 100 * (i % 10),
+                "y": 100 * (i // 10),
+                "attributes": "\n".join(attributes),
+                "id": i,
+                "type": "ClassNode",
+            }
+        )
+
+    diagram_edges = []
+    labels = [("1", "1"), ("1", "*"), ("*", "*")]
+    for k in range(edges if classes > 1 else 0):
+        start = k % classes
+        # Every pair of classes is only related once while there are enough pairs
+        end = (start + 1 + k // classes) % classes
+        if end == start:
+            end = (start + 1) % classes
+        if k % 10 == 9 and end < start:
+            diagram_edges.append(
+                {"start": start, "end": end, "type": "GeneralizationEdge"}
+            )
+            continue
+        start_label, end_label = labels[k % len(labels)]
+        diagram_edges.append(
+            {
+                "startLabel": start_label,
+                "endLabel": end_label,
+                "start": start,
+                "end": end,
+                "type": "AggregationEdge",
+            }
+        )
+
+    return {
+        "diagram": "ClassDiagram",
+        "nodes": nodes,
+        "edges": diagram_edges,
+        "version": "3.8",
+    }
+
+
+def make_sequence_diagram(
+    participants: int = 8, calls: int = 20, depth: int = 4, methods: int = 4
+) -> dict:
+    """
+    Returns a sequence diagram where the UI makes the given number of calls to views,
+    and each view calls a chain of depth methods through the other participants
+
+    The participants are the first classes of make_class_diagram() and only call
+    the methods it gives them, so both diagrams can be converted together as long
+    as the class diagram is at least as large. Each call in a chain goes to the next
+    participant, so with more than one participant the chains never contain self
+    calls. Every call has a return edge.
+    """
+    nodes = []
+    edges = []
+    next_id = 0
+
+    def add_node(node: dict) -> int:
+        nonlocal next_id
+        node["id"] = next_id
+        nodes.append(node)
+        next_id += 1
+        return node["id"]
+
+    def add_call_node(parent: dict) -> int:
+        call_id = add_node({"x": 0, "y": 0, "openBottom": False, "type": "CallNode"})
+        parent["children"].append(call_id)
+        return call_id
+
+    ui = {"children": [], "name": ":UI", "type": "ImplicitParameterNode"}
+    views = {"children": [], "name": ":views", "type": "ImplicitParameterNode"}
+    add_node(ui)
+    add_node(views)
+    classes = []
+    for i in range(max(participants, 1)):
+        participant = {
+            "children": [],
+            "name": f"class{i}:Class{i}",
+            "type": "ImplicitParameterNode",
+        }
+        add_node(participant)
+        classes.append(participant)
+
+    ui_call = add_call_node(ui)
+    for k in range(calls):
+        caller = add_call_node(views)
+        edges.append(
+            {
+                "middleLabel": f"view{k} (request{k})",
+                "start": ui_call,
+                "end": caller,
+                "type": "CallEdge",
+                "signal": False,
+            }
+        )
+        for d in range(depth):
+            participant = classes[(k + d) % len(classes)]
+            callee = add_call_node(participant)
+            j = (k + d) % methods
+            edges.append(
+                {
+                    "middleLabel": f"method{j} (value{j}) -> result{k}x{d}",
+                    "start": caller,
+                    "end": callee,
+                    "type": "CallEdge",
+                    "signal": False,
+                }
+            )
+            edges.append(
+                {
+                    "middleLabel": f"result{k}x{d}",
+                    "start": callee,
+                    "end": caller,
+                    "type": "ReturnEdge",
+                    "signal": False,
+                }
+            )
+            caller = callee
+
+    for node in nodes:
+        node.setdefault("x", 0)
+        node.setdefault("y", 0)
+
+    return {
+        "diagram": "SequenceDiagram",
+        "nodes": nodes,
+        "edges": edges,
+        "version": "3.8",
+    }
@@ -0,0 +1,300 @@
+"""
+Times each stage of the conversion pipeline on synthetic diagrams
+
+Every stage is run a few times to warm up and then timed for the given number of
+rounds. The results are printed and can be written to a JSON file, which a later
+run can be compared against to find regressions. To time a baseline commit with
+the same benchmarks, check it out in a worktree and copy benchmarks/ into it:
+
+    git worktree add /tmp/baseline main
+    cp -r benchmarks /tmp/baseline/
+    (cd /tmp/baseline && python -m benchmarks.run --output /tmp/baseline.json)
+    python -m benchmarks.run --compare /tmp/baseline.json
+    git worktree remove --force /tmp/baseline
+
+The stages call functions of the app, so the baseline must be recent enough to
+have them.
+
+With --compare, the exit status is 1 if the median time of any stage grew by more
+than --max-slowdown. Only compare results of the same diagram sizes on the same
+machine.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+
+from benchmarks.diagrams import make_class_diagram, make_sequence_diagram
+
+Stage = tuple[Callable[..., object], Callable[[], tuple] | None]
+
+
+def get_stages(args: argparse.Namespace) -> dict[str, Stage]:
+    """
+    Returns the function of each stage, and the function that prepares its
+    arguments for every round if it has one
+
+    The app is imported here, so --help works without its dependencies.
+    """
+    from app.archive import CompressedData, ZipArchive, stream_zip
+    from app.diagram_document import DiagramDocument
+    from app.generate_controller_springboot.generate_controller_springboot import (
+        generate_springboot_controller_file,
+    )
+    from app.generate_repository.generate_repository import generate_repository_java
+    from app.generate_service_springboot.generate_service_springboot import (
+        generate_service_java,
+    )
+    from app.generation_plan import generate_django_files
+    from app.main import (
+        CSS_DIR,
+        artifact_cache,
+        build_django_zip,
+        build_spring_zip,
+        fetch_data,
+        iter_django_files,
+        parse_spring_models,
+    )
+    from app.parse_json_to_object_class import ParseJsonToObjectClass
+    from app.parse_json_to_object_seq import ParseJsonToObjectSeq
+
+    project_name = "benchmark"
+    group_id = "com.example"
+    class_content = json.dumps(
+        make_class_diagram(
+            args.classes, args.fields, args.methods, args.edges, args.public
+        )
+    )
+    sequence_content = json.dumps(
+        make_sequence_diagram(args.participants, args.calls, args.depth, args.methods)
+    )
+    filenames = ["benchmark.class.jet", "benchmark.sequence.jet"]
+    contents = [[class_content], [sequence_content]]
+    class_data = DiagramDocument.decode(class_content).get_data()
+    sequence_data = DiagramDocument.decode(sequence_content).get_data()
+
+    def parse_classes() -> tuple:
+        parser = ParseJsonToObjectClass(class_data)
+        return parser, parser.parse_classes()
+
+    def parse_sequence():
+        parser = ParseJsonToObjectSeq()
+        parser.set_json(sequence_data)
+        parser.parse()
+        parser.parse_return_edge()
+
+    django_models = fetch_data(filenames, contents)["model_element"]
+    spring_models = parse_spring_models(filenames[:1], contents[:1])
+    spring_classes = spring_models.get_classes()
+    with open(os.path.join(CSS_DIR, "modern.css"), "rb") as f:
+        css = CompressedData(f.read())
+    entries = list(iter_django_files(project_name, filenames, contents, css))
+
+    def render_each(render: Callable[[object], object]) -> Callable[[], None]:
+        def render_all():
+            for class_object in spring_classes:
+                render(class_object)
+
+        return render_all
+
+    def build_zip():
+        archive = ZipArchive()
+        archive.extend(entries)
+        archive.build()
+
+    def build_spring():
+        # Files of unchanged classes would otherwise come from the cache
+        artifact_cache.clear()
+        build_spring_zip(project_name, group_id, filenames[:1], contents[:1], b"")
+
+    return {
+        "decode/class": (lambda: DiagramDocument.decode(class_content), None),
+        "decode/sequence": (lambda: DiagramDocument.decode(sequence_content), None),
+        "parse/classes": (
+            lambda: ParseJsonToObjectClass(class_data).parse_classes(),
+            None,
+        ),
+        "parse/relationships": (
+            lambda parser, classes: parser.parse_relationships(classes),
+            parse_classes,
+        ),
+        "parse/sequence": (parse_sequence, None),
+        "django/fetch_data": (lambda: fetch_data(filenames, contents), None),
+        "django/models": (django_models.print_django_style, None),
+        "django/class_files": (lambda: generate_django_files(django_models), None),
+        "spring/model": (
+            render_each(
+                lambda c: spring_models.print_springboot_model(
+                    c, project_name, group_id
+                )
+            ),
+            None,
+        ),
+        "spring/service": (
+            render_each(lambda c: generate_service_java(project_name, c, group_id)),
+            None,
+        ),
+        "spring/controller": (
+            render_each(
+                lambda c: generate_springboot_controller_file(project_name, c, group_id)
+            ),
+            None,
+        ),
+        "spring/repository": (
+            render_each(lambda c: generate_repository_java(project_name, c, group_id)),
+            None,
+        ),
+        "zip/build": (build_zip, None),
+        "zip/stream": (lambda: b"".join(stream_zip(entries)), None),
+        "total/django": (
+            lambda: build_django_zip(project_name, filenames, contents, css),
+            None,
+        ),
+        "total/spring": (build_spring, None),
+    }
+
+
+def time_stage(
+    func: Callable[..., object],
+    setup: Callable[[], tuple] | None,
+    rounds: int,
+    warmup: int,
+) -> dict[str, float]:
+    times = []
+    for i in range(warmup + rounds):
+        args = setup() if setup is not None else ()
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            times.append(elapsed)
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "rounds": rounds,
+    }
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> dict:
+    stages = get_stages(args)
+    selected = [
+        name
+        for name in stages
+        if not args.stage or any(name.startswith(prefix) for prefix in args.stage)
+    ]
+    results = {}
+    for name in selected:
+        func, setup = stages[name]
+        results[name] = time_stage(func, setup, args.rounds, args.warmup)
+        print(f"{name:<22} {results[name]['median'] * 1000:10.3f} ms")
+
+    return {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "sizes": {
+            name: getattr(args, name)
+            for name in (
+                "classes",
+                "fields",
+                "methods",
+                "edges",
+                "public",
+                "participants",
+                "calls",
+                "depth",
+            )
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, max_slowdown: float) -> bool:
+    """Prints the change of each stage and returns whether none is a regression"""
+    if current["sizes"] != baseline["sizes"]:
+        print("Warning: the baseline was run with other diagram sizes")
+
+    ok = True
+    print(f"\n{'stage':<22} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["median"]
+        after = result["median"]
+        ratio = after / before if before > 0 else float("inf")
+        regression = ratio > max_slowdown
+        ok = ok and not regression
+        print(
+            f"{name:<22} {before * 1000:10.3f}ms {after * 1000:10.3f}ms "
+            f"{ratio:7.2f}x{'  REGRESSION' if regression else ''}"
+        )
+    return ok
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--classes", type=int, default=50)
+    parser.add_argument("--fields", type=int, default=8, help="fields per class")
+    parser.add_argument("--methods", type=int, default=4, help="methods per class")
+    parser.add_argument("--edges", type=int, default=60, help="class relationships")
+    parser.add_argument(
+        "--public", type=float, default=1.0, help="share of public classes"
+    )
+    parser.add_argument("--participants", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=20, help="calls to views")
+    parser.add_argument("--depth", type=int, default=4, help="depth of each call")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--stage",
+        action="append",
+        help="only run the stages starting with this prefix, e.g. parse/",
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of a previous run")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=1.2,
+        help="median time ratio above which a stage is a regression",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.participants > args.classes:
+        raise SystemExit("--participants can't be more than --classes")
+    results = run(args)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.max_slowdown):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
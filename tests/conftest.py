@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.admission import AdmissionController
+from app.artifact_cache import ArtifactCache
+from app.http_client import HttpClient
+from app.job_queue import JobQueue
+from app.main import run_job
+from app.result_cache import ResultCache
+from app.starter_cache import StarterCache
+
+
+@pytest.fixture(autouse=True)
+def app_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Every test starts with fresh shared state in app.main:
+
+    - an empty starter.zip cache
+    - an HTTP client that doesn't retry, so each test sees every failure
+    - a disabled result cache, so every request builds its project
+    - an empty artifact cache, so per-class files are rendered from scratch
+    - an empty job queue that isn't stored on disk
+    - no large conversion admitted or waiting
+    """
+    monkeypatch.setattr(
+        "app.main.starter_cache",
+        StarterCache(str(tmp_path / "starter-cache"), 60, 8, 24 * 60 * 60, 8),
+    )
+    monkeypatch.setattr(
+        "app.main.http_client",
+        HttpClient(httpx.Limits(), httpx.Timeout(5), 0, 0, False),
+    )
+    monkeypatch.setattr("app.main.result_cache", ResultCache(0, None, 0))
+    monkeypatch.setattr("app.main.artifact_cache", ArtifactCache(64))
+    monkeypatch.setattr("app.main.job_queue", JobQueue(run_job, 1, 8, 8, 60, None))
+    monkeypatch.setattr(
+        "app.main.admission",
+        AdmissionController(
+            "queue",
+            {"payload_bytes": 1024**2, "nodes": 1000, "edges": 2000, "members": 10000},
+            1,
+            8,
+        ),
+    )
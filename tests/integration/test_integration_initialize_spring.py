@@ -1,3 +1,4 @@
+import io
 import os
 import subprocess
 import tempfile
@@ -62,14 +63,13 @@ class TestIntegrationInitializeSpring(unittest.IsolatedAsyncioTestCase):
         }
 
     async def test_openapi_spring_mvc_in_build_gradle_has_version(self):
-        tmp_zip_path = await initialize_springboot_zip("any", "com.motxt")
-        with zipfile.ZipFile(tmp_zip_path) as zipf:
+        zip_content = await initialize_springboot_zip("any", "com.motxt")
+        with zipfile.ZipFile(io.BytesIO(zip_content)) as zipf:
             with zipf.open("build.gradle.kts") as buildf:
                 self.assertIn(
                     "org.springdoc:springdoc-openapi-starter-webmvc-ui:2.2.0",
                     buildf.read().decode("utf-8"),
                 )
-        os.remove(tmp_zip_path)
 
     async def test_application_properties_properly_filled(self):
         expected = ""
@@ -78,11 +78,10 @@ class TestIntegrationInitializeSpring(unittest.IsolatedAsyncioTestCase):
         ) as f:
             expected = await f.read()
 
-        tmp_zip_path = await initialize_springboot_zip("testapp", "com.motxt")
-        with zipfile.ZipFile(tmp_zip_path) as zipf:
+        zip_content = await initialize_springboot_zip("testapp", "com.motxt")
+        with zipfile.ZipFile(io.BytesIO(zip_content)) as zipf:
             with zipf.open("src/main/resources/application.properties") as f:
                 self.assertEqual(expected, f.read().decode("utf-8"))
-        os.remove(tmp_zip_path)
 
     async def test_no_duplicate_files(self):
         resp = client.post("/convert", json=self.json)
@@ -1,4 +1,5 @@
 import asyncio
+import io
 import os
 import tempfile
 import zipfile
@@ -74,19 +75,19 @@ async def _prepare_context(context: dict):
         context["project_name"] = data["project_name"]
         context["group_id"] = data["group_id"]
 
-        zip_path = await convert_spring(
+        zip_content = await convert_spring(
             project_name=data["project_name"],
             group_id=data["group_id"],
             filenames=data["filename"],
             contents=data["content"],
         )
 
-        context["result_zip_path"] = zip_path
+        context["result_zip"] = zip_content
 
 
 @when("the zip is unzip")
 def unzip_result(context: dict):
-    with zipfile.ZipFile(context["result_zip_path"], "r") as zip_ref:
+    with zipfile.ZipFile(io.BytesIO(context["result_zip"]), "r") as zip_ref:
         context["file_list"] = zip_ref.namelist()
         context["src_path"] = (
             f"src/main/java/{context['group_id'].replace('.', '/')}/{context['project_name']}"
@@ -190,14 +191,14 @@ async def call_convert_spring(context: dict):
         context["project_name"] = data["project_name"]
         context["group_id"] = data["group_id"]
 
-        zip_path = await convert_spring(
+        zip_content = await convert_spring(
             project_name=data["project_name"],
             group_id=data["group_id"],
             filenames=data["filename"],
             contents=data["content"],
         )
 
-        context["result_zip_path"] = zip_path
+        context["result_zip"] = zip_content
         data = context["data"]
         context["exception"] = None
         asyncio.run(
@@ -270,14 +271,14 @@ async def call_convert_spring2(context: dict):
 
         data = context["data2"]
 
-        zip_path = await convert_spring(
+        zip_content = await convert_spring(
             project_name=data["project_name"],
             group_id=data["group_id"],
             filenames=data["filename"],
             contents=data["content"],
         )
 
-        context["result_zip_path2"] = zip_path
+        context["result_zip2"] = zip_content
         data = context["data2"]
         context["exception2"] = None
         asyncio.run(
@@ -298,7 +299,5 @@ def check_error_2(context: dict):
 
 
 def cleanup(context: dict):
-    if "result_zip_path" in context and os.path.exists(context["result_zip_path"]):
-        os.unlink(context["result_zip_path"])
     if "mock_zip_path" in context and os.path.exists(context["mock_zip_path"]):
         os.unlink(context["mock_zip_path"])
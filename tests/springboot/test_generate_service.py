@@ -60,6 +60,33 @@ class TestGenerateService(unittest.TestCase):
         assert "setUsername(cart.getUsername())" in expected_output
         self.assertEqual(output.replace(" ", "").replace("\n", "").strip(), expected_output.replace(" ", "").replace("\n", "").strip())
 
+    def test_generate_service_with_every_ancestor(self):
+        classes = []
+        for name in ["Person", "Customer", "Member"]:
+            class_object = ClassObject()
+            class_object.set_name(name)
+            class_object.set_is_public(True)
+            field = FieldObject()
+            field_type = TypeObject()
+            field.set_name(f"{name.lower()}Id")
+            field_type.set_name("int")
+            field.set_type(field_type)
+            class_object.add_field(field)
+            if classes:
+                class_object.set_parent(classes[-1])
+            classes.append(class_object)
+        person, customer, member = classes
+
+        output = generate_service_java("shop", member, "com.example")
+        # Rendering the parent doesn't change what its subclasses get
+        generate_service_java("shop", customer, "com.example")
+
+        self.assertEqual(generate_service_java("shop", member, "com.example"), output)
+        for name in ["MemberId", "CustomerId", "PersonId"]:
+            self.assertIn(f"set{name}(member.get{name}())", output)
+        self.assertEqual(len(customer.get_fields()), 1)
+        self.assertEqual(len(person.get_fields()), 1)
+
 
 # Behavior Test
 scenarios(FEATURE_PATH)
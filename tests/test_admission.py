@@ -0,0 +1,254 @@
+import asyncio
+import io
+import json
+import unittest
+import zipfile
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.admission import (
+    AdmissionController,
+    RequestComplexity,
+    measure_request,
+    slow_lane,
+)
+from app.archive import stream_zip
+from app.main import app, get_worker_pool, slow_worker_pool, worker_pool
+from app.model import ConvertRequest
+from benchmarks.diagrams import make_class_diagram, make_sequence_diagram
+
+client = TestClient(app)
+
+LIMITS = {"payload_bytes": 0, "nodes": 10, "edges": 0, "members": 0}
+SMALL = RequestComplexity(100, 5, 0, 0)
+LARGE = RequestComplexity(100, 20, 0, 0)
+
+
+def make_request(classes: int) -> dict:
+    return {
+        "filename": ["shop"],
+        "content": [[json.dumps(make_class_diagram(classes=classes, edges=2))]],
+        "project_name": "shop",
+    }
+
+
+def get_decisions(decision: str) -> float:
+    count = REGISTRY.get_sample_value(
+        "admission_decisions_total", {"decision": decision}
+    )
+    return count or 0
+
+
+class TestMeasureRequest(unittest.TestCase):
+    def test_counts_class_diagram(self):
+        request = ConvertRequest(
+            filename=["shop"],
+            content=[
+                [
+                    json.dumps(
+                        make_class_diagram(classes=4, fields=3, methods=2, edges=5)
+                    )
+                ]
+            ],
+            project_name="shop",
+        )
+
+        complexity = measure_request(request)
+
+        self.assertEqual(complexity.nodes, 4)
+        self.assertEqual(complexity.edges, 5)
+        self.assertEqual(complexity.members, 4 * (3 + 2))
+        self.assertEqual(complexity.payload_bytes, len(request.content[0][0]))
+
+    def test_counts_every_diagram(self):
+        sequence_diagram = make_sequence_diagram(participants=2, calls=1, depth=2)
+        request = ConvertRequest(
+            filename=["shop", "shop"],
+            content=[
+                [json.dumps(make_class_diagram(classes=2, edges=1), indent=2)],
+                [json.dumps(sequence_diagram)],
+            ],
+            project_name="shop",
+        )
+
+        complexity = measure_request(request)
+
+        self.assertEqual(
+            complexity.nodes, 2 + len(sequence_diagram["nodes"]), complexity.to_dict()
+        )
+        self.assertEqual(complexity.edges, 1 + len(sequence_diagram["edges"]))
+
+    def test_records_histograms(self):
+        before = REGISTRY.get_sample_value(
+            "convert_request_elements_count", {"element": "nodes"}
+        )
+        client.post("/convert", json=make_request(2))
+        after = REGISTRY.get_sample_value(
+            "convert_request_elements_count", {"element": "nodes"}
+        )
+        self.assertEqual(after, (before or 0) + 1)
+
+
+class TestAdmissionController(unittest.IsolatedAsyncioTestCase):
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            AdmissionController("drop", LIMITS, 1, 1)
+
+    def test_limit_of_zero_is_no_limit(self):
+        controller = AdmissionController("queue", LIMITS, 1, 1)
+        self.assertFalse(controller.is_large(RequestComplexity(10**9, 10, 10**6, 0)))
+        self.assertTrue(controller.is_large(LARGE))
+
+    async def test_small_requests_are_not_queued(self):
+        controller = AdmissionController("queue", LIMITS, 1, 0)
+        async with controller.admit(LARGE):
+            async with controller.admit(SMALL) as large:
+                self.assertFalse(large)
+
+    async def test_reject(self):
+        controller = AdmissionController("reject", LIMITS, 1, 1)
+        with self.assertRaises(HTTPException) as ctx:
+            async with controller.admit(LARGE):
+                pass
+        self.assertEqual(ctx.exception.status_code, 413)
+
+    async def test_queue_runs_large_requests_one_at_a_time(self):
+        controller = AdmissionController("queue", LIMITS, 1, 8)
+        running = 0
+        most_running = 0
+
+        async def convert():
+            nonlocal running, most_running
+            async with controller.admit(LARGE) as large:
+                self.assertTrue(large)
+                running += 1
+                most_running = max(most_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(convert() for _ in range(3)))
+        self.assertEqual(most_running, 1)
+
+    async def test_queue_full(self):
+        controller = AdmissionController("queue", LIMITS, 1, 0)
+        async with controller.admit(LARGE):
+            with self.assertRaises(HTTPException) as ctx:
+                async with controller.admit(LARGE):
+                    pass
+        self.assertEqual(ctx.exception.status_code, 503)
+
+    async def test_slow_lane(self):
+        controller = AdmissionController("slow_lane", LIMITS, 1, 1)
+        async with controller.admit(LARGE):
+            self.assertTrue(slow_lane.get())
+            self.assertIs(get_worker_pool(), slow_worker_pool)
+        self.assertFalse(slow_lane.get())
+        self.assertIs(get_worker_pool(), worker_pool)
+
+
+class TestConvertAdmission(unittest.TestCase):
+    def test_small_request_is_admitted(self):
+        before = get_decisions("admitted")
+        response = client.post("/convert", json=make_request(2))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_decisions("admitted"), before + 1)
+
+    def test_large_request_is_rejected(self):
+        controller = AdmissionController("reject", LIMITS, 1, 1)
+        with patch("app.main.admission", controller):
+            response = client.post("/convert", json=make_request(20))
+        self.assertEqual(response.status_code, 413)
+
+    def test_large_request_is_queued(self):
+        controller = AdmissionController("queue", LIMITS, 1, 1)
+        before = get_decisions("queue")
+        with patch("app.main.admission", controller):
+            response = client.post("/convert", json=make_request(20))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_decisions("queue"), before + 1)
+
+    def test_large_request_is_built_in_slow_lane(self):
+        controller = AdmissionController("slow_lane", LIMITS, 1, 1)
+        pools = []
+
+        def build(*args: object) -> bytes:
+            pools.append(get_worker_pool())
+            return b"zip"
+
+        with (
+            patch("app.main.admission", controller),
+            patch("app.main.build_project", side_effect=build),
+            patch("app.main.finish_project", return_value=b"zip"),
+        ):
+            response = client.post("/convert", json=make_request(20))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(pools, [slow_worker_pool])
+
+    def test_streamed_request_holds_admission_until_sent(self):
+        controller = AdmissionController("queue", LIMITS, 1, 0)
+        controller_admit = controller.admit
+        events = []
+
+        @asynccontextmanager
+        async def admit(complexity: RequestComplexity) -> AsyncIterator[bool]:
+            async with controller_admit(complexity) as large:
+                events.append("admitted")
+                yield large
+            events.append("released")
+
+        def record_stream_zip(*args: object, **kwargs: object) -> Iterator[bytes]:
+            for chunk in stream_zip(*args, **kwargs):
+                events.append("chunk")
+                yield chunk
+
+        with (
+            patch("app.main.admission", controller),
+            patch.object(controller, "admit", admit),
+            patch("app.main.stream_zip", record_stream_zip),
+            patch("app.main.STREAM_RESPONSE", True),
+        ):
+            first = client.post("/convert", json=make_request(20))
+            # Only one large conversion may run, and none may wait
+            second = client.post("/convert", json=make_request(20))
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(events[0], "admitted")
+        self.assertEqual(events.index("released"), len(events) // 2 - 1)
+        self.assertEqual(events[-1], "released")
+        self.assertGreater(events.count("chunk"), 2)
+
+    def test_streamed_request_in_slow_lane(self):
+        controller = AdmissionController("slow_lane", LIMITS, 1, 0)
+        with (
+            patch("app.main.admission", controller),
+            patch("app.main.STREAM_RESPONSE", True),
+        ):
+            for _ in range(2):
+                response = client.post("/convert", json=make_request(20))
+                self.assertEqual(response.status_code, 200)
+        self.assertFalse(slow_lane.get())
+
+    def test_large_request_in_batch_is_rejected_alone(self):
+        controller = AdmissionController("reject", LIMITS, 1, 1)
+        with patch("app.main.admission", controller):
+            response = client.post(
+                "/convert/batch", json=[make_request(2), make_request(20)]
+            )
+        self.assertEqual(response.status_code, 200)
+        with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+            manifest = json.loads(zipf.read("batch.json"))
+        self.assertEqual([item["status"] for item in manifest], ["ok", "error"])
+        self.assertEqual(manifest[1]["status_code"], 413)
+
+    def test_large_job_is_accepted(self):
+        controller = AdmissionController("reject", LIMITS, 1, 1)
+        with patch("app.main.admission", controller):
+            response = client.post("/jobs", json=make_request(20))
+        self.assertEqual(response.status_code, 202)
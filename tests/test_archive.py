@@ -0,0 +1,220 @@
+import io
+import os
+import unittest
+import zipfile
+from unittest.mock import patch
+
+from app.archive import CompressedData, ZipArchive, executable, stream_zip
+
+CUR_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+class TestZipArchive(unittest.TestCase):
+    def test_build_contains_all_entries(self):
+        archive = ZipArchive()
+        archive.writestr("a.txt", "hello")
+        archive.writestr("dir/b.bin", b"\x00\x01")
+
+        with zipfile.ZipFile(io.BytesIO(archive.build())) as zipf:
+            self.assertEqual(zipf.namelist(), ["a.txt", "dir/b.bin"])
+            self.assertEqual(zipf.read("a.txt"), b"hello")
+            self.assertEqual(zipf.read("dir/b.bin"), b"\x00\x01")
+
+    def test_write_reads_file_content(self):
+        archive = ZipArchive()
+        archive.write(os.path.join(CUR_DIR, "test_run_sh.txt"), "run.sh")
+
+        with open(os.path.join(CUR_DIR, "test_run_sh.txt"), "rb") as f:
+            self.assertEqual(archive.read("run.sh"), f.read())
+
+    def test_same_arcname_keeps_latest_content(self):
+        archive = ZipArchive()
+        archive.writestr("a.txt", "first")
+        archive.writestr("a.txt", "second")
+
+        with zipfile.ZipFile(io.BytesIO(archive.build())) as zipf:
+            self.assertEqual(zipf.namelist(), ["a.txt"])
+            self.assertEqual(zipf.read("a.txt"), b"second")
+
+    def test_entries_appended_to_base_archive(self):
+        base = io.BytesIO()
+        with zipfile.ZipFile(base, "w") as zipf:
+            zipf.writestr("build.gradle.kts", "plugins {}")
+
+        archive = ZipArchive(base=base.getvalue())
+        archive.writestr("run.sh", "./gradlew bootRun")
+
+        with zipfile.ZipFile(io.BytesIO(archive.build())) as zipf:
+            self.assertEqual(zipf.namelist(), ["build.gradle.kts", "run.sh"])
+
+    def test_executable_entry_keeps_mode(self):
+        archive = ZipArchive()
+        archive.writestr(executable("gradlew"), "#!/bin/sh")
+
+        self.assertEqual(archive.read("gradlew"), b"#!/bin/sh")
+        with zipfile.ZipFile(io.BytesIO(archive.build())) as zipf:
+            info = zipf.getinfo("gradlew")
+            self.assertEqual(info.external_attr >> 16, 0o100755)
+            self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+
+    def test_build_does_not_touch_working_directory(self):
+        before = set(os.listdir("."))
+        archive = ZipArchive()
+        archive.writestr("a.txt", "hello")
+        archive.build()
+        self.assertEqual(before, set(os.listdir(".")))
+
+
+class TestCompressedData(unittest.TestCase):
+    def test_compressed_data_is_copied_as_is(self):
+        css = CompressedData("body { color: red; }\n" * 100)
+        archive = ZipArchive()
+        archive.writestr("style.css", css)
+        archive.writestr("a.txt", "hello")
+
+        with zipfile.ZipFile(io.BytesIO(archive.build())) as zipf:
+            self.assertIsNone(zipf.testzip())
+            info = zipf.getinfo("style.css")
+            self.assertEqual(info.CRC, css.crc)
+            self.assertEqual(info.compress_size, len(css.raw))
+            self.assertLess(info.compress_size, info.file_size)
+            self.assertEqual(zipf.read("style.css"), css.data)
+            self.assertEqual(zipf.read("a.txt"), b"hello")
+
+    def test_read_returns_uncompressed_content(self):
+        archive = ZipArchive()
+        archive.writestr("run.sh", CompressedData("#!/bin/sh"))
+        self.assertEqual(archive.read("run.sh"), b"#!/bin/sh")
+
+    def test_compressed_data_reused_across_archives(self):
+        data = CompressedData(b"shared")
+        base = ZipArchive()
+        base.writestr("a.txt", "a")
+        for base_content in [b"", base.build()]:
+            archive = ZipArchive(base=base_content)
+            archive.writestr("shared.txt", data)
+            with zipfile.ZipFile(io.BytesIO(archive.build())) as zipf:
+                self.assertIsNone(zipf.testzip())
+                self.assertEqual(zipf.read("shared.txt"), b"shared")
+
+    def test_compressed_data_keeps_mode(self):
+        archive = ZipArchive()
+        archive.writestr(executable("run.sh"), CompressedData("#!/bin/sh"))
+
+        with zipfile.ZipFile(io.BytesIO(archive.build())) as zipf:
+            self.assertEqual(zipf.getinfo("run.sh").external_attr >> 16, 0o100755)
+            self.assertEqual(zipf.read("run.sh"), b"#!/bin/sh")
+
+    def test_stream_with_compressed_data(self):
+        base = io.BytesIO()
+        with zipfile.ZipFile(base, "w") as zipf:
+            zipf.writestr("build.gradle.kts", "plugins {}")
+        entries = [("a.txt", CompressedData("hello")), ("b.txt", "world")]
+
+        content = b"".join(stream_zip(entries, base=base.getvalue()))
+        with zipfile.ZipFile(io.BytesIO(content)) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(zipf.namelist(), ["build.gradle.kts", "a.txt", "b.txt"])
+            self.assertEqual(zipf.read("a.txt"), b"hello")
+
+    def test_compressed_again_without_zipfile_internals(self):
+        archive = ZipArchive()
+        archive.writestr(executable("run.sh"), CompressedData("#!/bin/sh"))
+        archive.writestr("style.css", CompressedData("body {}", zipfile.ZIP_STORED))
+
+        with patch("app.archive.ZIPFILE_INTERNALS", ("_renamed_in_a_new_version",)):
+            content = archive.build()
+
+        with zipfile.ZipFile(io.BytesIO(content)) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(zipf.read("run.sh"), b"#!/bin/sh")
+            self.assertEqual(zipf.getinfo("run.sh").external_attr >> 16, 0o100755)
+            self.assertEqual(zipf.getinfo("run.sh").compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(zipf.read("style.css"), b"body {}")
+            self.assertEqual(
+                zipf.getinfo("style.css").compress_type, zipfile.ZIP_STORED
+            )
+
+    def test_base_entries_are_copied_as_is(self):
+        build_file = "".join(f"line {i} of the build file\n" for i in range(2000))
+        base = io.BytesIO()
+        with zipfile.ZipFile(base, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            zipf.writestr("build.gradle.kts", build_file)
+            base_size = zipf.getinfo("build.gradle.kts").compress_size
+
+        content = b"".join(stream_zip([("a.txt", "a")], base=base.getvalue()))
+        with zipfile.ZipFile(io.BytesIO(content)) as zipf:
+            self.assertIsNone(zipf.testzip())
+            # Deflated again at the default level, it would be smaller
+            self.assertEqual(zipf.getinfo("build.gradle.kts").compress_size, base_size)
+            self.assertEqual(zipf.read("build.gradle.kts"), build_file.encode())
+
+    def test_data_of_zip_entry_is_read_on_demand(self):
+        base = io.BytesIO()
+        with zipfile.ZipFile(base, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("a.txt", "hello")
+            zipf.writestr("b.txt", "world")
+            info = zipf.getinfo("b.txt")
+
+        data = CompressedData.from_zip(base.getvalue(), info)
+
+        self.assertEqual(data.data, b"world")
+        self.assertEqual(data.crc, info.CRC)
+
+
+class TestStreamZip(unittest.TestCase):
+    def test_stream_yields_one_chunk_per_entry_and_the_directory(self):
+        entries = [("a.txt", "hello"), ("b.txt", b"world")]
+        chunks = list(stream_zip(entries))
+
+        self.assertEqual(len(chunks), len(entries) + 1)
+        self.assertTrue(chunks[0].startswith(b"PK\x03\x04"))
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(zipf.read("a.txt"), b"hello")
+            self.assertEqual(zipf.read("b.txt"), b"world")
+
+    def test_stream_is_lazy(self):
+        rendered = []
+
+        def entries():
+            for name in ["a.txt", "b.txt"]:
+                rendered.append(name)
+                yield name, name
+
+        chunks = stream_zip(entries())
+        next(chunks)
+        self.assertEqual(rendered, ["a.txt"])
+
+    def test_stream_writes_base_entries_first(self):
+        base = io.BytesIO()
+        with zipfile.ZipFile(base, "w") as zipf:
+            zipf.writestr("build.gradle.kts", "plugins {}")
+
+        content = b"".join(stream_zip([("run.sh", "")], base=base.getvalue()))
+        with zipfile.ZipFile(io.BytesIO(content)) as zipf:
+            self.assertEqual(zipf.namelist(), ["build.gradle.kts", "run.sh"])
+            self.assertEqual(zipf.read("build.gradle.kts"), b"plugins {}")
+
+    def test_stream_matches_built_archive(self):
+        archive = ZipArchive()
+        entries = [("a.txt", "hello"), ("dir/b.txt", "world")]
+        archive.extend(entries)
+
+        streamed = b"".join(stream_zip(entries))
+        with (
+            zipfile.ZipFile(io.BytesIO(streamed)) as streamed_zip,
+            zipfile.ZipFile(io.BytesIO(archive.build())) as built_zip,
+        ):
+            self.assertEqual(streamed_zip.namelist(), built_zip.namelist())
+            for name in built_zip.namelist():
+                self.assertEqual(streamed_zip.read(name), built_zip.read(name))
+
+    def test_stream_keeps_mode_of_base_entries(self):
+        archive = ZipArchive()
+        archive.writestr(executable("gradlew"), "#!/bin/sh")
+
+        content = b"".join(stream_zip([], base=archive.build()))
+        with zipfile.ZipFile(io.BytesIO(content)) as zipf:
+            self.assertEqual(zipf.getinfo("gradlew").external_attr >> 16, 0o100755)
+            self.assertEqual(zipf.read("gradlew"), b"#!/bin/sh")
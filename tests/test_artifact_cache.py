@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import Mock
+
+from app.artifact_cache import ArtifactCache
+
+
+class TestArtifactCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ArtifactCache(2)
+
+    def test_miss_renders_and_hit_reuses(self):
+        render = Mock(return_value="content")
+
+        self.assertEqual(self.cache.get_or_render("model", ("a",), render), "content")
+        self.assertEqual(self.cache.get_or_render("model", ("a",), render), "content")
+        render.assert_called_once()
+
+    def test_artifact_is_part_of_key(self):
+        self.cache.get_or_render("model", ("a",), lambda: "model")
+
+        self.assertEqual(
+            self.cache.get_or_render("service", ("a",), lambda: "service"), "service"
+        )
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.get_or_render("model", ("a",), lambda: "a")
+        self.cache.get_or_render("model", ("b",), lambda: "b")
+        self.cache.get_or_render("model", ("a",), lambda: "unused")
+        self.cache.get_or_render("model", ("c",), lambda: "c")
+
+        self.assertEqual(self.cache.get_or_render("model", ("a",), lambda: "new"), "a")
+        self.assertEqual(
+            self.cache.get_or_render("model", ("b",), lambda: "new"), "new"
+        )
+
+    def test_zero_size_disables_cache(self):
+        cache = ArtifactCache(0)
+        render = Mock(return_value="content")
+
+        cache.get_or_render("model", ("a",), render)
+        cache.get_or_render("model", ("a",), render)
+        self.assertEqual(render.call_count, 2)
+
+    def test_clear(self):
+        self.cache.get_or_render("model", ("a",), lambda: "a")
+        self.cache.clear()
+
+        self.assertEqual(
+            self.cache.get_or_render("model", ("a",), lambda: "new"), "new"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+import unittest
+
+from app.diagram_schema import class_diagram_validator, sequence_diagram_validator
+from benchmarks.diagrams import make_class_diagram, make_sequence_diagram
+from benchmarks.run import compare, get_stages, main, parse_args
+
+SMALL_SIZES = [
+    "--classes=4",
+    "--fields=2",
+    "--methods=2",
+    "--edges=5",
+    "--participants=2",
+    "--calls=2",
+    "--depth=2",
+]
+
+
+class TestSyntheticDiagrams(unittest.TestCase):
+    def test_diagrams_are_valid(self):
+        class_diagram = make_class_diagram(classes=10, edges=20)
+        sequence_diagram = make_sequence_diagram(participants=3, calls=4, depth=3)
+
+        self.assertEqual(class_diagram_validator.validate(class_diagram), [])
+        self.assertEqual(sequence_diagram_validator.validate(sequence_diagram), [])
+        self.assertEqual(len(class_diagram["nodes"]), 10)
+        self.assertEqual(len(class_diagram["edges"]), 20)
+
+    def test_share_of_public_classes(self):
+        def count_public(diagram: dict) -> int:
+            return sum(node["name"].startswith("+") for node in diagram["nodes"])
+
+        self.assertEqual(count_public(make_class_diagram(classes=10)), 10)
+        self.assertEqual(count_public(make_class_diagram(classes=10, public=0.5)), 5)
+        self.assertEqual(count_public(make_class_diagram(classes=10, public=0)), 0)
+
+    def test_diagrams_are_deterministic(self):
+        self.assertEqual(make_class_diagram(), make_class_diagram())
+        self.assertEqual(make_sequence_diagram(), make_sequence_diagram())
+
+
+class TestBenchmarkRun(unittest.TestCase):
+    def test_every_stage_is_timed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "results.json")
+            status = main(
+                [*SMALL_SIZES, "--rounds=1", "--warmup=0", f"--output={output}"]
+            )
+            with open(output) as f:
+                results = json.load(f)
+
+        self.assertEqual(status, 0)
+        self.assertEqual(results["sizes"]["classes"], 4)
+        for stage in ["decode/class", "parse/sequence", "zip/build", "total/spring"]:
+            self.assertIn(stage, results["results"])
+            self.assertGreater(results["results"][stage]["median"], 0)
+
+    def test_django_stage_renders_pages(self):
+        stages = get_stages(parse_args(SMALL_SIZES))
+        render, _ = stages["django/class_files"]
+        files = render()
+
+        for name in ["create_views", "read_views", "edit_views", "delete_views"]:
+            self.assertTrue(files[name], name)
+        for name in ["create_pages", "read_pages", "edit_pages"]:
+            self.assertEqual(len(files[name]), 4, name)
+
+    def test_compare_finds_regressions(self):
+        baseline = {"sizes": {}, "results": {"parse/classes": {"median": 1.0}}}
+        faster = {"sizes": {}, "results": {"parse/classes": {"median": 0.9}}}
+        slower = {"sizes": {}, "results": {"parse/classes": {"median": 1.5}}}
+
+        self.assertTrue(compare(faster, baseline, 1.2))
+        self.assertFalse(compare(slower, baseline, 1.2))
@@ -1,19 +1,19 @@
+import io
 import os
 import tempfile
 import unittest
 import zipfile
 
-import anyio
 from fastapi.testclient import TestClient
 
-from app.main import app, convert_django
+from app.main import app
 
 CUR_DIR = os.path.dirname(os.path.realpath(__file__))
 TEST_DIR = os.path.join(CUR_DIR, "testdata")
 CSS_DIR = os.path.join(CUR_DIR, "..", "app", "templates", "css")
 
 
-class TestCssGeneratedFrontend(unittest.IsolatedAsyncioTestCase):
+class TestCssGeneratedFrontend(unittest.TestCase):
     def setUp(self):
         with open(os.path.join(TEST_DIR, "BurhanpediaLite.class.jet")) as f:
             self.class_diag = f.read()
@@ -61,27 +61,20 @@ class TestCssGeneratedFrontend(unittest.IsolatedAsyncioTestCase):
             resp = self.client.post("/convert", json=self.payload)
             self.assertEqual(resp.status_code, 422)
 
-    async def test_all_styles_give_correct_result(self):
+    def test_all_styles_give_correct_result(self):
         styles = ["classic", "dark", "minimalist", "modern", "vibrant"]
         for style in styles:
-            async with await anyio.open_file(
-                os.path.join(CSS_DIR, f"{style}.css")
-            ) as f:
-                expected = await f.read()
-            tmp_zip_path = await convert_django(
-                self.project_name, self.filenames, self.contents, style
-            )
-            with zipfile.ZipFile(tmp_zip_path, "r") as zipf:
+            with open(os.path.join(CSS_DIR, f"{style}.css")) as f:
+                expected = f.read()
+            self.payload["style_theme"] = style
+            resp = self.client.post("/convert", json=self.payload)
+            with zipfile.ZipFile(io.BytesIO(resp.content), "r") as zipf:
                 with zipf.open("static/css/style.css") as f:
                     self.assertEqual(expected, f.read().decode("utf-8"))
 
-            os.remove(tmp_zip_path)
-
-    async def test_static_related_settings_are_added(self):
-        tmp_zip_path = await convert_django(
-            self.project_name, self.filenames, self.contents, "modern"
-        )
-        with zipfile.ZipFile(tmp_zip_path, "r") as zipf:
+    def test_static_related_settings_are_added(self):
+        resp = self.client.post("/convert", json=self.payload)
+        with zipfile.ZipFile(io.BytesIO(resp.content), "r") as zipf:
             with zipf.open("templates/base.html") as basef:
                 self.assertIn(
                     """<link rel="stylesheet" href="{% static 'css/style.css' %}">""",
@@ -93,4 +86,3 @@ class TestCssGeneratedFrontend(unittest.IsolatedAsyncioTestCase):
                     "STATICFILES_DIRS = [BASE_DIR / 'static']",
                     settingsf.read().decode("utf-8"),
                 )
-        os.remove(tmp_zip_path)
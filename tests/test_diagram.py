@@ -213,6 +213,55 @@ listOfTargetclass = models.ManyToManyField('TargetClass')\n\tpass\n\n\n"
         }
         self.assertEqual(context, expected_context)
 
+    def test_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.class_object, "__dict__"))
+        self.assertFalse(hasattr(OneToOneRelationshipObject(), "__dict__"))
+
+    def test_fingerprint_is_stable(self):
+        self.class_object.set_name("TestClass")
+        other = ClassObject()
+        other.set_name("TestClass")
+        self.assertEqual(self.class_object.get_fingerprint(), other.get_fingerprint())
+
+    def test_fingerprint_changes_with_field(self):
+        self.class_object.set_name("TestClass")
+        fingerprint = self.class_object.get_fingerprint()
+
+        field = FieldObject()
+        field.set_name("price")
+        field_type = TypeObject()
+        field_type.set_name("int")
+        field.set_type(field_type)
+        self.class_object.add_field(field)
+        self.assertNotEqual(self.class_object.get_fingerprint(), fingerprint)
+
+    def test_fingerprint_changes_with_parent(self):
+        self.class_object.set_name("TestClass")
+        parent = ClassObject()
+        parent.set_name("Parent")
+        self.class_object.set_parent(parent)
+        fingerprint = self.class_object.get_fingerprint()
+
+        parent.set_is_public(True)
+        self.assertNotEqual(self.class_object.get_fingerprint(), fingerprint)
+
+    def test_get_ancestors(self):
+        parent = ClassObject()
+        grandparent = ClassObject()
+        self.class_object.set_parent(parent)
+        parent.set_parent(grandparent)
+
+        self.assertEqual(self.class_object.get_ancestors(), [parent, grandparent])
+        self.assertEqual(grandparent.get_ancestors(), [])
+
+    def test_get_ancestors_stops_at_cycle(self):
+        parent = ClassObject()
+        self.class_object.set_parent(parent)
+        parent.set_parent(self.class_object)
+
+        self.assertEqual(self.class_object.get_ancestors(), [parent])
+        self.assertEqual(len(self.class_object.get_fingerprint()), 64)
+
 
 class TestAbstractRelationshipObject(unittest.TestCase):
     def setUp(self):
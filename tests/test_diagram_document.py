@@ -0,0 +1,48 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from app.diagram_document import DiagramDocument, loads_json
+
+
+class TestLoadsJson(unittest.TestCase):
+    def test_loads_str_and_bytes(self):
+        self.assertEqual(loads_json('{"a": [1, 2]}'), {"a": [1, 2]})
+        self.assertEqual(loads_json(b'{"a": [1, 2]}'), {"a": [1, 2]})
+
+    def test_invalid_json_raises_json_decode_error(self):
+        with self.assertRaises(json.JSONDecodeError):
+            loads_json("{")
+
+    def test_falls_back_to_json_module(self):
+        with patch("app.diagram_document.orjson", None):
+            self.assertEqual(loads_json('{"a": 1}'), {"a": 1})
+            with self.assertRaises(json.JSONDecodeError):
+                loads_json("{")
+
+
+class TestDiagramDocument(unittest.TestCase):
+    def test_decode(self):
+        document = DiagramDocument.decode('{"diagram": "ClassDiagram", "nodes": []}')
+
+        self.assertEqual(document.get_diagram_type(), "ClassDiagram")
+        self.assertEqual(document.get_data(), {"diagram": "ClassDiagram", "nodes": []})
+
+    def test_missing_diagram_type(self):
+        self.assertIsNone(DiagramDocument.decode("{}").get_diagram_type())
+
+    def test_invalid_json(self):
+        with self.assertRaises(ValueError) as context:
+            DiagramDocument.decode('{"content"}')
+
+        self.assertEqual(str(context.exception), "Error: Invalid JSON format")
+
+    def test_not_an_object(self):
+        with self.assertRaises(ValueError) as context:
+            DiagramDocument.decode("[]")
+
+        self.assertEqual(str(context.exception), "Diagram type not found on .jet file")
+
+
+if __name__ == "__main__":
+    unittest.main()
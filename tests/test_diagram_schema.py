@@ -0,0 +1,129 @@
+import pickle
+import unittest
+from unittest.mock import patch
+
+from app.diagram_schema import (
+    CLASS_DIAGRAM_SCHEMA,
+    DiagramValidator,
+    SchemaValidationError,
+    class_diagram_validator,
+    fastjsonschema,
+    sequence_diagram_validator,
+)
+from app.parse_json_to_object_class import ParseJsonToObjectClass
+from app.parse_json_to_object_seq import ParseJsonToObjectSeq
+
+
+class TestDiagramValidator(unittest.TestCase):
+    def test_valid_sequence_diagram(self):
+        with open("tests/test_valid_json_seq.txt", "r", encoding="utf-8") as file:
+            parser = ParseJsonToObjectSeq()
+            self.assertEqual(parser.set_json(file.read()), "Success")
+
+    def test_violations_are_collected(self):
+        violations = sequence_diagram_validator.validate(
+            {
+                "diagram": "SequenceDiagram",
+                "nodes": [{"id": "0", "type": "CallNode"}],
+                "edges": [{"start": 0, "end": 1, "type": "Edge"}],
+            }
+        )
+
+        self.assertEqual(
+            [violation["path"] for violation in violations],
+            ["$", "edges/0/type", "nodes/0/id"],
+        )
+        self.assertEqual(violations[0]["message"], "'version' is a required property")
+
+    def test_schema_is_checked_once(self):
+        with patch("app.diagram_schema.validator_for") as mock_validator_for:
+            validator = DiagramValidator(CLASS_DIAGRAM_SCHEMA)
+            validator.validate({"nodes": []})
+            validator.validate({"nodes": []})
+
+        mock_validator_for.assert_called_once()
+        mock_validator_for.return_value.check_schema.assert_called_once()
+
+    def test_without_fast_validator(self):
+        with patch("app.diagram_schema.fastjsonschema", None):
+            validator = DiagramValidator(CLASS_DIAGRAM_SCHEMA)
+
+        self.assertEqual(validator.validate({"nodes": []}), [])
+        self.assertEqual(len(validator.validate({"nodes": [{}]})), 3)
+
+    @unittest.skipIf(fastjsonschema is None, "fastjsonschema is not installed")
+    def test_fast_validator_reports_every_violation(self):
+        self.assertEqual(len(class_diagram_validator.validate({"nodes": [{}]})), 3)
+
+
+class TestSchemaValidationError(unittest.TestCase):
+    def test_sequence_diagram_error(self):
+        with self.assertRaises(SchemaValidationError) as context:
+            ParseJsonToObjectSeq().set_json('{"diagram": "SequenceDiagram"}')
+
+        self.assertEqual(
+            str(context.exception),
+            "The .sequence.jet is not valid. \n"
+            "Please make sure the file submitted is not corrupt",
+        )
+        self.assertEqual(len(context.exception.violations), 3)
+
+    def test_class_diagram_error(self):
+        parser = ParseJsonToObjectClass({"nodes": [{"id": 0, "name": "Test"}]})
+
+        with self.assertRaises(SchemaValidationError) as context:
+            parser.parse_classes()
+
+        self.assertTrue(str(context.exception).startswith("The .class.jet is not"))
+        self.assertEqual(
+            context.exception.violations,
+            [{"path": "nodes/0", "message": "'methods' is a required property"}],
+        )
+
+    def test_class_diagram_is_only_checked_when_parsing_fails(self):
+        parser = ParseJsonToObjectClass(
+            {"nodes": [{"id": 0, "name": "Test", "methods": ""}], "edges": []}
+        )
+
+        with patch.object(class_diagram_validator, "validate") as mock_validate:
+            classes = parser.parse_classes()
+            parser.parse_relationships(classes)
+
+        mock_validate.assert_not_called()
+
+    def test_class_diagram_without_edges(self):
+        parser = ParseJsonToObjectClass(
+            {"nodes": [{"id": 0, "name": "Test", "methods": ""}]}
+        )
+
+        classes = parser.parse_classes()
+
+        self.assertEqual(parser.parse_relationships(classes), classes)
+
+    def test_edge_error(self):
+        parser = ParseJsonToObjectClass(
+            {
+                "nodes": [{"id": 0, "name": "Test", "methods": ""}],
+                "edges": [{"start": 0, "type": "GeneralizationEdge"}],
+            }
+        )
+        classes = parser.parse_classes()
+
+        with self.assertRaises(SchemaValidationError) as context:
+            parser.parse_relationships(classes)
+
+        self.assertEqual(
+            context.exception.violations,
+            [{"path": "edges/0", "message": "'end' is a required property"}],
+        )
+
+    def test_pickle(self):
+        error = SchemaValidationError("message", [{"path": "$", "message": "m"}])
+        copy = pickle.loads(pickle.dumps(error))
+
+        self.assertEqual(str(copy), "message")
+        self.assertEqual(copy.violations, error.violations)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,4 @@
-import tempfile
+import io
 import unittest
 import zipfile
 from unittest.mock import AsyncMock, patch
@@ -24,8 +24,8 @@ class TestDownloadSpringProject(unittest.IsolatedAsyncioTestCase):
     @patch("app.main.convert_spring")
     async def test_correct_proj_type(self, mock_spring: AsyncMock):
         """Should be modified after PBI 8-3 gets merged"""
-        tmp_zip = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
-        with zipfile.ZipFile(tmp_zip.name, "w") as f:
+        tmp_zip = io.BytesIO()
+        with zipfile.ZipFile(tmp_zip, "w") as f:
             f.writestr("build.gradle.kts", "testing")
             f.writestr("src", "")
             f.writestr("src/main", "")
@@ -33,8 +33,7 @@ class TestDownloadSpringProject(unittest.IsolatedAsyncioTestCase):
             f.writestr("src/main/java/com", "")
             f.writestr("src/main/java/com/motxt", "")
             f.writestr("src/main/java/com/motxt/spring", "")
-        tmp_zip.close()
-        mock_spring.return_value = tmp_zip.name
+        mock_spring.return_value = tmp_zip.getvalue()
         resp = client.post("/convert", json=self.json)
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.headers["content-type"], "application/zip")
@@ -48,16 +47,15 @@ class TestDownloadSpringProject(unittest.IsolatedAsyncioTestCase):
         When group_id is empty, will use com.example
         Should be modified after PBI 8-3 gets merged
         """
-        tmp_zip = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
-        with zipfile.ZipFile(tmp_zip.name, "w") as f:
+        tmp_zip = io.BytesIO()
+        with zipfile.ZipFile(tmp_zip, "w") as f:
             f.writestr("src", "")
             f.writestr("src/main", "")
             f.writestr("src/main/java", "")
             f.writestr("src/main/java/com", "")
             f.writestr("src/main/java/com/example", "")
             f.writestr("src/main/java/com/example/spring", "")
-        tmp_zip.close()
-        mock_spring.return_value = tmp_zip.name
+        mock_spring.return_value = tmp_zip.getvalue()
         self.json.pop("group_id")
         resp = client.post("/convert", json=self.json)
         self.assertEqual(resp.status_code, 200)
@@ -1,70 +1,36 @@
 import json
-import os
-import shutil
-import tempfile
 import unittest
 import zipfile
 
-from app.generate_frontend.create.generate_create_page_django import (
-    generate_html_create_pages_django,
-)
-from app.main import (
-    fetch_data,
-    generate_file_to_be_downloaded,
-    get_names_from_classes,
-)
-from app.models.elements import RequirementsElements, UrlsElement
+from app.generation_plan import generate_django_files
+from app.main import fetch_data, iter_file_to_be_downloaded
 
 
-class TestGenerateFileToBeDownloadedPrivate(unittest.TestCase):
+def file_names(project_name: str, data: dict) -> list[str]:
+    """Paths of the Django project files, in the order they are added to the zip"""
+    return [
+        name.filename if isinstance(name, zipfile.ZipInfo) else name
+        for name, _ in iter_file_to_be_downloaded(
+            project_name,
+            data["models"],
+            data["views"],
+            data["model_element"],
+            data["django_files"],
+        )
+    ]
+
+
+class TestDjangoProjectFilesPrivate(unittest.TestCase):
     def setUp(self):
-        # Create a temporary directory and switch to it.
         with open("tests/testdata/input_generate_file_to_be_downloaded.json", "r") as f:
             json_data = json.load(f)
         self.filename = json_data["filename"]
         self.content = json_data["content"]
-        data = fetch_data(self.filename, self.content)
-        writer_requirements = RequirementsElements("requirements.txt")
-        writer_urls = UrlsElement("urls.py")
-        # simulate the creation of requirements.txt and urls.py instead of using write_to_file()
-        with open(os.path.join(os.getcwd(), "app", "requirements.txt"), "w") as f:
-            f.write(writer_requirements.print_django_style())
-
-        self.models_content = data["models"]
-        self.views_content = data["views"]
-        self.writer_models = data["model_element"]
+        self.data = fetch_data(self.filename, self.content)
         self.project_name = self.filename[0]
-        writer_urls.set_classes(self.writer_models.get_classes())
-        with open(os.path.join(os.getcwd(), "app", "urls.py"), "w") as f:
-            f.write(writer_urls.print_django_style())
 
-        self.tmp_zip = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
-
-    def tearDown(self):
-        # Remove any created zip file or project folder.
-        if os.path.exists(f"{self.project_name}.zip"):
-            os.remove(f"{self.project_name}.zip")
-        if os.path.exists(f"project_{self.project_name}"):
-            shutil.rmtree(f"project_{self.project_name}")
-        if os.path.exists(f"{self.project_name}_models.py"):
-            os.remove(f"{self.project_name}_models.py")
-        if os.path.exists(f"{self.project_name}_views.py"):
-            os.remove(f"{self.project_name}_views.py")
-        if os.path.exists(os.path.join(os.getcwd(), "app", "requirements.txt")):
-            os.remove(os.path.join(os.getcwd(), "app", "requirements.txt"))
-        if os.path.exists(os.path.join(os.getcwd(), "app", "urls.py")):
-            os.remove(os.path.join(os.getcwd(), "app", "urls.py"))
-        self.tmp_zip.close()
-        os.remove(self.tmp_zip.name)
-
-    def test_generate_file_to_be_downloaded(self):
-        result = generate_file_to_be_downloaded(
-            self.project_name,
-            self.models_content,
-            self.views_content,
-            self.writer_models,
-            self.tmp_zip.name,
-        )
+    def test_files_of_project(self):
+        result = file_names(self.project_name, self.data)
 
         # Expected output in the zip file.
         expected_output = [
@@ -90,86 +56,12 @@ class TestGenerateFileToBeDownloadedPrivate(unittest.TestCase):
             "main/templates/landing_page.html",
             "templates/base.html",
         ]
-        for path in expected_output:
-            self.assertIn(path, result)
-        with zipfile.ZipFile(self.tmp_zip.name, "r") as zipf:
-            for file in zipf.namelist():
-                self.assertIn(file, expected_output)
-
-    def test_generate_file_to_be_downloaded_without_requirements(self):
-        if os.path.exists(os.path.join(os.getcwd(), "app", "requirements.txt")):
-            os.remove(os.path.join(os.getcwd(), "app", "requirements.txt"))
-        with self.assertRaises(FileNotFoundError) as ctx:
-            generate_file_to_be_downloaded(
-                self.project_name,
-                self.models_content,
-                self.views_content,
-                self.writer_models,
-                self.tmp_zip.name,
-            )
-        self.assertEqual(
-            str(ctx.exception),
-            "File requirements.txt does not exist",
-        )
-
-    def test_generate_file_to_be_downloaded_without_urls(self):
-        if os.path.exists(os.path.join(os.getcwd(), "app", "urls.py")):
-            os.remove(os.path.join(os.getcwd(), "app", "urls.py"))
-        with self.assertRaises(FileNotFoundError) as ctx:
-            generate_file_to_be_downloaded(
-                self.project_name,
-                self.models_content,
-                self.views_content,
-                self.writer_models,
-                self.tmp_zip.name,
-            )
-        self.assertEqual(
-            str(ctx.exception),
-            "File urls.py does not exist",
-        )
-
-    def test_generate_file_to_be_downloaded_multiple_calls(self):
-        """
-        Call generate_file_to_be_downloaded() twice in a row to ensure that the function
-        cleans up previous zip files and project directories properly.
-        """
-        # First call: generate the file
-        tmp_zipfile = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
-        result_first = generate_file_to_be_downloaded(
-            self.project_name,
-            self.models_content,
-            self.views_content,
-            self.writer_models,
-            tmp_zipfile.name,
-        )
-        self.assertTrue(os.path.exists(tmp_zipfile.name))
-        with zipfile.ZipFile(tmp_zipfile.name, "r") as zipf:
-            content_first = zipf.namelist()
-        # Store the file list from the first generation.
-        expected_files_first = set(result_first)
-
-        # Second call: generate the file again with the same parameters.
-        result_second = generate_file_to_be_downloaded(
-            self.project_name,
-            self.models_content,
-            self.views_content,
-            self.writer_models,
-            self.tmp_zip.name,
-        )
-        self.assertTrue(os.path.exists(self.tmp_zip.name))
-        with zipfile.ZipFile(self.tmp_zip.name, "r") as zipf:
-            content_second = zipf.namelist()
-        # Ensure that both generated outputs are the same.
-        expected_files_second = set(result_second)
-        self.assertEqual(set(content_first), expected_files_second)
-        self.assertEqual(set(content_second), expected_files_first)
-        tmp_zipfile.close()
-        os.remove(tmp_zipfile.name)
+        self.assertEqual(sorted(result), sorted(expected_output))
 
 
-class TestGenerateFileToBeDownloadedPublic(unittest.TestCase):
+class TestDjangoProjectFilesPublic(unittest.TestCase):
     def setUp(self):
-        # Create a temporary directory (if needed) and load test input.
+        # Load test input.
         with open(
             "tests/testdata/input_generate_file_to_be_downloaded_public.json", "r"
         ) as f:
@@ -177,59 +69,17 @@ class TestGenerateFileToBeDownloadedPublic(unittest.TestCase):
         self.filename = json_data["filename"]
         self.content = json_data["content"]
         self.project_name = json_data["project_name"]
-        data = fetch_data(self.filename, self.content)
-        writer_requirements = RequirementsElements("requirements.txt")
-        writer_urls = UrlsElement("urls.py")
-        # simulate the creation of requirements.txt and urls.py instead of using write_to_file()
-        with open(os.path.join(os.getcwd(), "app", "requirements.txt"), "w") as f:
-            f.write(writer_requirements.print_django_style())
-
-        self.models_content = data["models"]
-        self.views_content = data["views"]
-        self.writer_models = data["model_element"]
-        writer_urls.set_classes(self.writer_models.get_classes())
-        with open(os.path.join(os.getcwd(), "app", "urls.py"), "w") as f:
-            f.write(writer_urls.print_django_style())
-
-        self.tmp_zip = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
+        self.data = fetch_data(self.filename, self.content)
+        self.writer_models = self.data["model_element"]
 
-    def tearDown(self):
-        # Cleanup the generated files and directories.
-        zip_file = f"{self.project_name}.zip"
-        project_dir = f"project_{self.project_name}"
-        if os.path.exists(project_dir):
-            shutil.rmtree(project_dir)
-        for file in [
-            zip_file,
-            f"{self.project_name}_models.py",
-            f"{self.project_name}_views.py",
-            os.path.join("app", "requirements.txt"),
-            os.path.join("app", "urls.py"),
-        ]:
-            if os.path.exists(file):
-                os.remove(file)
-
-        self.tmp_zip.close()
-        os.remove(self.tmp_zip.name)
-
-    def test_generate_file_to_be_downloaded_invalid_project_name(self):
+    def test_invalid_project_name(self):
         """
         If an invalid project name is provided (e.g., contains whitespace or digits)
-        then create_django_project should raise a ValueError. Since generate_file_to_be_downloaded
-        calls create_django_project, this error will propagate.
+        then rendering the Django project should raise a ValueError.
         """
         invalid_project_name = "invalid project1"
-        # Ensure that a zip file with invalid_project_name does not exist
-        if os.path.exists(f"{invalid_project_name}.zip"):
-            os.remove(f"{invalid_project_name}.zip")
         with self.assertRaises(ValueError) as context:
-            generate_file_to_be_downloaded(
-                invalid_project_name,
-                self.models_content,
-                self.views_content,
-                self.writer_models,
-                self.tmp_zip.name,
-            )
+            file_names(invalid_project_name, self.data)
         self.assertIn(
             "Project name must not contain whitespace or number!",
             str(context.exception),
@@ -240,13 +90,7 @@ class TestGenerateFileToBeDownloadedPublic(unittest.TestCase):
         Verify that the zip file generated contains the required files.
         This list is compared against the expected list from the generation process.
         """
-        generate_file_to_be_downloaded(
-            self.project_name,
-            self.models_content,
-            self.views_content,
-            self.writer_models,
-            self.tmp_zip.name,
-        )
+        zip_contents = file_names(self.project_name, self.data)
         expected_files = [
             "ini/asgi.py",
             "manage.py",
@@ -277,12 +121,10 @@ class TestGenerateFileToBeDownloadedPublic(unittest.TestCase):
             "templates/base.html",
         ]
 
-        with zipfile.ZipFile(self.tmp_zip.name, "r") as zipf:
-            zip_contents = zipf.namelist()
         for file in expected_files:
             self.assertIn(file, zip_contents)
 
-    def test_generate_file_to_be_downloaded_html_files(self):
+    def test_html_files(self):
         """
         Verify that the generated zip file contains all HTML files
         that has been generated for each model.
@@ -292,14 +134,11 @@ class TestGenerateFileToBeDownloadedPublic(unittest.TestCase):
         main/templates/read_<model_name>.html
         main/templates/edit_<model_name>.html
         """
-        generate_file_to_be_downloaded(
-            self.project_name,
-            self.models_content,
-            self.views_content,
-            self.writer_models,
-            self.tmp_zip.name,
-        )
-
+        zip_contents = [
+            file
+            for file in file_names(self.project_name, self.data)
+            if file.startswith("main/templates/")
+        ]
         expected_html_files = [
             "main/templates/create_shape.html",
             "main/templates/create_circle.html",
@@ -312,18 +151,11 @@ class TestGenerateFileToBeDownloadedPublic(unittest.TestCase):
             "main/templates/landing_page.html",
         ]
 
-        with zipfile.ZipFile(self.tmp_zip.name, "r") as zipf:
-            zip_contents = zipf.namelist()
-            zip_contents = [
-                file for file in zip_contents if file.startswith("main/templates/")
-            ]
-
         for file in expected_html_files:
             self.assertIn(file, zip_contents)
 
-    def test_get_names_from_classes(self):
-        create_pages = generate_html_create_pages_django(self.writer_models)
-        result = get_names_from_classes(self.writer_models, create_pages)
+    def test_create_pages_by_class(self):
+        result = generate_django_files(self.writer_models)["create_pages"]
         expected_class = [
             "Shape",
             "Circle",
@@ -334,9 +166,11 @@ class TestGenerateFileToBeDownloadedPublic(unittest.TestCase):
             '{% extends \'base.html\' %}\n{% block content %}\n    <h1>Create Circle </h1>\n    <form method="POST">\n        {% csrf_token %}\n        {{ form.as_p }} \n        <button type="submit">Create Circle</button>\n    </form>\n{% endblock content %}',  # noqa: E501
             '{% extends \'base.html\' %}\n{% block content %}\n    <h1>Create Circles </h1>\n    <form method="POST">\n        {% csrf_token %}\n        {{ form.as_p }} \n        <button type="submit">Create Circles</button>\n    </form>\n{% endblock content %}',  # noqa: E501
         ]
-        for name, page in result.items():
-            self.assertIn(name, expected_class)
-            self.assertIn(page, expected_pages)
+        self.assertEqual(list(result), expected_class)
+        self.assertEqual(list(result.values()), expected_pages)
+        # Circle is part of Circles, but each page is mapped to its own class
+        self.assertIn("<h1>Create Circle </h1>", result["Circle"])
+        self.assertIn("<h1>Create Circles </h1>", result["Circles"])
 
     def test_fetch_data_no_diagram_key_in_json(self):
         filenames = ["testing"]
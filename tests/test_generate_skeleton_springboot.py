@@ -0,0 +1,72 @@
+import io
+import unittest
+import zipfile
+
+from app.archive import ZipArchive
+from app.generate_skeleton_springboot.generate_skeleton_springboot import (
+    generate_springboot_skeleton,
+    get_application_class_name,
+)
+
+
+class TestGenerateSkeletonSpringboot(unittest.TestCase):
+    def setUp(self):
+        archive = ZipArchive()
+        archive.extend(generate_springboot_skeleton("demo", "com.example"))
+        self.zipf = zipfile.ZipFile(io.BytesIO(archive.build()))
+
+    def tearDown(self):
+        self.zipf.close()
+
+    def read(self, name: str) -> str:
+        return self.zipf.read(name).decode("utf-8")
+
+    def test_get_application_class_name(self):
+        self.assertEqual(get_application_class_name("demo"), "DemoApplication")
+        self.assertEqual(get_application_class_name("iniGacor"), "IniGacorApplication")
+
+    def test_skeleton_files(self):
+        self.assertEqual(
+            self.zipf.namelist(),
+            [
+                ".gitignore",
+                "build.gradle.kts",
+                "settings.gradle.kts",
+                "gradlew",
+                "gradlew.bat",
+                "gradle/wrapper/gradle-wrapper.properties",
+                "src/main/java/com/example/demo/DemoApplication.java",
+                "src/main/resources/application.properties",
+                "src/test/java/com/example/demo/DemoApplicationTests.java",
+            ],
+        )
+
+    def test_build_gradle(self):
+        build = self.read("build.gradle.kts")
+        self.assertIn('group = "com.example"', build)
+        self.assertIn('id("org.springframework.boot") version "3.4.4"', build)
+        self.assertIn(
+            'implementation("org.springframework.boot:spring-boot-starter-web")', build
+        )
+
+    def test_settings_gradle(self):
+        self.assertEqual(self.read("settings.gradle.kts"), 'rootProject.name = "demo"')
+
+    def test_application_class(self):
+        application = self.read("src/main/java/com/example/demo/DemoApplication.java")
+        self.assertIn("package com.example.demo;", application)
+        self.assertIn("public class DemoApplication {", application)
+        self.assertIn(
+            "SpringApplication.run(DemoApplication.class, args);", application
+        )
+
+    def test_application_properties(self):
+        properties = self.read("src/main/resources/application.properties")
+        self.assertTrue(properties.startswith("spring.application.name=demo\n"))
+        self.assertIn("spring.datasource.url=jdbc:sqlite:mydatabase.db\n", properties)
+
+    def test_gradlew_is_executable(self):
+        mode = self.zipf.getinfo("gradlew").external_attr >> 16
+        self.assertEqual(mode & 0o777, 0o755)
+        self.assertIn("gradle wrapper --gradle-version", self.read("gradlew"))
+        self.assertIn("gradle wrapper --gradle-version", self.read("gradlew.bat"))
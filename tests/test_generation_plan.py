@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import patch
+
+from app.generation_plan import (
+    build_class_context,
+    generate_django_files,
+    plan_django_files,
+)
+from app.models.diagram import ClassObject, FieldObject
+from app.models.elements import ModelsElements, UrlsElement
+
+
+class TestGenerationPlan(unittest.TestCase):
+    def setUp(self):
+        self.models_elements = ModelsElements("models.py")
+        for name, fields, is_public in [
+            ("OrderItem", ["quantity", "price"], True),
+            ("Order", ["date"], True),
+            ("EmptyClass", [], True),
+            ("PrivateClass", ["secret"], False),
+        ]:
+            class_object = ClassObject()
+            class_object.set_name(name)
+            class_object.set_is_public(is_public)
+            for field_name in fields:
+                field = FieldObject()
+                field.set_name(field_name)
+                class_object.add_field(field)
+            self.models_elements.add_class(class_object)
+
+    def test_views_of_public_classes(self):
+        result = generate_django_files(self.models_elements)
+
+        for name in ["order_item", "order", "empty_class"]:
+            self.assertIn(f"def create_{name}(request):", result["create_views"])
+            self.assertIn(f"def get_{name}(request):", result["read_views"])
+            self.assertIn(f"def delete_{name}(request):", result["delete_views"])
+        for views in ("create_views", "read_views", "delete_views", "edit_views"):
+            self.assertNotIn("private_class", result[views])
+
+    def test_edit_views_of_classes_with_fields(self):
+        result = generate_django_files(self.models_elements)
+
+        self.assertIn("def edit_order_item(request, id):", result["edit_views"])
+        self.assertIn(
+            "form = OrderForm(request.POST or None, instance=order_obj)",
+            result["edit_views"],
+        )
+        self.assertNotIn("edit_empty_class", result["edit_views"])
+
+    def test_forms(self):
+        result = generate_django_files(self.models_elements)
+
+        self.assertIn("class OrderItemForm(forms.ModelForm):", result["forms"])
+        self.assertIn("class EmptyClassForm(forms.ModelForm):", result["forms"])
+        self.assertNotIn("PrivateClassForm", result["forms"])
+
+    def test_urls(self):
+        writer_url = UrlsElement()
+        writer_url.set_classes(self.models_elements.get_classes())
+
+        result = generate_django_files(self.models_elements)
+
+        self.assertEqual(result["urls"], writer_url.print_django_style())
+
+    def test_pages(self):
+        result = generate_django_files(self.models_elements)
+
+        self.assertEqual(
+            list(result["create_pages"]), ["OrderItem", "Order", "EmptyClass"]
+        )
+        self.assertIn("<h1>Create OrderItem </h1>", result["create_pages"]["OrderItem"])
+        self.assertEqual(
+            list(result["read_pages"]), ["OrderItem", "Order", "EmptyClass"]
+        )
+        self.assertIn("<h1>Order List</h1>", result["read_pages"]["Order"])
+        self.assertIn("<th>Edit</th>", result["read_pages"]["Order"])
+        self.assertNotIn("<th>Edit</th>", result["read_pages"]["EmptyClass"])
+        self.assertEqual(list(result["edit_pages"]), ["OrderItem", "Order"])
+        self.assertIn("<title>Edit Order</title>", result["edit_pages"]["Order"])
+
+    def test_class_without_name_has_no_edit_page(self):
+        class_object = ClassObject()
+        class_object.set_name("")
+        class_object.set_is_public(True)
+        field = FieldObject()
+        field.set_name("value")
+        class_object.add_field(field)
+
+        result = plan_django_files().run([class_object])
+
+        self.assertEqual(list(result["create_pages"]), [""])
+        self.assertEqual(result["edit_pages"], {})
+
+    def test_class_context_built_once_per_class(self):
+        with patch(
+            "app.generation_plan.build_class_context", wraps=build_class_context
+        ) as mock_build:
+            plan_django_files().run(self.models_elements.get_classes())
+        self.assertEqual(mock_build.call_count, 4)
+
+    def test_class_context(self):
+        context = build_class_context(self.models_elements.get_classes()[0])
+        self.assertEqual(context["name"], "OrderItem")
+        self.assertEqual(context["snake_name"], "order_item")
+        self.assertEqual(context["fields"], [{"name": "quantity"}, {"name": "price"}])
+        self.assertTrue(context["has_edit"])
+
+    def test_no_classes(self):
+        with self.assertRaises(ValueError) as ctx:
+            generate_django_files(ModelsElements("models.py"))
+        self.assertEqual(
+            str(ctx.exception), "ModelsElements does not contain any classes!"
+        )
@@ -0,0 +1,108 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+from prometheus_client import REGISTRY
+
+from app.http_client import HttpClient, http_client_retries
+
+
+def make_response(status_code: int) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+class TestHttpClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = HttpClient(httpx.Limits(), httpx.Timeout(5), 2, 0.5, False)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    @patch("app.http_client.asyncio.sleep")
+    @patch("app.http_client.httpx.AsyncClient.get")
+    async def test_retry_after_timeout(
+        self, mock_get: AsyncMock, mock_sleep: AsyncMock
+    ):
+        mock_get.side_effect = [httpx.TimeoutException("Timeout"), make_response(200)]
+        retries = http_client_retries._value.get()
+
+        resp = await self.client.get("http://initializr/starter.zip")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(mock_get.call_count, 2)
+        mock_sleep.assert_called_once_with(0.5)
+        self.assertEqual(http_client_retries._value.get(), retries + 1)
+
+    @patch("app.http_client.asyncio.sleep")
+    @patch("app.http_client.httpx.AsyncClient.get")
+    async def test_backoff_is_exponential(
+        self, mock_get: AsyncMock, mock_sleep: AsyncMock
+    ):
+        mock_get.side_effect = httpx.NetworkError("Connection error")
+
+        with self.assertRaises(httpx.NetworkError):
+            await self.client.get("http://initializr/starter.zip")
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0])
+
+    @patch("app.http_client.asyncio.sleep")
+    @patch("app.http_client.httpx.AsyncClient.get")
+    async def test_retry_on_unavailable_status(self, mock_get: AsyncMock, _):
+        mock_get.side_effect = [make_response(503), make_response(200)]
+
+        resp = await self.client.get("http://initializr/starter.zip")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("app.http_client.asyncio.sleep")
+    @patch("app.http_client.httpx.AsyncClient.get")
+    async def test_last_unavailable_response_is_returned(self, mock_get: AsyncMock, _):
+        mock_get.return_value = make_response(503)
+
+        resp = await self.client.get("http://initializr/starter.zip")
+
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("app.http_client.httpx.AsyncClient.get")
+    async def test_server_error_is_not_retried(self, mock_get: AsyncMock):
+        mock_get.return_value = make_response(500)
+
+        resp = await self.client.get("http://initializr/starter.zip")
+
+        self.assertEqual(resp.status_code, 500)
+        mock_get.assert_called_once_with("http://initializr/starter.zip")
+
+    @patch("app.http_client.httpx.AsyncClient.get")
+    async def test_started_client_is_reused(self, mock_get: AsyncMock):
+        mock_get.return_value = make_response(200)
+        self.client.start()
+
+        with patch("app.http_client.httpx.AsyncClient") as mock_client_class:
+            await self.client.get("http://initializr/starter.zip")
+            await self.client.get("http://initializr/starter.zip")
+
+        mock_client_class.assert_not_called()
+        self.assertEqual(mock_get.call_count, 2)
+
+    async def test_client_not_started_uses_new_client(self):
+        with patch("app.http_client.httpx.AsyncClient") as mock_client_class:
+            instance = mock_client_class.return_value.__aenter__.return_value
+            instance.get = AsyncMock(return_value=make_response(200))
+
+            await self.client.get("http://initializr/starter.zip")
+
+        mock_client_class.assert_called_once()
+        instance.get.assert_called_once_with("http://initializr/starter.zip")
+
+    async def test_connection_metrics_of_new_pool(self):
+        self.client.start()
+        for state in ("active", "idle"):
+            self.assertEqual(
+                REGISTRY.get_sample_value("http_client_connections", {"state": state}),
+                0,
+            )
@@ -1,8 +1,7 @@
-import os
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, patch
 
-import anyio
 import httpx
 from fastapi import HTTPException
 
@@ -10,17 +9,22 @@ from app.config import SPRING_DEPENDENCIES
 from app.main import initialize_springboot_zip
 
 
+async def refreshes():
+    """Waits for the starter.zip files being fetched in the background"""
+    await asyncio.gather(*asyncio.all_tasks() - {asyncio.current_task()})
+
+
 class TestInitializeSpringZip(unittest.IsolatedAsyncioTestCase):
     @patch("app.main.httpx.AsyncClient.get")
     async def test_successful_download_with_zip_content(self, mock_get: AsyncMock):
-        """Test successful download with zip content returns tempfile path"""
+        """Test successful download with zip content returns the zip content"""
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.headers = {"content-type": "application/zip"}
         mock_response.content = b"PK\x03\x04"
 
         mock_get.return_value = mock_response
-        temp_file_path = await initialize_springboot_zip("testing", "com.motxt")
+        content = await initialize_springboot_zip("testing", "com.motxt")
 
         params = {
             "javaVersion": "21",
@@ -31,13 +35,10 @@ class TestInitializeSpringZip(unittest.IsolatedAsyncioTestCase):
             "type": "gradle-project-kotlin",
             "dependencies": SPRING_DEPENDENCIES,
         }
-        mock_get.assert_called_once_with("http://localhost:8080/starter.zip", params=params)
-        self.assertTrue(temp_file_path.endswith(".zip"))
-        # Verify file exists and has content
-        async with await anyio.open_file(temp_file_path, "rb") as f:
-            self.assertEqual(await f.read(), b"PK\x03\x04")
-
-        os.remove(temp_file_path)
+        mock_get.assert_called_once_with(
+            "http://localhost:8080/starter.zip", params=params
+        )
+        self.assertEqual(content, b"PK\x03\x04")
 
     @patch("app.main.httpx.AsyncClient.get")
     async def test_non_200_status_raises_exception(self, mock_get: AsyncMock):
@@ -123,9 +124,80 @@ class TestInitializeSpringZip(unittest.IsolatedAsyncioTestCase):
 
         mock_get.return_value = mock_response
 
-        temp_file_path = await initialize_springboot_zip("testing", "com.motxt")
+        content = await initialize_springboot_zip("testing", "com.motxt")
+
+        self.assertEqual(len(content), len(large_content))
+
+    @patch("app.main.httpx.AsyncClient.get")
+    async def test_second_download_uses_cache(self, mock_get: AsyncMock):
+        """Test the same project doesn't request Initializr twice"""
+        mock_response = AsyncMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/zip"}
+        mock_response.content = b"PK\x03\x04"
+
+        mock_get.return_value = mock_response
+        await initialize_springboot_zip("testing", "com.motxt")
+        content = await initialize_springboot_zip("testing", "com.motxt")
+
+        mock_get.assert_called_once()
+        self.assertEqual(content, b"PK\x03\x04")
+
+    @patch("app.main.httpx.AsyncClient.get")
+    async def test_different_project_is_not_cached(self, mock_get: AsyncMock):
+        mock_response = AsyncMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/zip"}
+        mock_response.content = b"PK\x03\x04"
+
+        mock_get.return_value = mock_response
+        await initialize_springboot_zip("testing", "com.motxt")
+        await initialize_springboot_zip("testing", "com.other")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("app.main.httpx.AsyncClient.get")
+    async def test_stale_cache_served_while_refreshing(self, mock_get: AsyncMock):
+        """Test an expired starter.zip is returned at once and fetched again after"""
+        mock_response = AsyncMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/zip"}
+        mock_response.content = b"PK\x03\x04"
+        mock_get.return_value = mock_response
+        with patch("app.starter_cache.time.time", return_value=0):
+            await initialize_springboot_zip("testing", "com.motxt")
+
+        mock_get.reset_mock()
+        mock_response.content = b"PK\x03\x04new"
+        with patch("app.starter_cache.time.time", return_value=3600):
+            content = await initialize_springboot_zip("testing", "com.motxt")
+            mock_get.assert_not_called()
+            await refreshes()
 
-        async with await anyio.open_file(temp_file_path, "rb") as f:
-            self.assertEqual(len(await f.read()), len(large_content))
+        mock_get.assert_called_once()
+        self.assertEqual(content, b"PK\x03\x04")
+        content = await initialize_springboot_zip("testing", "com.motxt")
+        self.assertEqual(content, b"PK\x03\x04new")
 
-        os.remove(temp_file_path)
+    @patch("app.main.httpx.AsyncClient.get")
+    async def test_stale_cache_used_when_initializr_is_down(self, mock_get: AsyncMock):
+        """Test an expired starter.zip is returned when Initializr can't be reached"""
+        with patch("app.starter_cache.time.time", return_value=0):
+            mock_response = AsyncMock()
+            mock_response.status_code = 200
+            mock_response.headers = {"content-type": "application/zip"}
+            mock_response.content = b"PK\x03\x04"
+            mock_get.return_value = mock_response
+            await initialize_springboot_zip("testing", "com.motxt")
+
+        mock_get.reset_mock()
+        mock_get.side_effect = httpx.TimeoutException("Timeout")
+        with (
+            patch("app.starter_cache.time.time", return_value=3600),
+            self.assertLogs("uvicorn.error", "WARNING"),
+        ):
+            content = await initialize_springboot_zip("testing", "com.motxt")
+            await refreshes()
+
+        mock_get.assert_called_once()
+        self.assertEqual(content, b"PK\x03\x04")
@@ -0,0 +1,178 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from collections.abc import Awaitable, Callable
+from unittest.mock import patch
+
+from fastapi import HTTPException
+
+from app.job_queue import Job, JobQueue
+from app.model import ConvertRequest
+
+
+def make_request(project_name: str = "test") -> ConvertRequest:
+    return ConvertRequest(
+        filename=["test"], content=[["{}"]], project_name=project_name
+    )
+
+
+async def wait_until_finished(job: Job) -> Job:
+    for _ in range(100):
+        if job.is_finished():
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job.id} didn't finish")
+
+
+class TestJob(unittest.TestCase):
+    def test_progress(self):
+        job = Job(make_request())
+        job.start_rendering(2)
+        job.class_rendered()
+        files = list(job.track(["a", "b", "c"]))
+
+        self.assertEqual(files, ["a", "b", "c"])
+        self.assertEqual(job.to_dict()["status"], "rendering")
+        self.assertEqual(
+            job.to_dict()["progress"],
+            {"classes_rendered": 1, "classes_total": 2, "files": 3},
+        )
+
+
+class TestJobQueue(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "jobs.sqlite3")
+        self.queues: list[JobQueue] = []
+
+    async def asyncTearDown(self):
+        for queue in self.queues:
+            await queue.close()
+        self.tmp_dir.cleanup()
+
+    def make_queue(
+        self,
+        runner: Callable[[Job], Awaitable[bytes]],
+        db_path: str | None = None,
+        max_queued: int = 8,
+        ttl: float = 60,
+        max_finished: int = 8,
+    ) -> JobQueue:
+        queue = JobQueue(runner, 1, max_queued, max_finished, ttl, db_path)
+        self.queues.append(queue)
+        return queue
+
+    async def test_successful_job(self):
+        async def runner(job: Job) -> bytes:
+            return job.request.project_name.encode()
+
+        queue = self.make_queue(runner)
+        job = await queue.submit(make_request())
+        self.assertIs(await queue.get(job.id), job)
+
+        await wait_until_finished(job)
+        self.assertEqual(job.status, "done")
+        self.assertIsNone(job.error)
+        self.assertEqual(await queue.get_result(job), b"test")
+
+    async def test_failed_job(self):
+        async def runner(job: Job) -> bytes:
+            raise HTTPException(status_code=422, detail="Invalid diagram")
+
+        queue = self.make_queue(runner)
+        job = await wait_until_finished(await queue.submit(make_request()))
+
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.error, {"status_code": 422, "detail": "Invalid diagram"})
+        self.assertIsNone(await queue.get_result(job))
+
+    async def test_unexpected_error(self):
+        async def runner(job: Job) -> bytes:
+            raise RuntimeError("boom")
+
+        queue = self.make_queue(runner)
+        job = await wait_until_finished(await queue.submit(make_request()))
+
+        self.assertEqual(job.error, {"status_code": 500, "detail": "boom"})
+
+    async def test_full_queue(self):
+        started = asyncio.Event()
+
+        async def runner(job: Job) -> bytes:
+            started.set()
+            await asyncio.Event().wait()
+
+        queue = self.make_queue(runner, max_queued=1)
+        await queue.submit(make_request())
+        await started.wait()
+        await queue.submit(make_request())
+
+        with self.assertRaises(HTTPException) as context:
+            await queue.submit(make_request())
+        self.assertEqual(context.exception.status_code, 503)
+
+    async def test_finished_job_expires(self):
+        async def runner(job: Job) -> bytes:
+            return b"zip"
+
+        queue = self.make_queue(runner, ttl=60)
+        job = await wait_until_finished(await queue.submit(make_request()))
+
+        with patch("app.job_queue.time.time", return_value=time.time() + 61):
+            self.assertIsNone(await queue.get(job.id))
+
+    async def test_only_most_recent_finished_jobs_are_kept(self):
+        async def runner(job: Job) -> bytes:
+            return b"zip"
+
+        for db_path in (None, self.db_path):
+            queue = self.make_queue(runner, db_path, max_finished=2)
+            jobs = []
+            for _ in range(3):
+                jobs.append(
+                    await wait_until_finished(await queue.submit(make_request()))
+                )
+
+            self.assertIsNone(await queue.get(jobs[0].id))
+            self.assertIs(await queue.get(jobs[1].id), jobs[1])
+            self.assertIs(await queue.get(jobs[2].id), jobs[2])
+
+    async def test_result_is_stored_in_database(self):
+        async def runner(job: Job) -> bytes:
+            return b"zip"
+
+        queue = self.make_queue(runner, self.db_path)
+        job = await wait_until_finished(await queue.submit(make_request()))
+        self.assertIsNone(job.result)
+        self.assertEqual(await queue.get_result(job), b"zip")
+        await queue.close()
+
+        restarted = self.make_queue(runner, self.db_path)
+        await restarted.start()
+        stored = await restarted.get(job.id)
+        self.assertEqual(stored.status, "done")
+        self.assertEqual(stored.request, job.request)
+        self.assertEqual(await restarted.get_result(stored), b"zip")
+
+    async def test_unfinished_job_is_run_after_restart(self):
+        async def stuck_runner(job: Job) -> bytes:
+            await asyncio.Event().wait()
+
+        async def runner(job: Job) -> bytes:
+            return b"zip"
+
+        queue = self.make_queue(stuck_runner, self.db_path)
+        job = await queue.submit(make_request())
+        await queue.close()
+
+        restarted = self.make_queue(runner, self.db_path)
+        await restarted.start()
+        stored = await wait_until_finished(await restarted.get(job.id))
+        self.assertEqual(stored.status, "done")
+        self.assertEqual(await restarted.get_result(stored), b"zip")
+
+
+if __name__ == "__main__":
+    unittest.main()
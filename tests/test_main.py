@@ -1,12 +1,37 @@
+import asyncio
+import io
+import json
 import os
+import time
+import zipfile
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
-
-from app.main import app, check_duplicate, convert_spring
+from httpx import Response
+
+from app.archive import CompressedData
+from app.artifact_cache import ArtifactCache
+from app.diagram_document import DiagramDocument, loads_json
+from app.generate_service_springboot.generate_service_springboot import (
+    generate_service_java,
+)
+from app.job_queue import Job
+from app.main import (
+    app,
+    build_django_zip,
+    check_duplicate,
+    convert_spring,
+    path_collisions,
+    track_django_build,
+)
+from app.model import ConvertRequest
 from app.models.elements import ClassObject, ModelsElements
 from app.models.methods import ClassMethodObject
+from app.result_cache import ResultCache
+from app.utils import render_template
+from benchmarks.diagrams import make_class_diagram
 
 client = TestClient(app)
 
@@ -23,40 +48,18 @@ def test_file() -> dict:
     return {"filename": "testfile", "content": "print('Hello, world!')"}
 
 
-def test_file_already_exists():
+def test_existing_file_in_working_directory_does_not_block_convert():
     with open("file1_models.py", "w") as f:
         f.write("Some initial content")
 
     try:
-        with (
-            patch("app.main.ModelsElements") as mockparser,
-            patch("app.main.ViewsElements") as mockparser2,
-            patch("app.main.json") as mockjson,
-            patch("app.main.fetch_data") as mock_fetch_data,
-        ):
-            mockjson.loads.return_value = {"diagram": "ClassDiagram"}
-            mock_instance = mockparser.return_value
-            mock_instance.parse.return_value = [
-                MagicMock(to_models_code=MagicMock(return_value="class Test {}"))
-            ]
-
-            mockjson.return_value = {}
-
-            mock_instance.print_django_style.return_value = "ini class write"
-
-            mock_instance2 = mockparser2.return_value
-            mock_instance2.add_class_method.return_value = [
-                MagicMock(to_views_code=MagicMock(return_value="view Test {}"))
-            ]
-            mock_instance2.print_django_style.return_value = "ini views write"
-
+        with patch("app.main.fetch_data") as mock_fetch_data:
             mock_fetch_data.return_value = {
                 "models": "class Test {}",
                 "views": "view Test {}",
                 "model_element": ModelsElements("filename"),
             }
 
-            # Try to upload a file
             response = client.post(
                 "/convert/",
                 json={
@@ -65,23 +68,85 @@ def test_file_already_exists():
                     "project_name": "file1",
                 },
             )
-            assert response.status_code == 400
-            assert response.json()["detail"] == "Please try again later"
+            assert response.status_code == 200
+            with open("file1_models.py") as f:
+                assert f.read() == "Some initial content"
     finally:
         # Clean up: remove the file created for the test
         if os.path.exists("file1_models.py"):
             os.remove("file1_models.py")
 
 
+def test_convert_django_does_not_write_to_working_directory():
+    with patch("app.main.fetch_data") as mock_fetch_data:
+        mock_fetch_data.return_value = {
+            "models": "class Test {}",
+            "views": "view Test {}",
+            "model_element": ModelsElements("filename"),
+        }
+        before = set(os.listdir(".")) | set(os.listdir("app"))
+        response = client.post(
+            "/convert",
+            json={
+                "filename": ["file1"],
+                "content": [['{"Some content":"a"}']],
+                "project_name": "file1",
+            },
+        )
+        after = set(os.listdir(".")) | set(os.listdir("app"))
+
+    assert response.status_code == 200
+    assert before == after
+
+
+def test_convert_django_does_not_depend_on_working_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with open(os.path.join(os.path.dirname(__file__), "test_input.txt")) as f:
+        content = f.read().strip()
+    monkeypatch.chdir(tmp_path)
+
+    response = client.post(
+        "/convert",
+        json={"filename": ["test"], "content": [[content]], "project_name": "test"},
+    )
+
+    assert response.status_code == 200
+    assert os.listdir(tmp_path) == []
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+        assert "run.sh" in zipf.namelist()
+        assert "main/admin.py" in zipf.namelist()
+
+
+def test_track_django_build_counts_collisions():
+    def collisions(path: str) -> float:
+        return path_collisions.labels(path=path)._value.get()
+
+    shared, filename = collisions("shared"), collisions("filename")
+    with track_django_build("file1"):
+        assert (collisions("shared"), collisions("filename")) == (shared, filename)
+        with track_django_build("file2"):
+            pass
+        assert (collisions("shared"), collisions("filename")) == (shared + 1, filename)
+        with track_django_build("file1"):
+            pass
+
+    assert collisions("shared") == shared + 2
+    assert collisions("filename") == filename + 1
+    with track_django_build("file1"):
+        pass
+    assert collisions("shared") == shared + 2
+
+
 def test_slash_on_filename():
     # Try to upload a file
     with (
         patch("app.main.ModelsElements") as mockparser,
         patch("app.main.ViewsElements") as mockparser2,
-        patch("app.main.json") as mockjson,
+        patch("app.main.DiagramDocument.decode") as mockjson,
         patch("app.main.fetch_data") as mock_fetch_data,
     ):
-        mockjson.loads.return_value = {"diagram": "ClassDiagram"}
+        mockjson.return_value = DiagramDocument({"diagram": "ClassDiagram"})
 
         mock_instance = mockparser.return_value
         mock_instance.parse.return_value = [MagicMock()]
@@ -108,16 +173,29 @@ def test_slash_on_filename():
         assert response.json()["detail"] == "/ not allowed in file name"
 
 
+def test_short_filename():
+    with open(os.path.join(os.path.dirname(__file__), "test_input.txt")) as f:
+        content = f.read().strip()
+
+    response = client.post(
+        "/convert",
+        json={"filename": ["ab"], "content": [[content]], "project_name": "file1"},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "File name should have at least 3 characters"
+
+
 @pytest.mark.asyncio
 async def test_convert_endpoint_valid_content_class_diagram():
     # Mock ParseJsonToObjectClass to avoid executing its real implementation
     with (
         patch("app.main.ModelsElements") as mockparser,
         patch("app.main.ViewsElements") as mockparser2,
-        patch("app.main.json") as mockjson,
+        patch("app.main.DiagramDocument.decode") as mockjson,
         patch("app.main.fetch_data") as mock_fetch_data,
     ):
-        mockjson.loads.return_value = {"diagram": "ClassDiagram"}
+        mockjson.return_value = DiagramDocument({"diagram": "ClassDiagram"})
         mock_instance = mockparser.return_value
         m = MagicMock()
         m.get_methods.return_value = [MagicMock(to_views_code="view Test {}")]
@@ -175,10 +253,10 @@ async def test_convert_endpoint_class_diagram():
     with (
         patch("app.main.ModelsElements") as mock_models,
         patch("app.main.ViewsElements") as mock_views,
-        patch("app.main.json") as mock_json,
+        patch("app.main.DiagramDocument.decode") as mock_json,
         patch("app.main.fetch_data") as mock_fetch_data,
     ):
-        mock_json.loads.return_value = {"diagram": "ClassDiagram"}
+        mock_json.return_value = DiagramDocument({"diagram": "ClassDiagram"})
         mock_instance_models = mock_models.return_value
         mock_class = MagicMock()
         mock_class.get_methods.return_value = [MagicMock(to_views_code="view Test {}")]
@@ -281,10 +359,10 @@ async def test_convert_endpoint_invalid_diagram_type():
     with (
         patch("app.main.ModelsElements") as mock_models,
         patch("app.main.ViewsElements") as mock_views,
-        patch("app.main.json") as mock_json,
+        patch("app.main.DiagramDocument.decode") as mock_json,
         patch("app.main.fetch_data") as mock_fetch_data,
     ):
-        mock_json.loads.return_value = {"diagram": "InvalidDiagram"}
+        mock_json.return_value = DiagramDocument({"diagram": "InvalidDiagram"})
         mock_instance_models = mock_models.return_value
         mock_instance_models.parse.return_value = []
         mock_instance_models.print_django_style.return_value = "ini class write"
@@ -336,17 +414,27 @@ async def test_convert_endpoint_valid_sequence_diagram():
     with (
         patch("app.main.ParseJsonToObjectSeq") as mockseq,
         patch("app.main.ViewsElements") as mockparser2,
-        patch("app.main.json") as mockjson,
+        patch("app.main.DiagramDocument.decode") as mockjson,
         patch("app.main.check_duplicate") as mock_check_duplicate,
-        patch("app.main.generate_create_page_views", return_value="create views code"),
-        patch("app.main.generate_edit_page_views", return_value="edit views code"),
-        patch("app.main.generate_delete_page_views", return_value="delete views code"),
-        patch("app.main.generate_read_page_views", return_value="read views code"),
+        patch(
+            "app.main.generate_django_files",
+            return_value={
+                "create_views": "create views code",
+                "read_views": "read views code",
+                "delete_views": "delete views code",
+                "edit_views": "edit views code",
+                "forms": "forms code",
+                "urls": "urls code",
+                "create_pages": {},
+                "read_pages": {},
+                "edit_pages": {},
+            },
+        ),
         patch(
             "app.main.generate_landing_page_views", return_value="landing views code"
         ),
     ):
-        mockjson.loads.return_value = {"diagram": "SequenceDiagram"}
+        mockjson.return_value = DiagramDocument({"diagram": "SequenceDiagram"})
 
         seq_parser = mockseq.return_value
         seq_parser.get_controller_method.return_value = [MagicMock()]
@@ -369,10 +457,10 @@ async def test_convert_endpoint_valid_multiple_file_content():
     with (
         patch("app.main.ModelsElements") as mockparser,
         patch("app.main.ViewsElements") as mockparser2,
-        patch("app.main.json") as mockjson,
+        patch("app.main.DiagramDocument.decode") as mockjson,
         patch("app.main.fetch_data") as mock_fetch_data,
     ):
-        mockjson.loads.return_value = {"diagram": "ClassDiagram"}
+        mockjson.return_value = DiagramDocument({"diagram": "ClassDiagram"})
         mock_instance = mockparser.return_value
         m = MagicMock()
         mock_instance.parse.return_value = [m, m, m]
@@ -536,7 +624,7 @@ async def test_convert_spring():
     with (
         patch("app.main.initialize_springboot_zip") as mock_zip,
     ):
-        mock_zip.return_value = "a.zip"
+        mock_zip.return_value = b""
         content = [
             [
                 '{"diagram":"ClassDiagram", "nodes":[{"id":0,"methods":"+ '
@@ -548,6 +636,433 @@ async def test_convert_spring():
             "file1", "com.example", ["file.class.jet"], contents=content
         )
 
-        assert isinstance(response, str)
-        assert os.path.isfile(response)
-        os.remove(response)
+        assert isinstance(response, bytes)
+        with zipfile.ZipFile(io.BytesIO(response)) as zipf:
+            assert "src/main/java/com/example/file1/model/Test.java" in zipf.namelist()
+
+
+SPRING_CONTENT = [
+    [
+        '{"diagram":"ClassDiagram", "nodes":[{"id":0,"methods":"+ '
+        'classMethod(): string", "name":"Test", '
+        '"x":100, "y":100}], "edges":[]}'
+    ],
+]
+
+
+def test_convert_streaming_response_contains_whole_project():
+    with open(os.path.join(os.path.dirname(__file__), "test_input.txt")) as f:
+        content = f.read().strip()
+    payload = {"filename": ["test"], "content": [[content]], "project_name": "test"}
+
+    buffered = client.post("/convert", json=payload)
+    with patch("app.main.STREAM_RESPONSE", True):
+        streamed = client.post("/convert", json=payload)
+
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"] == "application/zip"
+    assert "test.zip" in streamed.headers["content-disposition"]
+    assert "content-length" not in streamed.headers
+    with (
+        zipfile.ZipFile(io.BytesIO(streamed.content)) as streamed_zip,
+        zipfile.ZipFile(io.BytesIO(buffered.content)) as buffered_zip,
+    ):
+        assert streamed_zip.testzip() is None
+        assert sorted(streamed_zip.namelist()) == sorted(buffered_zip.namelist())
+
+
+def test_convert_streaming_response_reports_parse_error():
+    payload = {
+        "filename": ["file1.sequence,jet"],
+        "content": [['{"diagram": "SequenceDiagram"}']],
+        "project_name": "file1",
+    }
+    with patch("app.main.STREAM_RESPONSE", True):
+        response = client.post("/convert", json=payload)
+
+    assert response.status_code == 422
+
+
+def test_convert_streaming_response_reports_invalid_project_name():
+    with open(os.path.join(os.path.dirname(__file__), "test_input.txt")) as f:
+        content = f.read().strip()
+    payload = {
+        "filename": ["test"],
+        "content": [[content]],
+        "project_name": "invalid project",
+    }
+    with patch("app.main.STREAM_RESPONSE", True):
+        response = client.post("/convert", json=payload)
+
+    assert response.status_code == 422
+    assert response.json() == {
+        "detail": "Project name must not contain whitespace or number!"
+    }
+
+
+@pytest.mark.asyncio
+async def test_convert_spring_generates_skeleton_locally():
+    with (
+        patch("app.main.SPRING_SKELETON", "local"),
+        patch("app.main.initialize_springboot_zip") as mock_zip,
+    ):
+        response = await convert_spring(
+            "file1", "com.example", ["file.class.jet"], contents=SPRING_CONTENT
+        )
+
+        mock_zip.assert_not_called()
+        with zipfile.ZipFile(io.BytesIO(response)) as zipf:
+            assert "build.gradle.kts" in zipf.namelist()
+            assert "src/main/java/com/example/file1/File1Application.java" in (
+                zipf.namelist()
+            )
+            assert "src/main/java/com/example/file1/model/Test.java" in zipf.namelist()
+
+
+@pytest.mark.asyncio
+async def test_convert_spring_uses_initializr_when_configured():
+    base = io.BytesIO()
+    with zipfile.ZipFile(base, "w") as zipf:
+        zipf.writestr("build.gradle.kts", "from initializr")
+
+    with (
+        patch("app.main.SPRING_SKELETON", "initializr"),
+        patch("app.main.initialize_springboot_zip") as mock_zip,
+    ):
+        mock_zip.return_value = base.getvalue()
+        response = await convert_spring(
+            "file1", "com.example", ["file.class.jet"], contents=SPRING_CONTENT
+        )
+
+        mock_zip.assert_called_once_with("file1", "com.example")
+        with zipfile.ZipFile(io.BytesIO(response)) as zipf:
+            assert zipf.read("build.gradle.kts") == b"from initializr"
+            assert "settings.gradle.kts" not in zipf.namelist()
+            assert "src/main/java/com/example/file1/model/Test.java" in zipf.namelist()
+
+
+def test_convert_identical_request_served_from_result_cache():
+    with open(os.path.join(os.path.dirname(__file__), "test_input.txt")) as f:
+        content = f.read().strip()
+    payload = {"filename": ["test"], "content": [[content]], "project_name": "test"}
+
+    with (
+        patch("app.main.result_cache", ResultCache(1024**2, None, 0)),
+        patch("app.main.build_django_zip", wraps=build_django_zip) as mock_build,
+    ):
+        first = client.post("/convert", json=payload)
+        second = client.post("/convert", json=payload)
+
+    mock_build.assert_called_once()
+    assert second.status_code == 200
+    with (
+        zipfile.ZipFile(io.BytesIO(first.content)) as first_zip,
+        zipfile.ZipFile(io.BytesIO(second.content)) as second_zip,
+    ):
+        assert sorted(first_zip.namelist()) == sorted(second_zip.namelist())
+        assert first_zip.read("main/models.py") == second_zip.read("main/models.py")
+        # Every download gets its own SECRET_KEY
+        assert first_zip.read("test/settings.py") != second_zip.read("test/settings.py")
+        assert b"SECRET_KEY = '" in second_zip.read("test/settings.py")
+
+
+def test_convert_error_is_not_cached():
+    payload = {
+        "filename": ["file1.sequence,jet"],
+        "content": [['{"diagram": "SequenceDiagram"}']],
+        "project_name": "file1",
+    }
+    cache = ResultCache(1024**2, None, 0)
+    with (
+        patch("app.main.result_cache", cache),
+        patch.object(cache, "put") as mock_put,
+    ):
+        assert client.post("/convert", json=payload).status_code == 422
+
+    mock_put.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_convert_spring_reuses_files_of_unchanged_classes():
+    def make_content(field: str) -> list[list[str]]:
+        return [
+            [
+                '{"diagram":"ClassDiagram", "nodes":['
+                '{"id":0,"name":"First","methods":"","attributes":"+ '
+                + field
+                + ': string"},'
+                '{"id":1,"name":"Second","methods":"","attributes":"+ name: string"}],'
+                ' "edges":[]}'
+            ]
+        ]
+
+    with (
+        patch("app.main.SPRING_SKELETON", "local"),
+        patch(
+            "app.main.generate_service_java", wraps=generate_service_java
+        ) as mock_service,
+    ):
+        await convert_spring(
+            "file1", "com.example", ["file.class.jet"], contents=make_content("a")
+        )
+        assert mock_service.call_count == 2
+
+        response = await convert_spring(
+            "file1", "com.example", ["file.class.jet"], contents=make_content("b")
+        )
+
+    # Only the edited class is rendered again
+    assert mock_service.call_count == 3
+    assert mock_service.call_args.args[1].get_name() == "First"
+    with zipfile.ZipFile(io.BytesIO(response)) as zipf:
+        model = zipf.read("src/main/java/com/example/file1/model/First.java")
+        assert b"String b" in model
+        assert b"String a" not in model
+
+
+@pytest.mark.asyncio
+async def test_convert_spring_renders_subclasses_of_edited_class_again():
+    def make_content(field: str) -> list[list[str]]:
+        diagram = {
+            "diagram": "ClassDiagram",
+            "nodes": [
+                {"id": 0, "name": "+ Parent", "methods": "", "attributes": field},
+                {"id": 1, "name": "+ Child", "methods": "", "attributes": ""},
+                {"id": 2, "name": "+ Other", "methods": "", "attributes": ""},
+            ],
+            "edges": [
+                {"start": 1, "end": 0, "type": "GeneralizationEdge"},
+                {
+                    "start": 2,
+                    "end": 0,
+                    "type": "AssociationEdge",
+                    "startLabel": "1",
+                    "endLabel": "*",
+                },
+            ],
+        }
+        return [[json.dumps(diagram)]]
+
+    def read_files(response: bytes, class_name: str) -> dict[str, bytes]:
+        with zipfile.ZipFile(io.BytesIO(response)) as zipf:
+            return {
+                name: zipf.read(name)
+                for name in zipf.namelist()
+                if name.endswith(f"/{class_name}.java")
+                or name.endswith(f"/{class_name}Service.java")
+                or name.endswith(f"/{class_name}Repository.java")
+            }
+
+    with (
+        patch("app.main.SPRING_SKELETON", "local"),
+        patch(
+            "app.main.generate_service_java", wraps=generate_service_java
+        ) as mock_service,
+    ):
+        await convert_spring(
+            "file1", "com.example", ["file.class.jet"], make_content("+ a: string")
+        )
+        mock_service.reset_mock()
+        cached = await convert_spring(
+            "file1", "com.example", ["file.class.jet"], make_content("+ b: string")
+        )
+        rendered = [call.args[1].get_name() for call in mock_service.call_args_list]
+
+        with patch("app.main.artifact_cache", ArtifactCache(0)):
+            uncached = await convert_spring(
+                "file1", "com.example", ["file.class.jet"], make_content("+ b: string")
+            )
+
+    # The service of a subclass has the getters of its parent's fields
+    assert rendered == ["Parent", "Child"]
+    assert (
+        b"getB"
+        in read_files(cached, "Child")[
+            "src/main/java/com/example/file1/service/ChildService.java"
+        ]
+    )
+    # Related classes only use the name of the edited class, so reusing their files
+    # gives the same project as rendering them again
+    for class_name in ("Parent", "Child", "Other"):
+        assert read_files(cached, class_name) == read_files(uncached, class_name)
+
+
+def test_convert_decodes_each_diagram_once():
+    with open(os.path.join(os.path.dirname(__file__), "test_valid_json_seq.txt")) as f:
+        content = f.read()
+    payload = {
+        "filename": ["file1.sequence.jet"],
+        "content": [[content]],
+        "project_name": "file1",
+    }
+
+    with patch("app.diagram_document.loads_json", wraps=loads_json) as mock_loads:
+        client.post("/convert", json=payload)
+
+    mock_loads.assert_called_once()
+
+
+def read_batch(response: Response) -> tuple[dict, dict[str, zipfile.ZipFile]]:
+    batch = zipfile.ZipFile(io.BytesIO(response.content))
+    projects = {
+        name: zipfile.ZipFile(io.BytesIO(batch.read(name)))
+        for name in batch.namelist()
+        if name != "batch.json"
+    }
+    return json.loads(batch.read("batch.json")), projects
+
+
+# The local skeleton doesn't need the Spring Initializr
+@patch("app.main.SPRING_SKELETON", "local")
+def test_convert_batch():
+    with open(os.path.join(os.path.dirname(__file__), "test_input.txt")) as f:
+        content = f.read().strip()
+    payload = [
+        {"filename": ["test"], "content": [[content]], "project_name": "first"},
+        {
+            "filename": ["file1.class.jet"],
+            "content": SPRING_CONTENT,
+            "project_name": "second",
+            "project_type": "spring",
+        },
+        {
+            "filename": ["file1.sequence.jet"],
+            "content": [['{"diagram": "SequenceDiagram"}']],
+            "project_name": "third",
+        },
+        {"filename": ["a", "b"], "content": [[content]], "project_name": "fourth"},
+    ]
+
+    response = client.post("/convert/batch", json=payload)
+
+    assert response.status_code == 200
+    assert "batch.zip" in response.headers["content-disposition"]
+    manifest, projects = read_batch(response)
+    assert sorted(projects) == ["first.zip", "second.zip"]
+    assert "first/settings.py" in projects["first.zip"].namelist()
+    assert "src/main/java/com/example/second/model/Test.java" in (
+        projects["second.zip"].namelist()
+    )
+    assert [item["status"] for item in manifest] == ["ok", "ok", "error", "error"]
+    assert manifest[2]["status_code"] == 422
+    assert manifest[2]["category"] == "invalid_sequence_file"
+    assert manifest[3]["status_code"] == 400
+    assert manifest[3]["detail"] == "number of Filename and Content is incosistent"
+
+
+def test_convert_batch_builds_identical_projects_once():
+    with open(os.path.join(os.path.dirname(__file__), "test_input.txt")) as f:
+        content = f.read().strip()
+    project = {"filename": ["test"], "content": [[content]], "project_name": "test"}
+
+    with patch("app.main.build_django_zip", wraps=build_django_zip) as mock_build:
+        response = client.post("/convert/batch", json=[project, project])
+
+    mock_build.assert_called_once()
+    manifest, projects = read_batch(response)
+    assert [item["filename"] for item in manifest] == ["test.zip", "test-2.zip"]
+    # Every project still gets its own SECRET_KEY
+    assert projects["test.zip"].read("test/settings.py") != (
+        projects["test-2.zip"].read("test/settings.py")
+    )
+
+
+def test_convert_batch_too_many_projects():
+    project = {"filename": ["test"], "content": [["{}"]], "project_name": "test"}
+
+    with patch("app.main.BATCH_MAX_PROJECTS", 1):
+        response = client.post("/convert/batch", json=[project, project])
+
+    assert response.status_code == 413
+
+
+def wait_for_job(test_client: TestClient, job_id: str) -> dict:
+    for _ in range(200):
+        job = test_client.get(f"/jobs/{job_id}").json()
+        if job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} didn't finish")
+
+
+@patch("app.main.SPRING_SKELETON", "local")
+def test_convert_job():
+    payload = {
+        "filename": ["file1.class.jet"],
+        "content": SPRING_CONTENT,
+        "project_name": "file1",
+        "project_type": "spring",
+    }
+
+    with TestClient(app) as test_client:
+        response = test_client.post("/jobs", json=payload)
+        assert response.status_code == 202
+        assert response.json()["status"] == "queued"
+
+        job = wait_for_job(test_client, response.json()["id"])
+        assert job["status"] == "done"
+        assert job["progress"]["classes_total"] == 1
+        assert job["progress"]["classes_rendered"] == 1
+        assert job["progress"]["files"] > 0
+
+        result = test_client.get(f"/jobs/{job['id']}/result")
+
+    assert result.status_code == 200
+    assert "file1.zip" in result.headers["content-disposition"]
+    with zipfile.ZipFile(io.BytesIO(result.content)) as zipf:
+        assert "src/main/java/com/example/file1/model/Test.java" in zipf.namelist()
+
+
+def test_django_job_progress_is_updated_per_class():
+    content = json.dumps(make_class_diagram(classes=3, fields=1, public=1.0))
+    job = Job(
+        ConvertRequest(filename=["shop"], content=[[content]], project_name="shop")
+    )
+    progress = []
+
+    def render(template_name: str, context: dict) -> str:
+        if template_name == "create_page_django.html.j2":
+            progress.append((job.status, job.classes_rendered, job.classes_total))
+        return render_template(template_name, context)
+
+    with patch("app.generation_plan.render_template", side_effect=render):
+        build_django_zip("shop", ["shop"], [[content]], CompressedData(""), job)
+
+    assert progress == [("rendering", 0, 3), ("rendering", 1, 3), ("rendering", 2, 3)]
+    assert (job.status, job.classes_rendered, job.classes_total) == ("zipping", 3, 3)
+
+
+def test_convert_job_error():
+    payload = {
+        "filename": ["file1.sequence.jet"],
+        "content": [['{"diagram": "SequenceDiagram"}']],
+        "project_name": "file1",
+    }
+
+    with TestClient(app) as test_client:
+        job_id = test_client.post("/jobs", json=payload).json()["id"]
+        job = wait_for_job(test_client, job_id)
+        result = test_client.get(f"/jobs/{job_id}/result")
+
+    assert job["status"] == "failed"
+    assert job["error"]["status_code"] == 422
+    assert result.status_code == 422
+    assert result.json()["detail"].startswith("The .sequence.jet is not valid")
+
+
+def test_convert_job_not_finished():
+    async def slow_build(*args: object):
+        await asyncio.sleep(60)
+
+    with patch("app.main.build_project", side_effect=slow_build):
+        with TestClient(app) as test_client:
+            payload = {"filename": ["a"], "content": [["{}"]], "project_name": "a"}
+            job_id = test_client.post("/jobs", json=payload).json()["id"]
+            response = test_client.get(f"/jobs/{job_id}/result")
+
+    assert response.status_code == 409
+
+
+def test_convert_job_not_found():
+    assert client.get("/jobs/unknown").status_code == 404
+    assert client.get("/jobs/unknown/result").status_code == 404
@@ -95,8 +95,7 @@ class TestControllerMethodObject(unittest.TestCase):
         self.controller_method = ControllerMethodObject()
         self.method_call = AbstractMethodCallObject()
 
-        self.controller_method.get_name = mock.Mock(return_value="sample_method")
-        self.controller_method.get_parameters = mock.Mock(return_value=[])
+        self.controller_method.set_name("sample_method")
 
     def test_add_call(self):
         self.controller_method.add_call(self.method_call)
@@ -112,7 +111,7 @@ class TestControllerMethodObject(unittest.TestCase):
         self.assertEqual(self.controller_method.print_django_style(), expected_output)
 
     def test_print_django_style_negative(self):
-        self.controller_method.get_name = mock.Mock(return_value="")  # No method name
+        self.controller_method.set_name("")  # No method name
         with self.assertRaises(ValueError):
             self.controller_method.print_django_style()
 
@@ -125,7 +124,8 @@ class TestControllerMethodObject(unittest.TestCase):
         param1.get_name.return_value = "param1"
         param2 = mock.Mock()
         param2.get_name.return_value = "param2"
-        self.controller_method.get_parameters = mock.Mock(return_value=[param1, param2])
+        self.controller_method.add_parameter(param1)
+        self.controller_method.add_parameter(param2)
         expected_output = "def sample_method(request, param1, param2):\n\tpass\n\n"
         self.assertEqual(self.controller_method.print_django_style(), expected_output)
 
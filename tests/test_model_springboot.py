@@ -18,15 +18,9 @@ class TestModelsElementsSpringBootStyle(unittest.TestCase):
         """Test: Positive case where valid ClassObjects are converted to Spring Boot style."""
         class_obj_1 = ClassObject()
         class_obj_1.set_name("Class1")
-        class_obj_1.to_models_springboot_context = mock.Mock(
-            return_value={"name": "Class1", "fields": []}
-        )
 
         class_obj_2 = ClassObject()
         class_obj_2.set_name("Class2")
-        class_obj_2.to_models_springboot_context = mock.Mock(
-            return_value={"name": "Class2", "fields": []}
-        )
 
         self.models.add_class(class_obj_1)
         self.models.add_class(class_obj_2)
@@ -48,9 +42,6 @@ class TestModelsElementsSpringBootStyle(unittest.TestCase):
         """Test: Negative case where rendering the template raises an exception."""
         class_obj = ClassObject()
         class_obj.set_name("Class1")
-        class_obj.to_models_springboot_context = mock.Mock(
-            return_value={"name": "Class1", "fields": []}
-        )
 
         self.models.add_class(class_obj)
 
@@ -71,9 +62,6 @@ class TestModelsElementsSpringBootStyle(unittest.TestCase):
         """Test: Edge case where the project name is an empty string."""
         class_obj = ClassObject()
         class_obj.set_name("Class1")
-        class_obj.to_models_springboot_context = mock.Mock(
-            return_value={"name": "Class1", "fields": []}
-        )
 
         self.models.add_class(class_obj)
 
@@ -1,3 +1,4 @@
+import json
 import os
 import unittest
 
@@ -13,6 +14,11 @@ class TestParseJsonToObjectSeq(unittest.TestCase):
             json_data = file.read()
         self.assertEqual("Success", ParseJsonToObjectSeq().set_json(json_data))
 
+    def test_set_decoded_json(self):
+        with open("tests/test_valid_json_seq.txt", "r", encoding="utf-8") as file:
+            json_data = json.load(file)
+        self.assertEqual("Success", ParseJsonToObjectSeq().set_json(json_data))
+
     def test_negative_set_invalid_json(self):
         with open("tests/test_invalid_json_seq.txt", "r", encoding="utf-8") as file:
             json_data = file.read()
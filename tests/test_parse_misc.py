@@ -61,3 +61,16 @@ class TestParseMisc(unittest.TestCase):
                 key = (start, end)
                 if result[key]["condition"] is not None and key == (25, 14):
                     self.assertEqual(result[key]["condition"], "POST")
+
+    def test_edges_are_bucketed_by_type(self):
+        with open("tests/testdata/parse_misc_positive.json") as file:
+            self.parser.set_json(file.read())
+            self.parser.parse()
+
+        edges = self.parser.get_edges()
+        for edge_type in ("CallEdge", "ReturnEdge"):
+            self.assertEqual(
+                self.parser.get_edges_of_type(edge_type),
+                [edge for edge in edges if edge["type"] == edge_type],
+            )
+        self.assertEqual(self.parser.get_edges_of_type("NoteEdge"), [])
@@ -272,6 +272,32 @@ class TestParseSeqSelfCall(unittest.TestCase):
             "Too deep self calls on a sequence diagram! \nThe maximum allowed is 5",
         )
 
+    def test_get_call_depths(self):
+        # 1 is not a self call, 2 to 4 are a chain of self calls from it, and 5 is
+        # another self call of 1
+        rev_call_tree = {4: 3, 3: 2, 2: 1, 5: 1}
+        self.assertEqual(
+            self.parser.get_call_depths(rev_call_tree), {4: 3, 3: 2, 2: 1, 5: 1}
+        )
+
+    def test_get_call_depths_loop(self):
+        # 3 and 4 call each other, and 5 is called by the loop
+        rev_call_tree = {2: 1, 3: 4, 4: 3, 5: 4}
+        depths = self.parser.get_call_depths(rev_call_tree)
+        self.assertEqual(depths[2], 1)
+        self.assertEqual(depths[3], float("inf"))
+        self.assertEqual(depths[4], float("inf"))
+        self.assertEqual(depths[5], float("inf"))
+
+    def test_get_call_depths_long_chain(self):
+        # The callees are in the reverse order of the chain, which used to walk
+        # the whole chain for every callee
+        n = 100_000
+        rev_call_tree = {i + 1: i for i in range(n, 0, -1)}
+        depths = self.parser.get_call_depths(rev_call_tree)
+        self.assertEqual(depths[n + 1], n)
+        self.assertEqual(depths[2], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -156,6 +156,17 @@ class TestTypeObject(unittest.TestCase):
         self.type_object.set_name("TestType")
         self.assertEqual(self.type_object._TypeObject__name, "TestType")
 
+    def test_set_name_interns_name(self):
+        other = TypeObject()
+        self.type_object.set_name("".join(["Test", "Type"]))
+        other.set_name("".join(["Test", "Type"]))
+        self.assertIs(self.type_object.get_name(), other.get_name())
+
+    def test_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.type_object, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.type_object.unknown = "value"
+
 
 class TestParameterObject(unittest.TestCase):
     def setUp(self):
@@ -1,12 +1,24 @@
+import io
 import os
 import shutil
-import tempfile
 import unittest
 import zipfile
 from unittest.mock import patch
 
-from app.main import create_django_app, create_django_project
-from app.utils import get_random_secret_key, render_project_django_template
+from fastapi.testclient import TestClient
+
+from app.archive import ZipArchive
+from app.main import app, iter_django_app, iter_django_project
+from app.utils import (
+    SECRET_KEY_PLACEHOLDER,
+    get_random_secret_key,
+    render_django_settings,
+    render_django_skeleton,
+    render_project_django_template,
+    render_template,
+)
+
+client = TestClient(app)
 
 
 class TestGenerateDjangoProjectTemplate(unittest.TestCase):
@@ -17,11 +29,7 @@ class TestGenerateDjangoProjectTemplate(unittest.TestCase):
         if os.path.exists(f"project_{self.project_name}"):
             shutil.rmtree(f"project_{self.project_name}")
 
-        self.tmp_zip = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
-
-    def tearDown(self):
-        self.tmp_zip.close()
-        os.remove(self.tmp_zip.name)
+        self.archive = ZipArchive()
 
     # generate django project
     def test_generate_django_project_positive(self):
@@ -35,15 +43,14 @@ class TestGenerateDjangoProjectTemplate(unittest.TestCase):
             file_to_edit.write(settings_mock)
         # Mock get_random_secret_key to return a predictable value
         with patch("app.utils.get_random_secret_key", return_value=mocked_secret_key):
-            result = create_django_project(self.project_name, self.tmp_zip.name)
-            zipfile_path = self.tmp_zip.name
+            self.archive.extend(iter_django_project(self.project_name))
+            result = [name.split("/")[-1] for name in self.archive.namelist()]
             try:
-                self.assertTrue(os.path.exists(zipfile_path))
-                open_zip = zipfile.ZipFile(zipfile_path, "r")
+                open_zip = zipfile.ZipFile(io.BytesIO(self.archive.build()), "r")
                 files = open_zip.namelist()
                 for file in files:
                     filename = file.split("/")[-1]
-                    self.assertIn(filename, result.keys())
+                    self.assertIn(filename, result)
                     with (
                         open_zip.open(file, "r") as f1,
                         open(
@@ -69,7 +76,7 @@ class TestGenerateDjangoProjectTemplate(unittest.TestCase):
 
     def test_generate_django_project_negative_with_whitespace(self):
         with self.assertRaises(ValueError) as context:
-            create_django_project("test project", self.tmp_zip.name)
+            self.archive.extend(iter_django_project("test project"))
         self.assertEqual(
             str(context.exception),
             "Project name must not contain whitespace or number!",
@@ -91,6 +98,61 @@ class TestGenerateDjangoProjectTemplate(unittest.TestCase):
         if os.path.exists("project_test_project"):
             shutil.rmtree("project_test_project")
 
+    def test_project_files_rendered_once_per_project_name(self):
+        render_django_skeleton.cache_clear()
+        with patch("app.utils.render_template", return_value="") as mock_render:
+            render_project_django_template(
+                "app/templates/django_project", {"project_name": "skeleton"}
+            )
+            render_project_django_template(
+                "app/templates/django_project", {"project_name": "skeleton"}
+            )
+            self.assertEqual(mock_render.call_count, 5)
+
+            render_project_django_template(
+                "app/templates/django_project", {"project_name": "other"}
+            )
+            self.assertEqual(mock_render.call_count, 10)
+        render_django_skeleton.cache_clear()
+
+    def test_skeleton_rendered_once_per_conversion(self):
+        render_django_skeleton.cache_clear()
+        with open("tests/test_input.txt") as f:
+            content = f.read().strip()
+
+        with patch("app.utils.render_template", wraps=render_template) as mock_render:
+            response = client.post(
+                "/convert",
+                json={
+                    "filename": ["test"],
+                    "content": [[content]],
+                    "project_name": "skeleton",
+                },
+            )
+
+        self.assertEqual(response.status_code, 200)
+        skeleton_renders = [
+            call.args[0]
+            for call in mock_render.call_args_list
+            if call.args[0].startswith("django_project/")
+        ]
+        self.assertEqual(len(skeleton_renders), len(set(skeleton_renders)))
+        self.assertEqual(len(skeleton_renders), 5)
+        render_django_skeleton.cache_clear()
+
+    def test_every_project_gets_its_own_secret_key(self):
+        settings = [
+            render_project_django_template(
+                "app/templates/django_project", {"project_name": "skeleton"}
+            )["settings.py"](),
+            render_django_settings("app/templates/django_project", "skeleton"),
+        ]
+
+        self.assertNotEqual(settings[0], settings[1])
+        for content in settings:
+            self.assertNotIn(SECRET_KEY_PLACEHOLDER, content)
+            self.assertIn("SECRET_KEY = '", content)
+
 
 class TestGenerateDjangoMain(unittest.TestCase):
     def setUp(self):
@@ -100,19 +162,14 @@ class TestGenerateDjangoMain(unittest.TestCase):
         if os.path.exists(f"project_{self.project_name}"):
             shutil.rmtree(f"project_{self.project_name}")
 
-        self.tmp_zip = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
-
-    def tearDown(self):
-        self.tmp_zip.close()
-        os.remove(self.tmp_zip.name)
+        self.archive = ZipArchive()
 
     def test_generate_django_app_positive(self):
         folder_path = "project_test_main"
-        create_django_project("test_main", self.tmp_zip.name)
-        create_django_app("test_main", "main", self.tmp_zip.name)
+        self.archive.extend(iter_django_project("test_main"))
+        self.archive.extend(iter_django_app("test_main", "main"))
 
-        zipfile_path = self.tmp_zip.name
-        open_zip = zipfile.ZipFile(zipfile_path, "r")
+        open_zip = zipfile.ZipFile(io.BytesIO(self.archive.build()), "r")
         files = open_zip.namelist()
 
         for file in files:
@@ -151,7 +208,7 @@ class TestGenerateDjangoMain(unittest.TestCase):
 
     def test_generate_django_app_negative_invalid_name(self):
         with self.assertRaises(ValueError) as context:
-            create_django_app("test_main", "buku pin", self.tmp_zip.name)
+            self.archive.extend(iter_django_app("test_main", "buku pin"))
         self.assertEqual(
             str(context.exception),
             "App name must not contain whitespace!",
@@ -159,16 +216,8 @@ class TestGenerateDjangoMain(unittest.TestCase):
 
     def test_generate_django_app_negative_invalid_project_name(self):
         with self.assertRaises(ValueError) as context:
-            create_django_app("test main", "main", self.tmp_zip.name)
+            self.archive.extend(iter_django_app("test main", "main"))
         self.assertEqual(
             str(context.exception),
             "Project name must not contain whitespace!",
         )
-
-    def test_generate_django_app_negative_zip_not_exist(self):
-        with self.assertRaises(FileNotFoundError) as context:
-            create_django_app("test_main", "main", "test_main.zip")
-        self.assertEqual(
-            str(context.exception),
-            "File test_main.zip does not exist",
-        )
@@ -1,15 +1,14 @@
-import os
-import shutil
-import tempfile
+import io
 import unittest
 import zipfile
 
 import pytest
 
+from app.archive import ZipArchive
 from app.main import (
-    create_django_app,
-    create_django_project,
     fetch_data,
+    iter_django_app,
+    iter_django_project,
 )
 from app.models.elements import ModelsElements
 
@@ -17,18 +16,8 @@ from app.models.elements import ModelsElements
 class TestReplaceModelAndViews(unittest.TestCase):
     maxDiff = None
 
-    def remove_used_project(self):
-        if os.path.exists(self.tmp_zip.name):
-            os.remove(self.tmp_zip.name)
-        if os.path.exists("project_testRenderModel"):
-            shutil.rmtree("project_testRenderModel")
-
     def setUp(self):
-        self.tmp_zip = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
-
-    def tearDown(self):
-        self.tmp_zip.close()
-        self.remove_used_project()
+        self.archive = ZipArchive()
 
     def test_render_model(self):
         with open("tests/test_render_model.txt", "r", encoding="utf-8") as file:
@@ -54,9 +43,9 @@ class TestReplaceModelAndViews(unittest.TestCase):
 
         output = processed_data["models"]
 
-        create_django_project("testRenderModel", self.tmp_zip.name)
-        create_django_app("testRenderModel", "testRender", self.tmp_zip.name, output)
-        with zipfile.ZipFile(self.tmp_zip.name, "r") as zipf:
+        self.archive.extend(iter_django_project("testRenderModel"))
+        self.archive.extend(iter_django_app("testRenderModel", "testRender", output))
+        with zipfile.ZipFile(io.BytesIO(self.archive.build()), "r") as zipf:
             self.assertIn(
                 "testRender/models.py",
                 zipf.namelist(),
@@ -112,15 +101,16 @@ class TestReplaceModelAndViews(unittest.TestCase):
         output_models = processed_data["models"]
         output_views = processed_data["views"]
 
-        create_django_project("testRenderModel", self.tmp_zip.name)
-        create_django_app(
-            "testRenderModel",
-            "testRender",
-            self.tmp_zip.name,
-            output_models,
-            output_views,
+        self.archive.extend(iter_django_project("testRenderModel"))
+        self.archive.extend(
+            iter_django_app(
+                "testRenderModel",
+                "testRender",
+                output_models,
+                output_views,
+            )
         )
-        with zipfile.ZipFile(self.tmp_zip.name, "r") as zipf:
+        with zipfile.ZipFile(io.BytesIO(self.archive.build()), "r") as zipf:
             self.assertIn(
                 "testRender/views.py",
                 zipf.namelist(),
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+
+from app.model import ConvertRequest
+from app.result_cache import ResultCache, result_cache_memory_bytes
+
+
+def make_request(**kwargs: str) -> ConvertRequest:
+    return ConvertRequest(
+        **{"filename": ["test"], "content": [["{}"]], "project_name": "test"} | kwargs
+    )
+
+
+class TestResultCacheKey(unittest.TestCase):
+    def test_same_request_same_key(self):
+        self.assertEqual(
+            ResultCache.make_key(make_request()), ResultCache.make_key(make_request())
+        )
+
+    def test_every_field_changes_key(self):
+        key = ResultCache.make_key(make_request())
+        for field, value in [
+            ("filename", ["other"]),
+            ("content", [["[]"]]),
+            ("project_name", "other"),
+            ("project_type", "spring"),
+            ("group_id", "com.other"),
+            ("style_theme", "dark"),
+        ]:
+            with self.subTest(field=field):
+                self.assertNotEqual(
+                    ResultCache.make_key(make_request(**{field: value})), key
+                )
+
+
+class TestResultCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp_dir.name, "results")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_disabled_cache(self):
+        self.assertFalse(ResultCache(0, None, 0).is_enabled())
+        self.assertTrue(ResultCache(1, None, 0).is_enabled())
+        self.assertTrue(ResultCache(0, self.directory, 1).is_enabled())
+
+    async def test_put_then_get(self):
+        cache = ResultCache(10, None, 0)
+        self.assertIsNone(await cache.get("a"))
+        await cache.put("a", b"zip")
+        self.assertEqual(await cache.get("a"), b"zip")
+        self.assertEqual(result_cache_memory_bytes._value.get(), 3)
+
+    async def test_least_recently_used_evicted_by_size(self):
+        cache = ResultCache(6, None, 0)
+        await cache.put("a", b"111")
+        await cache.put("b", b"222")
+        await cache.get("a")
+        await cache.put("c", b"333")
+
+        self.assertEqual(await cache.get("a"), b"111")
+        self.assertIsNone(await cache.get("b"))
+        self.assertEqual(await cache.get("c"), b"333")
+
+    async def test_entry_larger_than_memory_is_not_kept(self):
+        cache = ResultCache(2, None, 0)
+        await cache.put("a", b"111")
+        self.assertIsNone(await cache.get("a"))
+
+    async def test_disk_tier_survives_restart(self):
+        await ResultCache(10, self.directory, 10).put("a", b"zip")
+        self.assertEqual(await ResultCache(10, self.directory, 10).get("a"), b"zip")
+
+    async def test_disk_tier_without_memory(self):
+        cache = ResultCache(0, self.directory, 10)
+        await cache.put("a", b"zip")
+        self.assertEqual(await cache.get("a"), b"zip")
+
+    async def test_oldest_file_evicted_from_disk(self):
+        cache = ResultCache(0, self.directory, 6)
+        await cache.put("a", b"111")
+        os.utime(os.path.join(self.directory, "a.zip"), (0, 0))
+        await cache.put("b", b"222")
+        await cache.put("c", b"333")
+
+        self.assertEqual(sorted(os.listdir(self.directory)), ["b.zip", "c.zip"])
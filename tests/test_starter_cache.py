@@ -0,0 +1,144 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import anyio
+
+from app.starter_cache import StarterCache
+
+
+class TestStarterCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp_dir.name, "cache")
+        self.cache = StarterCache(self.directory, 60, 2, 60, 3)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_key_does_not_depend_on_params_order(self):
+        self.assertEqual(
+            StarterCache.make_key({"a": "1", "b": "2"}),
+            StarterCache.make_key({"b": "2", "a": "1"}),
+        )
+        self.assertNotEqual(
+            StarterCache.make_key({"a": "1"}), StarterCache.make_key({"a": "2"})
+        )
+
+    async def test_get_missing_entry(self):
+        self.assertIsNone(await self.cache.get("key"))
+
+    async def test_put_then_get(self):
+        await self.cache.put("key", b"zip")
+        self.assertEqual(await self.cache.get("key"), (b"zip", True))
+        self.assertTrue(await anyio.Path(self.directory, "key.zip").exists())
+
+    async def test_expired_entry_is_returned_as_stale(self):
+        with patch("app.starter_cache.time.time", return_value=0):
+            await self.cache.put("key", b"zip")
+        with patch("app.starter_cache.time.time", return_value=60):
+            self.assertEqual(await self.cache.get("key"), (b"zip", False))
+
+    async def test_entry_is_read_from_disk_once(self):
+        await self.cache.put("key", b"zip")
+        restarted = StarterCache(self.directory, 60, 2, 60, 3)
+        with patch("app.starter_cache.open", side_effect=open) as mock_open:
+            await restarted.get("key")
+
+        mock_open.assert_called_once()
+
+    async def test_entry_past_max_stale_is_removed(self):
+        await self.cache.put("key", b"zip")
+        path = anyio.Path(self.directory, "key.zip")
+        fetched_at = (await path.stat()).st_mtime
+        with patch("app.starter_cache.time.time", return_value=fetched_at + 120):
+            self.assertIsNone(await self.cache.get("key"))
+        self.assertFalse(await path.exists())
+
+    async def test_disk_keeps_newest_entries(self):
+        for index, key in enumerate(["a", "b", "c", "d"]):
+            await self.cache.put(key, b"zip")
+            path = os.path.join(self.directory, f"{key}.zip")
+            os.utime(path, (1000 + index, time.time() - 10 + index))
+
+        await self.cache.put("e", b"zip")
+
+        self.assertEqual(
+            sorted(os.listdir(self.directory)), ["c.zip", "d.zip", "e.zip"]
+        )
+
+    async def test_expired_files_are_removed_on_write(self):
+        await self.cache.put("old", b"zip")
+        old_path = os.path.join(self.directory, "old.zip")
+        os.utime(old_path, (0, time.time() - 1000))
+
+        await self.cache.put("new", b"zip")
+
+        self.assertFalse(await anyio.Path(old_path).exists())
+
+    async def test_entry_read_from_disk_after_restart(self):
+        await self.cache.put("key", b"zip")
+        restarted = StarterCache(self.directory, 60, 2, 60, 3)
+        self.assertEqual(await restarted.get("key"), (b"zip", True))
+
+    async def test_evicted_entry_read_from_disk(self):
+        await self.cache.put("a", b"1")
+        await self.cache.put("b", b"2")
+        await self.cache.put("c", b"3")
+        self.assertEqual(await self.cache.get("a"), (b"1", True))
+
+    async def test_memory_only_cache(self):
+        cache = StarterCache(None, 60, 1, 60, 1)
+        await cache.put("a", b"1")
+        self.assertEqual(await cache.get("a"), (b"1", True))
+
+        await cache.put("b", b"2")
+        self.assertIsNone(await cache.get("a"))
+        self.assertEqual(await cache.get("b"), (b"2", True))
+
+    async def test_disk_error_keeps_entry_in_memory(self):
+        await anyio.Path(self.tmp_dir.name, "file").write_text("")
+        cache = StarterCache(os.path.join(self.tmp_dir.name, "file"), 60, 1, 60, 1)
+        with self.assertLogs("uvicorn.error", "WARNING"):
+            await cache.put("a", b"1")
+        self.assertEqual(await cache.get("a"), (b"1", True))
+
+    async def test_refresh_replaces_entry(self):
+        with patch("app.starter_cache.time.time", return_value=0):
+            await self.cache.put("key", b"old")
+        fetch = AsyncMock(return_value=b"new")
+
+        task = self.cache.refresh("key", fetch)
+        self.assertIs(self.cache.refresh("key", fetch), task)
+        await task
+
+        fetch.assert_awaited_once()
+        self.assertEqual(await self.cache.get("key"), (b"new", True))
+
+    async def test_failed_refresh_keeps_stale_entry(self):
+        with patch("app.starter_cache.time.time", return_value=0):
+            await self.cache.put("key", b"old")
+        fetch = AsyncMock(side_effect=RuntimeError("down"))
+
+        with self.assertLogs("uvicorn.error", "WARNING"):
+            await self.cache.refresh("key", fetch)
+
+        with patch("app.starter_cache.time.time", return_value=60):
+            self.assertEqual(await self.cache.get("key"), (b"old", False))
+
+    async def test_close_cancels_refresh(self):
+        fetch_started = asyncio.Event()
+
+        async def fetch() -> bytes:
+            fetch_started.set()
+            await asyncio.Event().wait()
+            return b"zip"
+
+        self.cache.refresh("key", fetch)
+        await fetch_started.wait()
+        await self.cache.close()
+
+        self.assertIsNone(await self.cache.get("key"))
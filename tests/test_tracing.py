@@ -0,0 +1,111 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.main import app
+from app.tracing import StageTimer, span
+from benchmarks.diagrams import make_class_diagram
+
+client = TestClient(app)
+
+
+def get_stage_count(stage: str) -> float:
+    count = REGISTRY.get_sample_value(
+        "convert_stage_duration_seconds_count", {"stage": stage}
+    )
+    return count or 0
+
+
+def test_span_observes_duration():
+    before = get_stage_count("test_stage")
+    with span("test_stage"):
+        pass
+    assert get_stage_count("test_stage") == before + 1
+
+
+def test_span_observes_duration_on_error():
+    before = get_stage_count("test_stage")
+    with pytest.raises(ValueError), span("test_stage"):
+        raise ValueError("failed")
+    assert get_stage_count("test_stage") == before + 1
+
+
+def test_span_is_traced_when_enabled():
+    tracer = MagicMock()
+    with patch("app.tracing.tracer", tracer), span("test_stage"):
+        pass
+    tracer.start_as_current_span.assert_called_once_with("test_stage")
+
+
+def test_convert_records_every_stage():
+    stages = [
+        "decode",
+        "parse_classes",
+        "parse_relationships",
+        "render_models",
+        "render_views",
+        "render_frontend",
+        "zip_build",
+        "send_response",
+    ]
+    before = {stage: get_stage_count(stage) for stage in stages}
+
+    response = client.post(
+        "/convert",
+        json={
+            "filename": ["shop"],
+            "content": [[json.dumps(make_class_diagram(classes=3, edges=2))]],
+            "project_name": "shop",
+        },
+    )
+
+    assert response.status_code == 200
+    for stage in stages:
+        assert get_stage_count(stage) > before[stage], stage
+
+
+def test_other_paths_are_not_timed():
+    before = get_stage_count("send_response")
+    client.get("/metrics")
+    assert get_stage_count("send_response") == before
+
+
+@patch("app.main.SPRING_SKELETON", "local")
+def test_stages_are_recorded_once_per_conversion():
+    stages = [
+        "decode",
+        "render_views",
+        "render_services",
+        "render_models",
+    ]
+    before = {stage: get_stage_count(stage) for stage in stages}
+
+    response = client.post(
+        "/convert",
+        json={
+            "filename": ["shop.class.jet"],
+            "content": [[json.dumps(make_class_diagram(classes=10, edges=5))]],
+            "project_name": "shop",
+            "project_type": "spring",
+        },
+    )
+
+    assert response.status_code == 200
+    for stage in stages:
+        assert get_stage_count(stage) == before[stage] + 1, stage
+
+
+def test_stage_timer_adds_up_stages():
+    before = get_stage_count("test_stage")
+    timer = StageTimer()
+    with timer.collect():
+        for _ in range(3):
+            with span("test_stage"):
+                pass
+        # A nested collect() leaves its stages to the outer timer
+        with StageTimer().collect(), span("test_stage"):
+            pass
+    assert get_stage_count("test_stage") == before + 1
@@ -1,10 +1,16 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
 import pytest
+from jinja2 import DictLoader, FileSystemBytecodeCache, PackageLoader
+from prometheus_client import REGISTRY
 
 from app.utils import (  # Import the function from the module
+    TemplateRegistry,
     camel_to_snake,
+    memoize_name_helper,
     render_template,
     to_camel_case,
     to_pascal_case,
@@ -146,6 +152,55 @@ class TestRenderTemplate(unittest.TestCase):
             self.assertEqual(result, "")
 
 
+class TestTemplateRegistry(unittest.TestCase):
+    def setUp(self):
+        self.loader = DictLoader(
+            {"hello.j2": "Hello {{ name }}", "broken.txt": "{% load static %}"}
+        )
+
+    def test_preload_skips_invalid_templates(self):
+        env = TemplateRegistry(loader=self.loader)
+        with self.assertLogs("uvicorn.error", "DEBUG"):
+            self.assertEqual(env.preload(), 1)
+
+    def test_preloaded_template_does_not_use_loader(self):
+        env = TemplateRegistry(loader=self.loader, auto_reload=False)
+        env.preload()
+        with patch.object(self.loader, "get_source") as mock_get_source:
+            template = env.get_template("hello.j2")
+        mock_get_source.assert_not_called()
+        self.assertEqual(template.render(name="MoTxT"), "Hello MoTxT")
+
+    def test_auto_reload_picks_up_changes(self):
+        env = TemplateRegistry(loader=self.loader, auto_reload=True)
+        env.preload()
+        self.loader.mapping["hello.j2"] = "Hi {{ name }}"
+        self.assertEqual(env.get_template("hello.j2").render(name="a"), "Hi a")
+
+    def test_preloaded_template_is_not_reloaded(self):
+        env = TemplateRegistry(loader=self.loader, auto_reload=False)
+        env.preload()
+        self.loader.mapping["hello.j2"] = "Hi {{ name }}"
+        self.assertEqual(env.get_template("hello.j2").render(name="a"), "Hello a")
+
+    def test_template_not_preloaded_is_loaded(self):
+        env = TemplateRegistry(loader=self.loader, auto_reload=False)
+        self.assertEqual(env.get_template("hello.j2").render(name="a"), "Hello a")
+
+    def test_all_app_templates_are_preloaded(self):
+        env = TemplateRegistry(loader=PackageLoader("app"))
+        # base.html.txt is a Django template that is copied without rendering
+        self.assertEqual(env.preload(), len(env.list_templates()) - 1)
+
+    def test_compiled_templates_are_cached_on_disk(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = TemplateRegistry(
+                loader=self.loader, bytecode_cache=FileSystemBytecodeCache(cache_dir)
+            )
+            env.preload()
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+
 class TestToCamelCase(unittest.TestCase):
     def test_regular_case(self):
         self.assertEqual(
@@ -215,6 +270,7 @@ class TestErrorClassification(unittest.TestCase):
             ),
             ("ModelsElements does not contain any classes", "invalid_class_file"),
             ("Can't create edit views with no class", "invalid_class_file"),
+            ("The .class.jet is not valid", "invalid_class_file"),
             ("The .sequence.jet is not valid", "invalid_sequence_file"),
             (
                 "please consult the user manual document on how to name classes",
@@ -300,3 +356,50 @@ class TestToPascalCase(unittest.TestCase):
             to_pascal_case("alreadyPascalCase"), "Alreadypascalcase"
         )  # no detection of existing PascalCase
         self.assertEqual(to_pascal_case("123number_test"), "123numberTest")
+
+
+class TestMemoizedNameHelpers(unittest.TestCase):
+    def lookups(self, helper: str, result: str) -> float:
+        return REGISTRY.get_sample_value(
+            "name_cache_lookups_total", {"helper": helper, "result": result}
+        )
+
+    def test_repeated_calls_are_hits(self):
+        camel_to_snake.cache_clear()
+        hits = self.lookups("camel_to_snake", "hit")
+        misses = self.lookups("camel_to_snake", "miss")
+
+        for _ in range(3):
+            self.assertEqual(camel_to_snake("OrderItem"), "order_item")
+
+        self.assertEqual(self.lookups("camel_to_snake", "miss") - misses, 1)
+        self.assertEqual(self.lookups("camel_to_snake", "hit") - hits, 2)
+        self.assertEqual(camel_to_snake.cache_info().currsize, 1)
+
+    def test_nested_helpers_are_counted_separately(self):
+        @memoize_name_helper
+        def outer_name(name: str) -> str:
+            return camel_to_snake(name) + "_set"
+
+        camel_to_snake.cache_clear()
+        hits = self.lookups("camel_to_snake", "hit")
+        misses = self.lookups("camel_to_snake", "miss")
+
+        self.assertEqual(camel_to_snake("OrderItem"), "order_item")
+        self.assertEqual(outer_name("OrderItem"), "order_item_set")
+        self.assertEqual(outer_name("OrderItem"), "order_item_set")
+
+        self.assertEqual(self.lookups("outer_name", "miss"), 1)
+        self.assertEqual(self.lookups("outer_name", "hit"), 1)
+        self.assertEqual(self.lookups("camel_to_snake", "miss") - misses, 1)
+        self.assertEqual(self.lookups("camel_to_snake", "hit") - hits, 1)
+
+    def test_pascal_case_acronyms_part_of_the_key(self):
+        self.assertEqual(to_pascal_case("get_sql"), "GetSql")
+        self.assertEqual(to_pascal_case("get_sql", {"SQL"}), "GetSQL")
+        self.assertEqual(to_pascal_case("get_sql"), "GetSql")
+
+    def test_errors_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(TypeError):
+                camel_to_snake(123)
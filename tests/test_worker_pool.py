@@ -0,0 +1,207 @@
+import io
+import os
+import threading
+import unittest
+import zipfile
+from collections.abc import Iterator
+from contextvars import ContextVar
+from unittest.mock import patch
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.archive import stream_zip
+from app.main import app
+from app.worker_pool import (
+    WorkerPool,
+    pool_busy_workers,
+    pool_queue_depth,
+    pool_utilisation,
+)
+
+client = TestClient(app)
+
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+def current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+def current_pid() -> int:
+    return os.getpid()
+
+
+class TestWorkerPool(unittest.IsolatedAsyncioTestCase):
+    async def test_run_inline_when_not_started(self):
+        pool = WorkerPool("test", "thread", 2, 0)
+        self.assertFalse(pool.is_running())
+        self.assertEqual(await pool.run(10, current_thread_name), current_thread_name())
+
+    async def test_run_inline_below_threshold(self):
+        pool = WorkerPool("test", "thread", 2, 100)
+        pool.start()
+        try:
+            self.assertFalse(pool.should_offload(99))
+            self.assertEqual(
+                await pool.run(99, current_thread_name), current_thread_name()
+            )
+        finally:
+            pool.shutdown()
+
+    async def test_run_in_thread_at_threshold(self):
+        pool = WorkerPool("test", "thread", 2, 100)
+        pool.start()
+        try:
+            self.assertTrue(pool.should_offload(100))
+            name = await pool.run(100, current_thread_name)
+            self.assertTrue(name.startswith("convert-worker"))
+        finally:
+            pool.shutdown()
+
+    async def test_run_in_process(self):
+        pool = WorkerPool("test", "process", 1, 0)
+        pool.start()
+        try:
+            self.assertNotEqual(await pool.run(1, current_pid), os.getpid())
+        finally:
+            pool.shutdown()
+
+    async def test_local_task_runs_in_thread_when_kind_is_process(self):
+        pool = WorkerPool("test", "process", 1, 0)
+        pool.start()
+        try:
+            name = await pool.run(1, current_thread_name, local=True)
+            self.assertTrue(name.startswith("convert-worker"))
+        finally:
+            pool.shutdown()
+
+    async def test_none_kind_always_runs_inline(self):
+        pool = WorkerPool("test", "none", 1, 0)
+        pool.start()
+        self.assertFalse(pool.is_running())
+        self.assertEqual(await pool.run(1, current_thread_name), current_thread_name())
+
+    async def test_exception_is_raised_to_caller(self):
+        def fail():
+            raise ValueError("Given diagram is not Class Diagram")
+
+        pool = WorkerPool("test", "thread", 1, 0)
+        pool.start()
+        try:
+            with self.assertRaises(ValueError):
+                await pool.run(1, fail)
+        finally:
+            pool.shutdown()
+
+    async def test_metrics_back_to_idle_after_run(self):
+        pool = WorkerPool("test", "thread", 2, 0)
+        pool.start()
+        try:
+            await pool.run(1, current_thread_name)
+        finally:
+            pool.shutdown()
+
+        for gauge in (pool_queue_depth, pool_busy_workers, pool_utilisation):
+            self.assertEqual(
+                gauge.labels(pool="test", executor="thread")._value.get(), 0
+            )
+
+    async def test_thread_sees_caller_context(self):
+        pool = WorkerPool("test", "thread", 1, 0)
+        pool.start()
+        token = request_id.set("request")
+        try:
+            self.assertEqual(await pool.run(1, request_id.get), "request")
+        finally:
+            request_id.reset(token)
+            pool.shutdown()
+
+    async def test_metrics_are_labelled_by_pool(self):
+        shared = WorkerPool("shared-test", "thread", 1, 0)
+        slow = WorkerPool("slow-test", "thread", 1, 0)
+        shared.start()
+        slow.start()
+
+        def get_busy_workers() -> tuple[float, float]:
+            return tuple(
+                pool_busy_workers.labels(pool=pool, executor="thread")._value.get()
+                for pool in ("shared-test", "slow-test")
+            )
+
+        try:
+            self.assertEqual(await slow.run(1, get_busy_workers), (0, 1))
+        finally:
+            shared.shutdown()
+            slow.shutdown()
+
+    def test_invalid_kind(self):
+        with self.assertRaises(ValueError):
+            WorkerPool("test", "fork", 1, 0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            WorkerPool("test", "thread", 0, 0)
+
+
+class TestConvertWithWorkerPool(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(os.path.dirname(__file__), "test_input.txt")) as f:
+            content = f.read().strip()
+        self.payload = {
+            "filename": ["test"],
+            "content": [[content]],
+            "project_name": "test",
+        }
+        self.expected = client.post("/convert", json=self.payload)
+
+    def assert_same_project(self, response: httpx.Response):
+        self.assertEqual(response.status_code, 200)
+        with (
+            zipfile.ZipFile(io.BytesIO(response.content)) as result_zip,
+            zipfile.ZipFile(io.BytesIO(self.expected.content)) as expected_zip,
+        ):
+            self.assertCountEqual(result_zip.namelist(), expected_zip.namelist())
+            self.assertEqual(
+                result_zip.read("main/models.py"), expected_zip.read("main/models.py")
+            )
+
+    def convert_with_pool(self, kind: str, stream: bool = False) -> httpx.Response:
+        pool = WorkerPool("test", kind, 1, 0)
+        pool.start()
+        try:
+            with (
+                patch("app.main.worker_pool", pool),
+                patch("app.main.STREAM_RESPONSE", stream),
+            ):
+                return client.post("/convert", json=self.payload)
+        finally:
+            pool.shutdown()
+
+    def test_convert_in_thread_pool(self):
+        self.assert_same_project(self.convert_with_pool("thread"))
+
+    def test_convert_in_process_pool(self):
+        self.assert_same_project(self.convert_with_pool("process"))
+
+    def test_stream_in_process_pool(self):
+        self.assert_same_project(self.convert_with_pool("process", stream=True))
+
+    def test_first_streamed_chunk_rendered_in_pool(self):
+        threads = []
+
+        def record_stream_zip(*args: object, **kwargs: object) -> Iterator[bytes]:
+            threads.append(current_thread_name())
+            yield from stream_zip(*args, **kwargs)
+
+        with patch("app.main.stream_zip", record_stream_zip):
+            response = self.convert_with_pool("thread", stream=True)
+
+        self.assert_same_project(response)
+        self.assertTrue(threads[0].startswith("convert-worker"), threads)
+
+    def test_parse_error_in_process_pool(self):
+        self.payload["content"] = [['{"diagram": "SequenceDiagram"}']]
+        response = self.convert_with_pool("process")
+        self.assertEqual(response.status_code, 422)